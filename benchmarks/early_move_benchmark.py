@@ -0,0 +1,71 @@
+"""
+How much earlier does EarlyMovePredictor commit than waiting for the first
+frame where VectorBasedClassifier returns the clean pattern?
+
+    python -m benchmarks.early_move_benchmark --trials 200 --fps 30
+"""
+import argparse
+
+import numpy as np
+
+from benchmarks.synthetic_hands import shoot_sequence
+from src.core.domain import Move
+from src.ml.early_move_predictor import EarlyMovePredictor
+from src.ml.gesture_classifier import VectorBasedClassifier
+
+
+def _first_clean_pattern(classifier, times, frames, target):
+    for t, landmarks in zip(times, frames):
+        if classifier.determine_move("Right", landmarks) == target:
+            return t
+    return None
+
+
+def _early_commit(predictor, times, frames):
+    predictor.reset()
+    for t, landmarks in zip(times, frames):
+        predictor.update(landmarks, t)
+        move = predictor.committed_move()
+        if move is not None:
+            return t, move
+    return None, None
+
+
+def _summary(gains):
+    gains = np.array(gains) if gains else np.zeros(1)
+    return f"{gains.mean():6.1f} ms (p5 {np.percentile(gains, 5):6.1f}, p95 {np.percentile(gains, 95):6.1f})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--fps", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    classifier = VectorBasedClassifier()
+    predictor = EarlyMovePredictor(classifier)
+
+    for target in (Move.PAPER, Move.SCISSORS):
+        gains, correct, missed = [], 0, 0
+        for _ in range(args.trials):
+            times, frames, _ = shoot_sequence(target, fps=args.fps, rng=rng)
+            clean_time = _first_clean_pattern(classifier, times, frames, target)
+            early_time, early_move = _early_commit(predictor, times, frames)
+
+            if clean_time is None or early_time is None:
+                missed += 1
+                continue
+            correct += early_move == target
+            gains.append((clean_time - early_time) * 1000)
+
+        played = args.trials - missed
+        print(
+            f"{target.name:<9} at {args.fps:g} fps: earlier by {_summary(gains)}, "
+            f"correct {correct}/{played}, no commit {missed}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Load test of the leaderboard HTTP service: many clients (phones) fetch the
+page at once, as after a QR code is shown at an event. Half of the clients
+revalidate with the ETag they got, like a browser refreshing.
+
+    python -m benchmarks.leaderboard_load_test --clients 500 --requests 20
+    python -m benchmarks.leaderboard_load_test --url http://192.168.0.10:8080/
+
+Without --url a local instance is started in-process on a temporary
+leaderboard with --scores random scores. The in-process run also measures
+how late a 20 Hz loop on another thread wakes up, standing in for the game
+loop sharing the process.
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from src.core.leaderboard import Leaderboard
+from src.web.leaderboard_server import LeaderboardServer
+
+
+async def _client(host, port, path, requests, revalidate, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    etag = None
+    try:
+        for _ in range(requests):
+            headers = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+            if revalidate and etag:
+                headers += f"If-None-Match: {etag}\r\n"
+            start = time.perf_counter()
+            writer.write((headers + "\r\n").encode("latin-1"))
+            await writer.drain()
+
+            head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+            status = int(head[0].split(" ")[1])
+            fields = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in head[1:] if line)}
+            await reader.readexactly(int(fields.get("content-length", 0)))
+
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+            etag = fields.get("etag", etag)
+    finally:
+        writer.close()
+
+
+async def _run(host, port, path, clients, requests):
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, path, requests, i % 2 == 0, latencies, statuses) for i in range(clients)
+    ))
+    return np.array(latencies), statuses, time.perf_counter() - start
+
+
+def _game_loop_lateness(stop, lateness, period=0.05):
+    deadline = time.perf_counter() + period
+    while not stop.is_set():
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+        lateness.append(time.perf_counter() - deadline)
+        deadline += period
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="server to test instead of a local instance")
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--scores", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    server = leaderboard = None
+    if args.url is None:
+        directory = tempfile.mkdtemp()
+        leaderboard = Leaderboard(Path(directory) / "leaderboard.sqlite")
+        rng = random.Random(0)
+        futures = [leaderboard.submit(f"player{i}", rng.randint(0, 10), rng.randint(0, 10)) for i in range(args.scores)]
+        futures[-1].result()
+        server = LeaderboardServer(leaderboard, host="127.0.0.1", port=0)
+        server.start_in_thread()
+        while server.port == 0:
+            time.sleep(0.01)
+        host, port, path = "127.0.0.1", server.port, "/"
+    else:
+        url = urlsplit(args.url)
+        host, port, path = url.hostname, url.port or 80, url.path or "/"
+
+    stop, lateness = threading.Event(), []
+    game_loop = threading.Thread(target=_game_loop_lateness, args=(stop, lateness), daemon=True)
+    game_loop.start()
+    try:
+        latencies, statuses, elapsed = asyncio.run(_run(host, port, path, args.clients, args.requests))
+    finally:
+        stop.set()
+        game_loop.join()
+        if server is not None:
+            server.stop()
+            leaderboard.close()
+
+    print(f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f} s, "
+          f"{len(latencies) / elapsed:,.0f} requests/s")
+    print(f"status counts: {dict(sorted(statuses.items()))}")
+    print(f"latency ms: p50 {np.percentile(latencies, 50) * 1e3:.1f}  p95 {np.percentile(latencies, 95) * 1e3:.1f}"
+          f"  p99 {np.percentile(latencies, 99) * 1e3:.1f}  max {latencies.max() * 1e3:.1f}")
+    lateness = np.array(lateness)
+    print(f"20 Hz loop wake-up lateness ms: p50 {np.percentile(lateness, 50) * 1e3:.2f}"
+          f"  p99 {np.percentile(lateness, 99) * 1e3:.2f}  max {lateness.max() * 1e3:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measured per-call cost of every registered plugin next to the cost it
+declares, so a config.json selection can be checked against the frame budget.
+Plugins which cannot be created here (missing model file, no mediapipe) are
+reported and skipped.
+
+    python -m benchmarks.plugin_benchmark --calls 2000
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.strategy_benchmark import run_session
+from benchmarks.synthetic_hands import MOVE_CURLS, make_hand
+from src.util.plugins import STRATEGIES, CLASSIFIERS, FILTERS, DETECTORS
+
+_SAMPLE_IMAGE = Path(__file__).resolve().parents[1] / "sample" / "example.jpg"
+
+
+def _hands(calls, seed=0):
+    rng = np.random.default_rng(seed)
+    curls = list(MOVE_CURLS.values())
+    return [make_hand(curls[i % len(curls)], noise=0.01, rng=rng) for i in range(calls)]
+
+
+def _time_calls(function, arguments):
+    """:return: median time of one call in milliseconds"""
+    timings = np.empty(len(arguments))
+    for i, argument in enumerate(arguments):
+        start = time.perf_counter()
+        function(argument)
+        timings[i] = (time.perf_counter() - start) * 1e3
+    return float(np.median(timings))
+
+
+def time_strategy(plugin, calls):
+    return float(np.median(run_session(plugin.create(rng=0), calls))) / 1e3
+
+
+def time_classifier(plugin, calls):
+    classifier = plugin.create()
+    return _time_calls(lambda landmarks: classifier.determine_move("Right", landmarks), _hands(calls))
+
+
+def time_filter(plugin, calls):
+    landmark_filter = plugin.create()
+    hands = [(hand, i / 30) for i, hand in enumerate(_hands(calls))]
+    return _time_calls(lambda frame: landmark_filter.smoothen("Right", *frame), hands)
+
+
+def time_detector(plugin, calls):
+    import cv2
+
+    frame = cv2.imread(str(_SAMPLE_IMAGE))
+    if frame is None:
+        raise FileNotFoundError(_SAMPLE_IMAGE)
+    with plugin.create() as detector:
+        # the detector runs on every frame, a few hundred are plenty
+        return _time_calls(detector.detect, [frame] * min(calls, 200))
+
+
+BENCHMARKS = (
+    (STRATEGIES, time_strategy),
+    (CLASSIFIERS, time_classifier),
+    (FILTERS, time_filter),
+    (DETECTORS, time_detector),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    for registry, benchmark in BENCHMARKS:
+        print(f"{registry.kind} (default '{registry.default}')")
+        for plugin in registry:
+            try:
+                measured = benchmark(plugin, args.calls)
+            except Exception as e:
+                print(f"  {plugin.name:24} skipped: {type(e).__name__}: {e}")
+                continue
+            ratio = measured / plugin.expected_cost_ms
+            print(f"  {plugin.name:24} {measured:9.4f} ms  expected {plugin.expected_cost_ms:9.4f} ms  ({ratio:5.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
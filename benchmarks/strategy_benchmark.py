@@ -0,0 +1,65 @@
+"""
+Per-round cost of a strategy over a long session: select_move (which also
+consumes the previous round) is timed for every round and reported per
+block of rounds, it should stay flat.
+
+    python -m benchmarks.strategy_benchmark --rounds 10000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from src.core.domain import Move, RoundRecord, evaluate_round
+from src.core.match_history import MatchHistory
+from src.core.strategies import MarkovStrategy, ResearchBasedStrategy, IocaineStrategy
+
+STRATEGIES = {
+    "research": ResearchBasedStrategy,
+    "markov": MarkovStrategy,
+    "iocaine": IocaineStrategy,
+}
+
+
+def run_session(strategy, rounds, seed=0):
+    """:return: select_move time of every round in microseconds"""
+    player = random.Random(seed)
+    match_history = MatchHistory()
+    timings = np.empty(rounds)
+
+    for round_number in range(rounds):
+        start = time.perf_counter()
+        computer_move = strategy.select_move(match_history)
+        timings[round_number] = (time.perf_counter() - start) * 1e6
+
+        # a player with a favourite move
+        player_move = player.choices(tuple(Move), (0.5, 0.3, 0.2))[0]
+        match_history.append(RoundRecord(
+            round_number=round_number,
+            player_move=player_move,
+            computer_move=computer_move,
+            outcome=evaluate_round(player_move, computer_move),
+        ))
+
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=10_000)
+    parser.add_argument("--blocks", type=int, default=5)
+    parser.add_argument("--strategy", choices=STRATEGIES, action="append")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for name in args.strategy or STRATEGIES:
+        timings = run_session(STRATEGIES[name](rng=args.seed), args.rounds, args.seed)
+        blocks = np.array_split(timings, args.blocks)
+        print(f"{name}: median select_move time [us] per block of {len(blocks[0])} rounds")
+        print("  " + "  ".join(f"{np.median(block):7.2f}" for block in blocks))
+        print(f"  p95 {np.percentile(timings, 95):.2f} us, max {timings.max():.2f} us")
+
+
+if __name__ == "__main__":
+    main()
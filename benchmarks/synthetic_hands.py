@@ -0,0 +1,73 @@
+"""
+Synthetic hand landmarks for benchmarks, in the mediapipe layout
+(21 points, normalized image coordinates, y grows downwards).
+"""
+import numpy as np
+
+from src.core.domain import Move
+
+# curl of index, middle, ring and pinky finger, 0 - straight, 1 - fist
+MOVE_CURLS = {
+    Move.ROCK: np.array([1.0, 1.0, 1.0, 1.0]),
+    Move.PAPER: np.array([0.0, 0.0, 0.0, 0.0]),
+    Move.SCISSORS: np.array([0.0, 0.0, 1.0, 1.0]),
+}
+
+_WRIST = np.array([0.5, 0.8, 0.0])
+_FINGER_BASE_X = np.array([-0.045, -0.015, 0.015, 0.045])
+_SEGMENTS = np.array([0.055, 0.035, 0.025])         # MCP->PIP->DIP->TIP
+_JOINT_BEND = np.array([0.5, 2.2, 3.3])             # segment angle at full curl
+
+
+def make_hand(curls, wrist=_WRIST, noise=0.0, rng=None):
+    """
+    :param curls: four finger curls in range [0, 1]
+    :return: array of shape (21, 3)
+    """
+    points = np.zeros((21, 3))
+    points[0] = wrist
+
+    # thumb sticks out sideways, it is not used by the vector classifier
+    for i, offset in enumerate(([-0.06, -0.04], [-0.09, -0.07], [-0.11, -0.09], [-0.12, -0.11]), start=1):
+        points[i] = wrist + [offset[0], offset[1], 0.0]
+
+    for finger, (base_x, curl) in enumerate(zip(_FINGER_BASE_X, curls)):
+        mcp_id = 5 + 4 * finger
+        point = wrist + [base_x, -0.15, 0.0]
+        points[mcp_id] = point
+        for segment, (length, bend) in enumerate(zip(_SEGMENTS, _JOINT_BEND)):
+            angle = curl * bend
+            point = point + length * np.array([0.0, -np.cos(angle), -np.sin(angle)])
+            points[mcp_id + segment + 1] = point
+
+    if noise:
+        rng = rng or np.random.default_rng()
+        points = points + rng.normal(0.0, noise, points.shape)
+
+    return points
+
+
+def shoot_sequence(target: Move, fps=20.0, pump_time=0.4, transition_time=0.25, settle_time=0.5,
+                   noise=0.002, rng=None):
+    """
+    Frames of the last pump with a fist followed by the hand opening into
+    ``target``.
+
+    :return: (times, landmarks of shape (T, 21, 3), time the transition starts)
+    """
+    rng = rng or np.random.default_rng()
+    n_frames = int((pump_time + transition_time + settle_time) * fps)
+    times = np.arange(n_frames) / fps
+
+    start_curls = MOVE_CURLS[Move.ROCK]
+    target_curls = MOVE_CURLS[target]
+    frames = []
+    for t in times:
+        phase = np.clip((t - pump_time) / transition_time, 0.0, 1.0)
+        # smoothstep, fingers accelerate and then slow down
+        phase = phase * phase * (3 - 2 * phase)
+        curls = start_curls + (target_curls - start_curls) * phase
+        wrist = _WRIST + [0.0, 0.05 * np.sin(np.pi * min(t / pump_time, 1.0)), 0.0]
+        frames.append(make_hand(curls, wrist, noise, rng))
+
+    return times, np.stack(frames), pump_time
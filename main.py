@@ -1,15 +1,21 @@
+import functools
 import logging
 import sys
 import threading
 
 from PySide6.QtWidgets import QApplication
 
+from src.core.event_journal import EventJournal
 from src.core.game_controller import GameController
-from src.ml.gesture_classifier import VectorBasedClassifier
-from src.core.strategies import ResearchBasedStrategy
+from src.core.leaderboard import Leaderboard
+from src.core.population_model import PopulationStore
+from src.core.quality_controller import QualityController
+from src.ml.early_move_predictor import EarlyMovePredictor
 from src.ui.utils.bridge import UiBridge
 from src.ui.window import Window
 from src.util.config import Config
+from src.util.plugins import STRATEGIES, CLASSIFIERS, FILTERS, DETECTORS
+from src.web.leaderboard_server import LeaderboardServer
 
 
 def main():
@@ -25,20 +31,38 @@ def main():
     app = QApplication(sys.argv)
     bridge = UiBridge()
 
-    classifier = VectorBasedClassifier()
-    computer_strategy = ResearchBasedStrategy()
+    population_store = PopulationStore()
+    leaderboard = Leaderboard()
+    if config.leaderboard_port is not None:
+        LeaderboardServer(leaderboard, port=config.leaderboard_port).start_in_thread()
+
+    classifier = CLASSIFIERS.create(config.classifier)
+    computer_strategy = STRATEGIES.create(config.strategy, population_prior=population_store.load_prior())
+    detector_factory = functools.partial(
+        DETECTORS.create,
+        config.detector,
+        landmark_filter=FILTERS.create(config.landmark_filter),
+    )
 
     controller = GameController(
         classifier=classifier,
         computer_strategy=computer_strategy,
         bridge=bridge,
         detection_camera_index=config.detection_camera,
-        showing_camera_index=config.showing_camera
+        showing_camera_index=config.showing_camera,
+        population_store=population_store,
+        journal=EventJournal(),
+        detector_factory=detector_factory,
+        config=config,
+        capture=config.capture,
+        quality_controller=QualityController() if config.adaptive_quality else None,
+        early_move_predictor=EarlyMovePredictor(classifier) if config.early_move_prediction else None
     )
     game_window = Window(
         controller,
         show_ai_analytics=config.show_ai_analysis,
-        mirror_camera=config.mirror_camera
+        mirror_camera=config.mirror_camera,
+        leaderboard=leaderboard
     )
 
     bridge.event_frame_changed.connect(
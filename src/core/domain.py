@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # types
 class Move(Enum):
@@ -31,16 +31,124 @@ class SyncStatus:
 
 
 # records
+@dataclass(frozen=True, slots=True)
+class FrameStamp:
+    """Identifies a camera frame through the pipeline, ``captured_at`` is ``time.perf_counter()`` at capture."""
+    frame_id: int
+    captured_at: float
+
+
 @dataclass(frozen=True, slots=True)
 class RoundRecord:
     round_number: int
     player_move: Move
     computer_move: Move
     outcome: Outcome
+    # seconds from the capture of the deciding frame to the result on screen, None until measured;
+    # a measurement, not part of what happened in the round
+    latency: float | None = field(default=None, compare=False)
 
 class GameSummary:
+    """
+    Statistics of one game from the player's side, updated in constant
+    time per round so the end screen never has to scan the match history.
+    """
+
     def __init__(self):
-        pass
+        self.rounds = 0
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+
+        self.win_streak = 0
+        self.loss_streak = 0
+        self.longest_win_streak = 0
+        self.longest_loss_streak = 0
+
+        self.player_move_counts = {move: 0 for move in Move}
+        self.computer_move_counts = {move: 0 for move in Move}
+        self.wins_by_move = {move: 0 for move in Move}
+
+        # rounds the strategy guessed the player's move in, and guessed it right
+        self.predicted_rounds = 0
+        self.prediction_hits = 0
+
+        self.decision_time_total = 0.0
+        self.timed_rounds = 0
+
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.measured_rounds = 0
+
+    def record_round(self, round_record: RoundRecord, decision_time: float | None = None,
+                     predicted_move: Move | None = None):
+        """
+        :param decision_time: seconds from the start of the round to the player's committed move
+        :param predicted_move: the player's move the strategy predicted when choosing its move, if it did
+        """
+        self.rounds += 1
+        self.player_move_counts[round_record.player_move] += 1
+        self.computer_move_counts[round_record.computer_move] += 1
+
+        if round_record.outcome == Outcome.PLAYER:
+            self.wins += 1
+            self.wins_by_move[round_record.player_move] += 1
+            self.win_streak += 1
+            self.loss_streak = 0
+        elif round_record.outcome == Outcome.COMPUTER:
+            self.losses += 1
+            self.loss_streak += 1
+            self.win_streak = 0
+        else:
+            self.draws += 1
+            self.win_streak = 0
+            self.loss_streak = 0
+        self.longest_win_streak = max(self.longest_win_streak, self.win_streak)
+        self.longest_loss_streak = max(self.longest_loss_streak, self.loss_streak)
+
+        if predicted_move is not None:
+            self.predicted_rounds += 1
+            if predicted_move == round_record.player_move:
+                self.prediction_hits += 1
+
+        if decision_time is not None:
+            self.decision_time_total += decision_time
+            self.timed_rounds += 1
+
+    def record_latency(self, latency: float):
+        """:param latency: seconds from the capture of a round's deciding frame to its result on screen"""
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.measured_rounds += 1
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.rounds if self.rounds else 0.0
+
+    @property
+    def prediction_hit_rate(self) -> float | None:
+        """Share of the predicted rounds the prediction was right in, None if the strategy never predicted."""
+        return self.prediction_hits / self.predicted_rounds if self.predicted_rounds else None
+
+    @property
+    def average_decision_time(self) -> float | None:
+        return self.decision_time_total / self.timed_rounds if self.timed_rounds else None
+
+    @property
+    def average_latency(self) -> float | None:
+        return self.latency_total / self.measured_rounds if self.measured_rounds else None
+
+    def win_rate_by_move(self) -> dict[Move, float | None]:
+        """Share of rounds won with each player's move, None for moves never played."""
+        return {
+            move: self.wins_by_move[move] / count if count else None
+            for move, count in self.player_move_counts.items()
+        }
+
+    def favourite_move(self) -> Move | None:
+        if not self.rounds:
+            return None
+        return max(self.player_move_counts, key=self.player_move_counts.get)
 
 
 # rules
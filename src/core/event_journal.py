@@ -0,0 +1,240 @@
+"""
+Append-only journal of the game's events.
+
+Every event is one fixed-size binary record (``EVENT_DTYPE``, 16 bytes), so
+months of logs are read back with ``np.fromfile`` and analysed as NumPy
+columns without parsing. Frames are never journaled.
+
+    events = read_journal(DEFAULT_JOURNAL_DIR)
+    rounds = events[events["kind"] == EventKind.ROUND_RESULT]
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from enum import IntEnum
+from pathlib import Path
+
+import numpy as np
+
+from src.core.domain import ThumbDirection, SyncPhase
+from src.core.events import EventGameCountdown, EventGameRoundActive, EventGameRoundResult, EventScoreChanged, \
+    EventGestureProgress, EventGameOver, EventGameIdle
+from src.core.game_state import GameState
+from src.core.match_history import MOVE_INDEX, OUTCOME_INDEX
+
+# Resolve the journal relative to the project root, next to config.json
+DEFAULT_JOURNAL_DIR = Path(__file__).resolve().parents[2] / "journal"
+
+_MAGIC = b"RPSJRNL1"
+_GESTURE_MILESTONES = 4     # progress is journaled at every quarter
+_THUMB_DIRECTIONS = list(ThumbDirection)
+_SYNC_PHASES = list(SyncPhase)
+_logger = logging.getLogger(__name__)
+
+
+class EventKind(IntEnum):
+    GAME_STARTED = 1
+    COUNTDOWN = 2           # a: count, b: SyncPhase index + 1 (0 without sync), c: shake cycles
+    ROUND_ACTIVE = 3
+    ROUND_RESULT = 4        # a: player move, b: computer move, c: outcome, x: round number
+    SCORE_CHANGED = 5       # x: player score, y: computer score
+    GESTURE_PROGRESS = 6    # a: ThumbDirection index, b: milestone in quarters
+    GAME_OVER = 7           # x: player score, y: computer score
+    GAME_IDLE = 8
+
+
+EVENT_DTYPE = np.dtype([
+    ("time", "<f8"),    # unix time in seconds
+    ("kind", "u1"),
+    ("a", "u1"),
+    ("b", "u1"),
+    ("c", "u1"),
+    ("x", "<u2"),
+    ("y", "<u2"),
+])
+
+
+class EventJournal:
+    """
+    Writes events to ``directory`` on a background thread.
+
+    ``record`` only encodes the event and puts it on a queue. The writer
+    appends batches of ``batch_size`` events (or whatever arrived within
+    ``flush_interval`` seconds) with one fsync per batch, and starts a new
+    file when the current one would exceed ``max_file_bytes``.
+    """
+
+    def __init__(
+            self,
+            directory=DEFAULT_JOURNAL_DIR,
+            batch_size: int = 256,
+            flush_interval: float = 1.0,
+            max_file_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.directory = Path(directory)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._last_countdown = None
+        self._last_milestone = None
+        self._last_progress = None
+        self._encoders = {
+            GameState: self._encode_game_started,
+            EventGameCountdown: self._encode_countdown,
+            EventGameRoundActive: self._encode_round_active,
+            EventGameRoundResult: self._encode_round_result,
+            EventScoreChanged: self._encode_score_changed,
+            EventGestureProgress: self._encode_gesture_progress,
+            EventGameOver: self._encode_game_over,
+            EventGameIdle: self._encode_game_idle,
+        }
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    def record(self, event, now: float | None = None):
+        """Journals a game event, events that are not journaled are ignored."""
+        encode = self._encoders.get(type(event))
+        row = encode(event) if encode is not None else None
+        if row is not None:
+            self._queue.put((time.time() if now is None else now, *row))
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+
+    # encoders return (kind, a, b, c, x, y), or None to skip the event
+
+    def _encode_game_started(self, state):
+        # event_game_started carries the new state
+        self._last_countdown = None
+        return EventKind.GAME_STARTED, 0, 0, 0, 0, 0
+
+    def _encode_countdown(self, event):
+        # emitted on every frame, only changes of the count are journaled
+        count = event.count_down_time or 0
+        if count == self._last_countdown:
+            return None
+        self._last_countdown = count
+        status = event.sync_status
+        if status is None:
+            return EventKind.COUNTDOWN, count, 0, 0, 0, 0
+        return EventKind.COUNTDOWN, count, _SYNC_PHASES.index(status.phase) + 1, min(status.cycles, 255), 0, 0
+
+    def _encode_round_active(self, event):
+        self._last_countdown = None
+        return EventKind.ROUND_ACTIVE, 0, 0, 0, 0, 0
+
+    def _encode_round_result(self, event):
+        round_record = event.round_record
+        return (
+            EventKind.ROUND_RESULT,
+            MOVE_INDEX[round_record.player_move],
+            MOVE_INDEX[round_record.computer_move],
+            OUTCOME_INDEX[round_record.outcome],
+            _u2(round_record.round_number), 0,
+        )
+
+    def _encode_score_changed(self, event):
+        return EventKind.SCORE_CHANGED, 0, 0, 0, _u2(event.player_score), _u2(event.computer_score)
+
+    def _encode_gesture_progress(self, event):
+        # progress only grows during a hold, starting over means the thumb was lowered in between
+        if self._last_progress is not None and event.progress <= self._last_progress:
+            self._last_milestone = None
+        self._last_progress = event.progress
+        milestone = int(event.progress * _GESTURE_MILESTONES)
+        direction = _THUMB_DIRECTIONS.index(event.thumb_direction)
+        if (direction, milestone) == self._last_milestone:
+            return None
+        self._last_milestone = (direction, milestone)
+        return EventKind.GESTURE_PROGRESS, direction, milestone, 0, 0, 0
+
+    def _encode_game_over(self, event):
+        self._last_milestone = None
+        self._last_progress = None
+        return EventKind.GAME_OVER, 0, 0, 0, _u2(event.player_score), _u2(event.computer_score)
+
+    def _encode_game_idle(self, event):
+        return EventKind.GAME_IDLE, 0, 0, 0, 0, 0
+
+    def _write_loop(self):
+        file, batch = None, []
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    item = ()
+
+                if item:
+                    batch.append(item)
+                if item is None or len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                    if batch:
+                        file = self._write_batch(file, batch)
+                        batch = []
+                    deadline = time.monotonic() + self.flush_interval
+                if item is None:
+                    return
+        finally:
+            if file is not None:
+                file.close()
+
+    def _write_batch(self, file, batch):
+        try:
+            records = np.array(batch, dtype=EVENT_DTYPE)
+        except (TypeError, ValueError, OverflowError):
+            # a bad row must not take the writer thread down, the rest of the journal keeps going
+            _logger.exception("Skipping a batch of %d journal events that don't fit the record", len(batch))
+            return file
+        try:
+            if file is None or file.tell() + records.nbytes > self.max_file_bytes:
+                if file is not None:
+                    file.close()
+                file = self._open_file()
+            file.write(records.tobytes())
+            file.flush()
+            os.fsync(file.fileno())
+        except OSError:
+            _logger.exception("Could not write %d journal events", len(records))
+        return file
+
+    def _open_file(self):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        for index in range(1000):
+            path = self.directory / f"events-{stamp}-{index:03d}.bin"
+            try:
+                file = open(path, "xb")
+            except FileExistsError:
+                continue
+            file.write(_MAGIC)
+            return file
+        raise FileExistsError(f"No free journal file name in {self.directory} for {stamp}")
+
+
+def _u2(value) -> int:
+    """Clamps to the range of the ``<u2`` columns."""
+    return min(max(int(value), 0), 0xFFFF)
+
+
+def journal_files(directory=DEFAULT_JOURNAL_DIR) -> list[Path]:
+    """Journal files in the order they were written."""
+    return sorted(Path(directory).glob("events-*.bin"))
+
+
+def read_journal(directory=DEFAULT_JOURNAL_DIR) -> np.ndarray:
+    """All events of all journal files as one structured array of ``EVENT_DTYPE``."""
+    parts = []
+    for path in journal_files(directory):
+        with open(path, "rb") as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                _logger.warning("Skipping %s, not a journal file", path)
+                continue
+            parts.append(np.fromfile(file, dtype=EVENT_DTYPE))
+    return np.concatenate(parts) if parts else np.empty(0, dtype=EVENT_DTYPE)
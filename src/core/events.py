@@ -0,0 +1,66 @@
+"""
+Events the game emits to the UI.
+
+Plain data, so the engine and the journal run without the UI's
+dependencies; UiBridge (src.ui.utils.bridge) carries them as Qt signals.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.domain import RoundRecord, GameSummary, ThumbDirection, SyncStatus, FrameStamp
+from src.core.match_history import MatchSnapshot
+
+
+class EventWithFrame:
+    def __init__(self, frame: np.ndarray):
+        self.frame = frame
+
+
+class EventFrameChanged(EventWithFrame):
+    def __init__(self, frame: np.ndarray, detected_hands: dict[str, list[tuple[float, float, float]]]):
+        super().__init__(frame)
+        self.detected_hands = detected_hands
+
+
+@dataclass
+class EventScoreChanged:
+    player_score: int
+    computer_score: int
+
+
+@dataclass
+class EventGameIdle:
+    pass
+
+
+@dataclass
+class EventGameCountdown:
+    count_down_time: int
+    sync_status: SyncStatus | None = None
+
+
+@dataclass
+class EventGameRoundActive:
+    pass
+
+
+class EventGameRoundResult(EventWithFrame):
+    def __init__(self, round_record: RoundRecord, frame: np.ndarray, stamp: FrameStamp | None = None):
+        super().__init__(frame)
+        self.round_record = round_record
+        self.stamp = stamp
+
+
+@dataclass
+class EventGameOver:
+    player_score: int
+    computer_score: int
+    match_history: MatchSnapshot | None = None
+    summary: GameSummary | None = None
+
+
+@dataclass
+class EventGestureProgress:
+    progress: float
+    thumb_direction: ThumbDirection
@@ -1,15 +1,82 @@
+import functools
+import logging
+import queue
+import threading
 import time
+from dataclasses import dataclass
+
 import cv2
 
+from src.ml.early_move_predictor import EarlyMovePredictor
 from src.ml.hand_detector import HandDetector
+from src.core.game_engine import PLAYING_STATES
 from src.core.game_logic import GameLogic
+from src.core.domain import FrameStamp
+from src.core.power_manager import PowerManager
+from src.core.quality_controller import QualityController
 
 from src.core.game_state import GameState
 from src.ui.utils.bridge import UiBridge, EventFrameChanged
+from src.util.camera_config import CaptureRequest, open_camera
+from src.util.plugins import CLASSIFIERS, DETECTORS, FILTERS, STRATEGIES
 
 FPS_TIME = 0.05  #50 ms <- 20Hz
 
+_logger = logging.getLogger(__name__)
+
+
+# commands, submitted from any thread and applied on the controller thread
+
+@dataclass(frozen=True, slots=True)
+class Reset:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Pause:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeConfig:
+    """Applies the cameras and plugins of a Config, only what differs from the running ones is rebuilt."""
+    config: object
+
+
+@dataclass(frozen=True, slots=True)
+class SwapStrategy:
+    strategy: object
+
+
+@dataclass(frozen=True, slots=True)
+class ReportLatency:
+    frame_id: int
+    latency: float
+
+
+@dataclass(frozen=True, slots=True)
+class Stop:
+    pass
+
+
 class GameController:
+    """
+    Runs the camera loop on its own thread. Other threads never touch the
+    game directly, they ``submit`` commands that the loop applies at the
+    start of its next tick, so the game is only ever changed by one thread.
+
+    Left alone on the end screen or idle, the loop suspends the detector and
+    the showing camera (see PowerManager). Idle, it probes for motion to wake
+    up; paused on the end screen, only a Reset or Resume wakes it. With a
+    QualityController the detection quality and frame rate follow the
+    measured per-frame latency.
+    """
+
     def __init__(self,
                  classifier,
                  computer_strategy,
@@ -18,53 +85,122 @@ class GameController:
                  detection_camera_index: int = 0,
                  showing_camera_index: int = None,
                  cap: cv2.VideoCapture = None,
+                 population_store=None,
+                 journal=None,
+                 detector_factory=None,
+                 config=None,
+                 power_manager: PowerManager = None,
+                 quality_controller: QualityController = None,
+                 capture: CaptureRequest = None,
+                 early_move_predictor: EarlyMovePredictor = None,
                  ):
+        """
+        :param config: Config the components were built from, ``change_config`` rebuilds what differs from it
+        :param early_move_predictor: commits the player's move while the hand is still forming it, None waits for the vote
+        """
 
         self._ui_bridge = bridge
         self.logic = GameLogic(
             self._ui_bridge,
             classifier=classifier,
-            computer_strategy=computer_strategy
+            computer_strategy=computer_strategy,
+            early_move_predictor=early_move_predictor,
+            population_store=population_store,
+            journal=journal
         )
-        self._cap = cap or cv2.VideoCapture(detection_camera_index)
-        self._showing_cap = cv2.VideoCapture(showing_camera_index) if showing_camera_index is not None else None
+        self._detection_camera_index = detection_camera_index
+        self._showing_camera_index = showing_camera_index
+        self._capture = capture or CaptureRequest()
+        self._cap = cap or open_camera(detection_camera_index, self._capture)
+        self._showing_cap = open_camera(showing_camera_index, self._capture) if showing_camera_index is not None else None
         self._stop_detection = False
+        self._running = False
+        self._frame_id = 0
+        self._config = config
+        # SimpleQueue.put never blocks, the UI thread only appends
+        self._commands = queue.SimpleQueue()
+        self._stopped = threading.Event()
+        # the detector is created on the controller thread, in start()
+        self._detector_factory = detector_factory or self._default_detector
+        self._detector = None
+        self._power = power_manager or PowerManager()
+        self._quality = quality_controller
+        self._frame_time = FPS_TIME
+        self._handlers = {
+            Reset: self._on_reset,
+            Pause: self._on_pause,
+            Resume: self._on_resume,
+            Stop: self._on_stop,
+            ReportLatency: self._on_report_latency,
+            SwapStrategy: self._on_swap_strategy,
+            ChangeConfig: self._on_change_config,
+        }
+
+    @staticmethod
+    def _default_detector():
+        return HandDetector(
+            user_perspective=True,
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5
+        )
 
     def start(self):
-        with HandDetector(
-                user_perspective=True,
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.7,
-                min_tracking_confidence=0.5
-        ) as detector:
-            while self._cap.isOpened():
+        self._running = True
+        self._detector = self._create_detector()
+        try:
+            while self._running and self._cap.isOpened():
                 t_start = time.perf_counter()
+                self._apply_commands()
+                if not self._running:
+                    break
+
+                if self._power.suspended:
+                    self._probe()
+                    continue
+                if self._power.should_suspend(self.logic.state, self._stop_detection, t_start):
+                    self._suspend(t_start)
+                    continue
                 if self._stop_detection:
-                    time.sleep(FPS_TIME)
+                    time.sleep(self._frame_time)
                     continue
 
                 reft, frame = self._cap.read()
                 if not reft:
                     break
+                self._frame_id += 1
+                stamp = FrameStamp(self._frame_id, time.perf_counter())
 
-                detected_hands = detector.detect(frame)
-                self.update(detected_hands, frame)
+                detected_hands = self._detector.detect(frame, stamp.captured_at)
+                self.update(detected_hands, frame, stamp)
+                if detected_hands or self.logic.state in PLAYING_STATES:
+                    self._power.on_activity(t_start)
 
                 reft2, showing_frame = self._showing_cap.read() if self._showing_cap is not None else (False, None)
                 if reft2 and showing_frame is not None:
-                    detected_hands = detector.detect(showing_frame)
+                    detected_hands = self._detector.detect(showing_frame)
                     frame = showing_frame
 
                 self._ui_bridge.event_frame_changed.emit(
                     EventFrameChanged(frame, detected_hands)
                 )
-                
+
+                if self._quality is not None:
+                    t_done = time.perf_counter()
+                    level = self._quality.record(t_done - stamp.captured_at, t_done)
+                    if level is not None:
+                        self._apply_quality(level)
+
                 #ensure next capture loop starts at desired FPS
                 t_elapsed = time.perf_counter() - t_start
-                sleep_time = FPS_TIME - t_elapsed
+                sleep_time = self._frame_time - t_elapsed
                 if sleep_time > 0:
                     time.sleep(sleep_time)
+        finally:
+            if self._detector is not None:
+                self._detector.close()
+            self._stopped.set()
 
     @property
     def player_score(self):
@@ -82,10 +218,41 @@ class GameController:
     def state(self):
         return self.logic.state
 
+    @property
+    def power_manager(self) -> PowerManager:
+        return self._power
+
+    def submit(self, command):
+        """Queues a command for the controller thread, never waits."""
+        self._commands.put(command)
+
     def reset(self):
-        self.logic.reset()
+        self.submit(Reset())
+
+    def pause(self):
+        self.submit(Pause())
+
+    def resume(self):
+        self.submit(Resume())
+
+    def set_stop_detection(self, stop: bool):
+        self.submit(Pause() if stop else Resume())
+
+    def change_config(self, config):
+        self.submit(ChangeConfig(config))
+
+    def swap_strategy(self, strategy):
+        self.submit(SwapStrategy(strategy))
+
+    def report_result_latency(self, frame_id: int, latency: float):
+        """
+        Called by the UI once a round result is on screen, ``latency`` is the
+        time from the capture of the frame ``frame_id`` in seconds.
+        """
+        self.submit(ReportLatency(frame_id, latency))
 
-    def update(self, detected_hands: dict[str, list[tuple[float, float, float]]], frame: cv2.typing.MatLike) -> None:
+    def update(self, detected_hands: dict[str, list[tuple[float, float, float]]], frame: cv2.typing.MatLike,
+               stamp: FrameStamp = None) -> None:
         """Right hand takes priority over left hand for gesture detection."""
         primary_hand = None
         if "Right" in detected_hands:
@@ -93,16 +260,147 @@ class GameController:
         elif "Left" in detected_hands:
             primary_hand = ("Left", detected_hands["Left"])
 
-        self.logic.update(primary_hand, frame)
+        self.logic.update(primary_hand, frame, stamp)
 
     def is_game_over(self):
         return self.logic.state == GameState.GAME_OVER
 
-    def set_stop_detection(self, stop: bool):
-        self._stop_detection = stop
-
     def close(self):
+        if self._running:
+            # the loop owns the game until it has stopped
+            self.submit(Stop())
+            if not self._stopped.wait(timeout=2.0):
+                _logger.warning("Controller loop did not stop in time")
+        self.logic.close()
         if self._cap.isOpened():
             self._cap.release()
         if self._showing_cap is not None and self._showing_cap.isOpened():
             self._showing_cap.release()
+
+    def _create_detector(self):
+        detector = self._detector_factory()
+        if self._quality is not None:
+            self._detector = detector
+            self._apply_quality(self._quality.level)
+        return detector
+
+    def _apply_quality(self, level):
+        self._frame_time = 1.0 / level.fps
+        self._detector.reconfigure(
+            model_complexity=level.model_complexity,
+            max_num_hands=level.max_num_hands,
+            detection_scale=level.detection_scale,
+        )
+
+    def _suspend(self, now):
+        self._power.suspend(now)
+        # closing the graph frees the model and its buffers
+        self._detector.close()
+        self._detector = None
+        if self._showing_cap is not None:
+            self._showing_cap.release()
+            self._showing_cap = None
+
+    def _probe(self):
+        # paused (the end screen), only a Reset or Resume command wakes the detector
+        if not self._stop_detection:
+            # the detection camera stays open, only a frame every probe interval is decoded
+            reft, frame = self._cap.read()
+            if reft:
+                self._ui_bridge.event_frame_changed.emit(EventFrameChanged(frame, {}))
+                if self._power.motion(frame):
+                    self._wake()
+                    return
+        time.sleep(self._power.probe_interval)
+
+    def _wake(self):
+        if not self._power.suspended:
+            return
+        self._power.waking(time.perf_counter())
+        self._detector = self._create_detector()
+        if self._showing_camera_index is not None:
+            # the mode is cached, measuring would only lengthen the warm-up
+            self._showing_cap = open_camera(self._showing_camera_index, self._capture, measure=False)
+        # the graph initialises on its first frame, warmed up means that is done
+        reft, frame = self._cap.read()
+        if reft:
+            self._detector.detect(frame)
+        self._power.warmed_up(time.perf_counter())
+
+    def _apply_commands(self):
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            handler = self._handlers.get(type(command))
+            if handler is None:
+                _logger.warning("Ignoring unknown command %r", command)
+                continue
+            handler(command)
+
+    # command handlers, run on the controller thread
+
+    def _on_reset(self, command):
+        self._wake()
+        self._power.on_activity(time.perf_counter())
+        self.logic.reset()
+
+    def _on_pause(self, command):
+        self._power.on_activity(time.perf_counter())
+        self._stop_detection = True
+
+    def _on_resume(self, command):
+        self._wake()
+        self._power.on_activity(time.perf_counter())
+        self._stop_detection = False
+
+    def _on_stop(self, command):
+        self._running = False
+
+    def _on_report_latency(self, command):
+        self.logic.record_result_latency(command.frame_id, command.latency)
+
+    def _on_swap_strategy(self, command):
+        self.logic.set_strategy(command.strategy)
+
+    def _on_change_config(self, command):
+        config, previous = command.config, self._config
+        self._config = config
+        self._wake()
+
+        capture_changed = config.capture != self._capture
+        self._capture = config.capture
+        if capture_changed or config.detection_camera != self._detection_camera_index:
+            self._cap.release()
+            self._cap = open_camera(config.detection_camera, self._capture)
+            self._detection_camera_index = config.detection_camera
+        if capture_changed or config.showing_camera != self._showing_camera_index:
+            if self._showing_cap is not None:
+                self._showing_cap.release()
+            self._showing_cap = (
+                open_camera(config.showing_camera, self._capture) if config.showing_camera is not None else None
+            )
+            self._showing_camera_index = config.showing_camera
+
+        # without the config the controller was built from, every plugin is rebuilt
+        if previous is None or (config.detector, config.landmark_filter) != (previous.detector, previous.landmark_filter):
+            self._detector_factory = functools.partial(
+                DETECTORS.create, config.detector, landmark_filter=FILTERS.create(config.landmark_filter)
+            )
+            if self._detector is not None:
+                self._detector.close()
+                self._detector = self._create_detector()
+        classifier_changed = previous is None or config.classifier != previous.classifier
+        if classifier_changed:
+            self.logic.set_classifier(CLASSIFIERS.create(config.classifier))
+        if previous is None or config.strategy != previous.strategy:
+            store = self.logic.population_store
+            prior = store.load_prior() if store is not None else None
+            self.logic.set_strategy(STRATEGIES.create(config.strategy, population_prior=prior))
+        # the predictor reads the joint angles of the configured classifier, it follows a classifier change
+        if classifier_changed or config.early_move_prediction != previous.early_move_prediction:
+            self.logic.set_early_move_predictor(
+                EarlyMovePredictor(self.logic.classifier) if config.early_move_prediction else None
+            )
+        _logger.info("Applied config change")
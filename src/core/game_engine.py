@@ -0,0 +1,430 @@
+import logging
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable
+
+from src.core.game_state import GameState, GameConfig
+from src.core.match_history import MatchHistory
+from src.core.domain import RoundRecord, GameSummary, evaluate_round, Outcome, ThumbDirection, SyncPhase
+from src.core.move_voting import MoveVoter
+from src.core.shake_sync import ShakeTracker
+from src.core.strategy_runner import StrategyRunner
+from src.core.events import EventGameOver, EventGameCountdown, EventGameRoundActive, \
+    EventGameRoundResult, EventScoreChanged, EventGestureProgress
+
+_logger = logging.getLogger(__name__)
+
+PLAYING_STATES = frozenset({GameState.COUNTDOWN, GameState.ROUND_ACTIVE, GameState.ROUND_RESULT})
+
+
+class Gesture(IntEnum):
+    START = 0
+    QUIT = 1
+    RESTART = 2
+
+
+@dataclass(frozen=True, slots=True)
+class GestureRule:
+    """A gesture is held by showing ``direction`` in one of ``states`` for GESTURE_HOLD_DURATION."""
+    direction: ThumbDirection
+    states: frozenset
+    show_progress: bool
+
+
+GESTURES = {
+    Gesture.START: GestureRule(ThumbDirection.UP, frozenset({GameState.IDLE}), show_progress=True),
+    Gesture.QUIT: GestureRule(ThumbDirection.DOWN, PLAYING_STATES, show_progress=True),
+    Gesture.RESTART: GestureRule(ThumbDirection.UP, frozenset({GameState.GAME_OVER}), show_progress=False),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Transition:
+    sources: frozenset
+    target: GameState
+    trigger: Callable   # (engine, session, now) -> bool
+    action: Callable | None = None
+
+
+class GameSession:
+    """
+    Everything that changes during one player's games. The rules live in
+    GameEngine, so one engine can advance any number of sessions.
+
+    :param events: UiBridge receiving the session's events, None for headless sessions
+    :param journal: EventJournal recording the session's events
+    """
+    __slots__ = (
+        "events", "journal", "strategy_runner", "move_voter", "shake_tracker", "early_move_predictor",
+        "state", "state_entered_at", "round_started_at", "gesture_started",
+        "player_score", "computer_score", "round_number", "match_history", "summary",
+        "sync_status", "committed_move", "committed_stamp", "frame_stamp", "result_stamp",
+        "current_player_move", "current_computer_move", "current_outcome",
+    )
+
+    def __init__(
+            self,
+            computer_strategy,
+            events=None,
+            *,
+            journal=None,
+            move_voter: MoveVoter = None,
+            shake_tracker: ShakeTracker = None,
+            early_move_predictor=None,
+            background_strategy: bool = True,
+    ):
+        self.events = events
+        self.journal = journal
+        self.strategy_runner = StrategyRunner(computer_strategy, background=background_strategy)
+        self.move_voter = move_voter or MoveVoter()
+        self.shake_tracker = shake_tracker or ShakeTracker()
+        self.early_move_predictor = early_move_predictor
+
+        self.reset()
+
+    def reset(self):
+        self.state = GameState.IDLE
+        self.state_entered_at = None
+        self.round_started_at = None
+        self.gesture_started = [None] * len(Gesture)
+
+        self.player_score = 0
+        self.computer_score = 0
+        self.round_number = 0
+        self.match_history = MatchHistory()
+        self.summary = GameSummary()
+
+        self.sync_status = None
+        self.committed_move = None
+        self.committed_stamp = None
+        self.frame_stamp = None
+        self.result_stamp = None
+        self.current_player_move = None
+        self.current_computer_move = None
+        self.current_outcome = None
+
+        self.move_voter.reset()
+        self.shake_tracker.reset()
+        if self.early_move_predictor is not None:
+            self.early_move_predictor.reset()
+
+    def emit(self, signal_name, event):
+        if self.events is not None:
+            getattr(self.events, signal_name).emit(event)
+        if self.journal is not None:
+            self.journal.record(event)
+
+    def set_strategy(self, computer_strategy):
+        self.strategy_runner.set_strategy(computer_strategy)
+        if self.state != GameState.IDLE:
+            self.strategy_runner.prepare(self.match_history)
+
+    def record_result_latency(self, frame_id: int, latency: float):
+        """
+        Stores the gesture-to-result latency the UI measured for the last
+        round result, ``frame_id`` is the one of the event's FrameStamp.
+        """
+        if self.result_stamp is None or self.result_stamp.frame_id != frame_id:
+            # the game was reset meanwhile
+            return
+        self.result_stamp = None
+        self.match_history.set_latency(-1, latency)
+        self.summary.record_latency(latency)
+        _logger.debug("Round %d gesture-to-result latency: %.1f ms", self.round_number, latency * 1000)
+
+    def close(self):
+        self.strategy_runner.close()
+
+
+class GameEngine:
+    """
+    The game's state machine: TRANSITIONS says which trigger moves a session
+    from a state to the next one, ENTRY_ACTIONS and EXIT_ACTIONS run on
+    every change of state, UPDATES run on every frame while in a state.
+
+    Per frame a session's gesture timers are updated first, then the
+    state's update, then the first transition whose trigger fires.
+    """
+
+    def __init__(self, classifier, population_store=None):
+        self.classifier = classifier
+        self.population_store = population_store
+        self._transitions = {
+            state: [t for t in self.TRANSITIONS if state in t.sources] for state in GameState
+        }
+
+    def step(self, session: GameSession, primary_hand, frame, now, stamp=None):
+        """
+        Advances the session by one frame, ``primary_hand`` is ``(side, landmarks)`` or None.
+
+        :param stamp: FrameStamp of the frame, carried to the round result to measure its latency
+        """
+        session.frame_stamp = stamp
+        side, landmarks = primary_hand if primary_hand else (None, None)
+        direction = self.classifier.determine_hand_direction(landmarks) if landmarks else None
+
+        self._update_gestures(session, direction, now)
+
+        update = self.UPDATES.get(session.state)
+        if update is not None:
+            update(self, session, side, landmarks, now)
+
+        for transition in self._transitions[session.state]:
+            if transition.trigger(self, session, now):
+                self._change_state(session, transition, frame, now)
+                return
+
+        stay = self.STAY_ACTIONS.get(session.state)
+        if stay is not None:
+            stay(self, session, now)
+
+    def step_many(self, sessions, primary_hands, now, frames=None, stamps=None):
+        """Advances many independent sessions by one frame each, ``stamps`` are their frames' FrameStamps."""
+        frames = frames if frames is not None else [None] * len(sessions)
+        stamps = stamps if stamps is not None else [None] * len(sessions)
+        for session, primary_hand, frame, stamp in zip(sessions, primary_hands, frames, stamps):
+            self.step(session, primary_hand, frame, now, stamp)
+
+    @staticmethod
+    def countdown_value(session: GameSession, now):
+        if session.state != GameState.COUNTDOWN or session.state_entered_at is None:
+            return None
+
+        remaining = GameConfig.COUNTDOWN_DURATION - (now - session.state_entered_at)
+
+        if remaining > 2.0:
+            return 3
+        elif remaining > 1.0:
+            return 2
+        elif remaining > 0.0:
+            return 1
+        return None
+
+    @staticmethod
+    def gesture_progress(session: GameSession, gesture: Gesture, now):
+        started = session.gesture_started[gesture]
+        if started is None:
+            return 0.0
+        return min((now - started) / GameConfig.GESTURE_HOLD_DURATION, 1.0)
+
+    def _change_state(self, session, transition, frame, now):
+        exit_action = self.EXIT_ACTIONS.get(session.state)
+        if exit_action is not None:
+            exit_action(self, session, now)
+
+        session.state = transition.target
+        session.state_entered_at = now
+        # a gesture still valid in the new state keeps being held, the quit hold carries over rounds
+        for gesture, rule in GESTURES.items():
+            if session.state not in rule.states:
+                session.gesture_started[gesture] = None
+        if transition.action is not None:
+            transition.action(self, session, now)
+
+        entry_action = self.ENTRY_ACTIONS.get(session.state)
+        if entry_action is not None:
+            entry_action(self, session, frame, now)
+
+    def _update_gestures(self, session, direction, now):
+        for gesture, rule in GESTURES.items():
+            if session.state not in rule.states or direction != rule.direction:
+                session.gesture_started[gesture] = None
+                continue
+
+            if session.gesture_started[gesture] is None:
+                session.gesture_started[gesture] = now
+            if rule.show_progress and not self._gesture_held(session, gesture, now):
+                session.emit("event_gesture_progress", EventGestureProgress(
+                    progress=self.gesture_progress(session, gesture, now),
+                    thumb_direction=direction
+                ))
+
+    @staticmethod
+    def _gesture_held(session, gesture, now):
+        started = session.gesture_started[gesture]
+        return started is not None and now - started >= GameConfig.GESTURE_HOLD_DURATION
+
+    # triggers
+
+    def _start_held(self, session, now):
+        return self._gesture_held(session, Gesture.START, now)
+
+    def _quit_held(self, session, now):
+        return self._gesture_held(session, Gesture.QUIT, now)
+
+    def _restart_held(self, session, now):
+        return self._gesture_held(session, Gesture.RESTART, now)
+
+    def _player_shoots(self, session, now):
+        # the shake lets the round start as soon as the player "shoots",
+        # the countdown is the upper bound for players who don't shake
+        if now - session.state_entered_at >= GameConfig.COUNTDOWN_DURATION:
+            return True
+        if session.sync_status is None:
+            return False
+        if session.sync_status.phase == SyncPhase.LOCKING:
+            return True
+        return (
+            session.early_move_predictor is not None and
+            session.sync_status.cycles >= session.shake_tracker.shake_cycles and
+            session.early_move_predictor.committed_move() is not None
+        )
+
+    def _move_committed(self, session, now):
+        return session.committed_move is not None
+
+    def _result_shown(self, session, now):
+        return now - session.state_entered_at >= GameConfig.RESULT_DURATION
+
+    # updates, run on every frame in their state
+
+    def _update_countdown(self, session, side, landmarks, now):
+        # holding the quit gesture pauses the countdown
+        if session.gesture_started[Gesture.QUIT] is not None:
+            session.state_entered_at = now
+
+        session.sync_status = session.shake_tracker.update(landmarks, now)
+
+        # the gesture starts forming during the last shake cycle
+        predictor = session.early_move_predictor
+        if predictor is not None and landmarks and session.sync_status.cycles >= session.shake_tracker.shake_cycles - 1:
+            predictor.update(landmarks, now)
+
+    def _update_round_active(self, session, side, landmarks, now):
+        if landmarks:
+            move, confidence = self.classifier.determine_move_with_confidence(side, landmarks)
+        else:
+            move, confidence = None, 0.0
+
+        player_move = session.move_voter.add(move, confidence, now, session.frame_stamp)
+        stamp = session.move_voter.committed_stamp
+
+        predictor = session.early_move_predictor
+        if predictor is not None and landmarks:
+            predictor.update(landmarks, now)
+            predicted_move = predictor.committed_move()
+            # the prediction only settles the vote early, it can't overrule the classifier's frames
+            if player_move is None and predicted_move is not None and predicted_move == session.move_voter.leader:
+                # committed on the frame the predictor became confident in
+                player_move, stamp = predicted_move, session.frame_stamp
+
+        session.committed_move = player_move
+        session.committed_stamp = stamp if player_move is not None else None
+
+    def _emit_countdown(self, session, now):
+        session.emit("event_game_countdown", EventGameCountdown(
+            count_down_time=self.countdown_value(session, now),
+            sync_status=session.sync_status
+        ))
+
+    # transition, entry and exit actions
+
+    def _start_game(self, session, now):
+        session.strategy_runner.prepare(session.match_history)
+        session.emit("event_game_started", session.state)
+
+    def _enter_idle(self, session, frame, now):
+        session.reset()
+
+    def _enter_countdown(self, session, frame, now):
+        session.sync_status = None
+        session.shake_tracker.reset()
+        if session.early_move_predictor is not None:
+            session.early_move_predictor.reset()
+        self._emit_countdown(session, now)
+
+    def _enter_round_active(self, session, frame, now):
+        session.round_number += 1
+        session.round_started_at = now
+        session.committed_move = None
+        session.committed_stamp = None
+        session.move_voter.reset(now)
+        session.emit("event_game_round_active", EventGameRoundActive())
+
+    def _enter_round_result(self, session, frame, now):
+        player_move = session.committed_move
+        computer_move = session.strategy_runner.select_move(session.match_history)
+        outcome = evaluate_round(player_move, computer_move)
+
+        session.current_player_move = player_move
+        session.current_computer_move = computer_move
+        session.current_outcome = outcome
+
+        if outcome == Outcome.PLAYER:
+            session.player_score += 1
+        elif outcome == Outcome.COMPUTER:
+            session.computer_score += 1
+
+        round_record = RoundRecord(
+            round_number=session.round_number,
+            player_move=player_move,
+            computer_move=computer_move,
+            outcome=outcome
+        )
+        history = session.match_history
+        if self.population_store is not None:
+            previous_player_move = history[-1].player_move if history else None
+            self.population_store.record_round(round_record, previous_player_move)
+        history.append(round_record, now)
+        session.summary.record_round(
+            round_record, now - session.round_started_at, session.strategy_runner.predicted_player_move
+        )
+        session.strategy_runner.prepare(history)
+
+        # latency is measured from the first frame that voted for the player's move
+        session.result_stamp = session.committed_stamp
+        session.emit("event_game_round_result", EventGameRoundResult(
+            round_record=round_record,
+            frame=frame,
+            stamp=session.committed_stamp
+        ))
+        session.emit("event_score_changed", EventScoreChanged(
+            computer_score=session.computer_score,
+            player_score=session.player_score
+        ))
+
+    def _exit_round_result(self, session, now):
+        session.current_player_move = None
+        session.current_computer_move = None
+        session.current_outcome = None
+
+    def _enter_game_over(self, session, frame, now):
+        summary = session.summary
+        if summary.measured_rounds:
+            _logger.info(
+                "Gesture-to-result latency over %d rounds: %.1f ms average, %.1f ms max",
+                summary.measured_rounds, summary.average_latency * 1000, summary.latency_max * 1000
+            )
+        session.emit("event_game_over", EventGameOver(
+            player_score=session.player_score,
+            computer_score=session.computer_score,
+            match_history=session.match_history.snapshot(),
+            summary=session.summary,
+        ))
+
+    # the quit transition is listed first, it wins over everything else in a frame
+    TRANSITIONS = (
+        Transition(PLAYING_STATES, GameState.GAME_OVER, _quit_held),
+        Transition(frozenset({GameState.IDLE}), GameState.COUNTDOWN, _start_held, action=_start_game),
+        Transition(frozenset({GameState.COUNTDOWN}), GameState.ROUND_ACTIVE, _player_shoots),
+        Transition(frozenset({GameState.ROUND_ACTIVE}), GameState.ROUND_RESULT, _move_committed),
+        Transition(frozenset({GameState.ROUND_RESULT}), GameState.COUNTDOWN, _result_shown),
+        Transition(frozenset({GameState.GAME_OVER}), GameState.IDLE, _restart_held),
+    )
+    UPDATES = {
+        GameState.COUNTDOWN: _update_countdown,
+        GameState.ROUND_ACTIVE: _update_round_active,
+    }
+    STAY_ACTIONS = {
+        GameState.COUNTDOWN: _emit_countdown,
+    }
+    ENTRY_ACTIONS = {
+        GameState.IDLE: _enter_idle,
+        GameState.COUNTDOWN: _enter_countdown,
+        GameState.ROUND_ACTIVE: _enter_round_active,
+        GameState.ROUND_RESULT: _enter_round_result,
+        GameState.GAME_OVER: _enter_game_over,
+    }
+    EXIT_ACTIONS = {
+        GameState.ROUND_RESULT: _exit_round_result,
+    }
@@ -14,4 +14,20 @@ class GameState(Enum):
 class GameConfig:
     GESTURE_HOLD_DURATION = 2.0    
     COUNTDOWN_DURATION = 3.0      
-    RESULT_DURATION = 3.0    
\ No newline at end of file
+    RESULT_DURATION = 3.0    
+
+    MOVE_VOTING_WINDOW = 5      # frames
+    MOVE_VOTING_MARGIN = 1.5    # summed confidence
+    MOVE_VOTING_TIMEOUT = 1.0
+
+    SHAKE_CYCLES = 3
+    SHAKE_MIN_AMPLITUDE = 0.04  # normalized image height
+    SHAKE_IDLE_TIMEOUT = 1.5
+
+    IDLE_SUSPEND_TIMEOUT = 120.0        # no hand seen while idle
+    GAME_OVER_SUSPEND_TIMEOUT = 30.0    # end screen or detection paused
+    WAKE_PROBE_INTERVAL = 0.5
+    WAKE_MOTION_THRESHOLD = 0.03        # mean change of the coarse image, 0..1
+    WARM_UP_BUDGET = 2.0
+
+    FRAME_LATENCY_BUDGET = 0.040        # p95 from capture to the end of the game update
@@ -0,0 +1,202 @@
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+# Resolve the store relative to the project root, next to config.json
+DEFAULT_LEADERBOARD_PATH = Path(__file__).resolve().parents[2] / "leaderboard.sqlite"
+
+MAX_NICKNAME_LENGTH = 24
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS scores ("
+    " id INTEGER PRIMARY KEY,"
+    " nickname TEXT NOT NULL,"
+    " score INTEGER NOT NULL,"
+    " wins INTEGER NOT NULL,"
+    " losses INTEGER NOT NULL,"
+    " played_at REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, played_at)",
+    "CREATE INDEX IF NOT EXISTS scores_by_date ON scores (played_at, score DESC)",
+)
+# the statements never change, so sqlite3 prepares each of them once per connection
+_INSERT = "INSERT INTO scores (nickname, score, wins, losses, played_at) VALUES (?, ?, ?, ?, ?)"
+_TOP = "SELECT nickname, score, wins, losses, played_at FROM scores ORDER BY score DESC, played_at LIMIT ?"
+_TOP_SINCE = (
+    "SELECT nickname, score, wins, losses, played_at FROM scores WHERE played_at >= ?"
+    " ORDER BY score DESC, played_at LIMIT ?"
+)
+_RANK = "SELECT COUNT(*) FROM scores WHERE score > ?"
+_RANK_SINCE = "SELECT COUNT(*) FROM scores WHERE played_at >= ? AND score > ?"
+_BEST_OF = (
+    "SELECT nickname, score, wins, losses, played_at FROM scores WHERE nickname = ?"
+    " ORDER BY score DESC, played_at LIMIT 1"
+)
+
+_logger = logging.getLogger(__name__)
+
+
+def game_score(wins: int, losses: int) -> int:
+    return wins * 10 - losses * 5
+
+
+@dataclass(frozen=True, slots=True)
+class LeaderboardEntry:
+    nickname: str
+    score: int
+    wins: int
+    losses: int
+    played_at: float
+    rank: int | None = None
+
+
+class Leaderboard:
+    """
+    SQLite leaderboard.
+
+    ``submit`` never touches the disk: scores are queued and inserted by a
+    background thread, which then reloads the cached top page, so the end
+    screen reads ``top_page`` without waiting on the database.
+    """
+
+    def __init__(self, path=DEFAULT_LEADERBOARD_PATH, page_size: int = 10):
+        self.path = Path(path)
+        self.page_size = page_size
+
+        self._local = threading.local()
+        connection = self._connection()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+        self._top_page = self._query_top(connection, page_size)
+        self._top_page_lock = threading.Lock()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="leaderboard-writer", daemon=True)
+        self._writer.start()
+
+    def submit(self, nickname: str, wins: int, losses: int, played_at: float | None = None) -> Future:
+        """
+        Queues a score. The future resolves to the stored LeaderboardEntry
+        with its rank once it is written.
+        """
+        nickname = nickname.strip()[:MAX_NICKNAME_LENGTH]
+        if not nickname:
+            raise ValueError("nickname must not be empty")
+
+        entry = LeaderboardEntry(
+            nickname=nickname,
+            score=game_score(wins, losses),
+            wins=wins,
+            losses=losses,
+            played_at=time.time() if played_at is None else played_at,
+        )
+        future = Future()
+        self._queue.put((entry, future))
+        return future
+
+    def top_page(self) -> list[LeaderboardEntry]:
+        """The best ``page_size`` scores from memory, never waits on the database."""
+        with self._top_page_lock:
+            return self._top_page
+
+    def top(self, n: int, since: float | None = None) -> list[LeaderboardEntry]:
+        """The best ``n`` scores, of games played since the unix time ``since`` if given."""
+        if since is None and n <= self.page_size:
+            return self.top_page()[:n]
+        return self._query_top(self._connection(), n, since)
+
+    def rank(self, score: int, since: float | None = None) -> int:
+        """Rank a score would have, ties share the best rank."""
+        if since is None:
+            (better,), = self._connection().execute(_RANK, (score,))
+        else:
+            (better,), = self._connection().execute(_RANK_SINCE, (since, score))
+        return better + 1
+
+    def best_of(self, nickname: str) -> LeaderboardEntry | None:
+        """The best score of a player with their rank."""
+        row = self._connection().execute(_BEST_OF, (nickname,)).fetchone()
+        if row is None:
+            return None
+        entry = LeaderboardEntry(*row)
+        return replace(entry, rank=self.rank(entry.score))
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+        # the writer closed its connection, this is the one of the thread closing the leaderboard
+        self.close_connection()
+
+    def close_connection(self):
+        """Closes the calling thread's connection, e.g. before a reader thread ends."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _connection(self):
+        # sqlite3 connections can't be shared between threads, every thread gets its own
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def _query_top(self, connection, n, since=None):
+        if since is None:
+            rows = connection.execute(_TOP, (n,))
+        else:
+            rows = connection.execute(_TOP_SINCE, (since, n))
+        entries = []
+        for i, row in enumerate(rows):
+            entry = LeaderboardEntry(*row)
+            # equal scores share the rank of the first of them
+            rank = entries[-1].rank if entries and entries[-1].score == entry.score else i + 1
+            entries.append(replace(entry, rank=rank))
+        return entries
+
+    def _write_loop(self):
+        connection = self._connection()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                connection.close()
+                return
+
+            # everything queued meanwhile goes into the same transaction
+            batch = [item]
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                batch.append(item)
+
+            self._write(connection, batch)
+
+    def _write(self, connection, batch):
+        try:
+            with connection:
+                connection.executemany(_INSERT, [
+                    (entry.nickname, entry.score, entry.wins, entry.losses, entry.played_at)
+                    for entry, _ in batch
+                ])
+            top_page = self._query_top(connection, self.page_size)
+            with self._top_page_lock:
+                self._top_page = top_page
+            for entry, future in batch:
+                future.set_result(replace(entry, rank=self.rank(entry.score)))
+        except sqlite3.Error as e:
+            _logger.exception("Could not save %d leaderboard scores", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
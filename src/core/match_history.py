@@ -0,0 +1,232 @@
+import math
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.core.domain import Move, Outcome, RoundRecord, MOVE_LOSES
+
+MOVES = tuple(Move)
+MOVE_INDEX = {move: i for i, move in enumerate(MOVES)}
+OUTCOMES = tuple(Outcome)
+OUTCOME_INDEX = {outcome: i for i, outcome in enumerate(OUTCOMES)}
+
+_COLUMN_TYPES = {
+    "round_number": np.uint32,
+    "player_move": np.uint8,     # index into MOVES
+    "computer_move": np.uint8,   # index into MOVES
+    "outcome": np.uint8,         # index into OUTCOMES
+    "timestamp": np.uint32,      # milliseconds since start_time
+    "latency": np.float32,       # seconds, NaN until measured
+}
+
+
+class MoveShift:
+    """How the player's move changed compared to the previous round."""
+    STAY = 0
+    UPGRADE = 1    # to the move that beats the previous one
+    DOWNGRADE = 2  # to the move that loses to the previous one
+
+
+class RoundColumns(Sequence):
+    """
+    Rounds stored column-wise in NumPy arrays, read as a sequence of
+    RoundRecord. Records are created on access, the columns are available
+    as read-only views without copying.
+    """
+
+    def __init__(self, columns: dict, length: int, start_time: float | None):
+        self._columns = columns
+        self._length = length
+        self.start_time = start_time
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("round index out of range")
+        return self._record(index)
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self[:]!r})"
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only view of a column (see ``_COLUMN_TYPES``), one entry per round."""
+        view = self._columns[name][:self._length]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def player_moves(self) -> np.ndarray:
+        return self.column("player_move")
+
+    @property
+    def computer_moves(self) -> np.ndarray:
+        return self.column("computer_move")
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        return self.column("outcome")
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.column("timestamp")
+
+    @property
+    def latencies(self) -> np.ndarray:
+        return self.column("latency")
+
+    def _record(self, i):
+        columns = self._columns
+        latency = columns["latency"].item(i)
+        return RoundRecord(
+            round_number=columns["round_number"].item(i),
+            player_move=MOVES[columns["player_move"].item(i)],
+            computer_move=MOVES[columns["computer_move"].item(i)],
+            outcome=OUTCOMES[columns["outcome"].item(i)],
+            latency=None if math.isnan(latency) else latency,
+        )
+
+
+class MatchSnapshot(RoundColumns):
+    """
+    Immutable view of the rounds of a MatchHistory at one point in time.
+
+    It shares the history's arrays: the history only writes past the
+    snapshot's length and reallocates instead of resizing in place, so the
+    snapshot can be handed to another thread without copying. The one
+    exception is the latency of a round, filled in once it is measured.
+    """
+
+
+class MatchHistory(RoundColumns):
+    """
+    Rounds of a match with statistics that are updated on append, so
+    strategies can query them in constant time however long the session is.
+
+    Moves are indexed in ``MOVES`` order in all count arrays.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, rounds=(), max_order: int = 3):
+        super().__init__(self._allocate(self.INITIAL_CAPACITY), 0, None)
+        self.max_order = max_order
+
+        self.player_move_counts = np.zeros(len(MOVES), dtype=np.int64)
+        self.computer_move_counts = np.zeros(len(MOVES), dtype=np.int64)
+        self.outcome_counts = {outcome: 0 for outcome in Outcome}
+        # transitions[previous player move, next player move]
+        self.transitions = np.zeros((len(MOVES), len(MOVES)), dtype=np.int64)
+        self._ngrams = [dict() for _ in range(max_order + 1)]
+        # shifts[previous outcome][MoveShift]
+        self._shifts = {outcome: np.zeros(3, dtype=np.int64) for outcome in Outcome}
+
+        self.player_move_streak = 0
+        self.outcome_streak = 0
+        self.longest_outcome_streaks = {outcome: 0 for outcome in Outcome}
+
+        for round_record in rounds:
+            self.append(round_record)
+
+    def append(self, round_record: RoundRecord, timestamp: float | None = None):
+        """:param timestamp: time of the round in seconds, on any monotonic clock"""
+        player = MOVE_INDEX[round_record.player_move]
+        previous = self[-1] if self._length else None
+
+        self.player_move_counts[player] += 1
+        self.computer_move_counts[MOVE_INDEX[round_record.computer_move]] += 1
+        self.outcome_counts[round_record.outcome] += 1
+
+        player_moves = self._columns["player_move"]
+        for order in range(1, min(self.max_order, self._length) + 1):
+            context = tuple(player_moves[self._length - order:self._length].tolist())
+            counts = self._ngrams[order].get(context)
+            if counts is None:
+                counts = self._ngrams[order][context] = np.zeros(len(MOVES), dtype=np.int64)
+            counts[player] += 1
+
+        if previous is None:
+            self.player_move_streak = 1
+            self.outcome_streak = 1
+        else:
+            self.transitions[MOVE_INDEX[previous.player_move], player] += 1
+            self._shifts[previous.outcome][self._shift(previous.player_move, round_record.player_move)] += 1
+
+            same_move = previous.player_move == round_record.player_move
+            self.player_move_streak = self.player_move_streak + 1 if same_move else 1
+            same_outcome = previous.outcome == round_record.outcome
+            self.outcome_streak = self.outcome_streak + 1 if same_outcome else 1
+
+        self.longest_outcome_streaks[round_record.outcome] = max(
+            self.longest_outcome_streaks[round_record.outcome], self.outcome_streak
+        )
+
+        self._write(round_record, player, timestamp)
+
+    def set_latency(self, index: int, latency: float):
+        """Stores the measured gesture-to-result latency of a round, in seconds."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("round index out of range")
+        self._columns["latency"][index] = latency
+
+    def snapshot(self) -> MatchSnapshot:
+        return MatchSnapshot(self._columns, self._length, self.start_time)
+
+    def ngram_counts(self, context) -> np.ndarray | None:
+        """
+        Counts of the player's next move after the given sequence of player
+        moves (oldest first), or None if the context was never seen.
+        """
+        key = tuple(MOVE_INDEX[move] for move in context)
+        if not 0 < len(key) <= self.max_order:
+            raise ValueError(f"context length must be between 1 and {self.max_order}")
+        return self._ngrams[len(key)].get(key)
+
+    def recent_player_moves(self, n: int) -> tuple[Move, ...]:
+        return tuple(MOVES[i] for i in self._columns["player_move"][max(0, self._length - n):self._length])
+
+    def shift_counts(self, previous_outcome: Outcome) -> np.ndarray:
+        """Counts of MoveShift of the player after rounds that ended with ``previous_outcome``."""
+        return self._shifts[previous_outcome]
+
+    def _write(self, round_record, player, timestamp):
+        i = self._length
+        if i == len(self._columns["round_number"]):
+            # never resized in place, snapshots keep reading the old arrays
+            columns = self._allocate(2 * i)
+            for name, column in self._columns.items():
+                columns[name][:i] = column
+            self._columns = columns
+
+        if timestamp is not None and self.start_time is None:
+            self.start_time = timestamp
+        # a clock stepping back must not wrap around (or overflow) the unsigned column
+        elapsed = 0 if timestamp is None or self.start_time is None else max(0.0, timestamp - self.start_time)
+
+        columns = self._columns
+        columns["round_number"][i] = round_record.round_number
+        columns["player_move"][i] = player
+        columns["computer_move"][i] = MOVE_INDEX[round_record.computer_move]
+        columns["outcome"][i] = OUTCOME_INDEX[round_record.outcome]
+        columns["timestamp"][i] = round(elapsed * 1000)
+        columns["latency"][i] = np.nan if round_record.latency is None else round_record.latency
+        self._length = i + 1
+
+    @staticmethod
+    def _allocate(capacity):
+        return {name: np.zeros(capacity, dtype=dtype) for name, dtype in _COLUMN_TYPES.items()}
+
+    @staticmethod
+    def _shift(previous: Move, current: Move) -> int:
+        if current == previous:
+            return MoveShift.STAY
+        if current == MOVE_LOSES[previous]:
+            return MoveShift.UPGRADE
+        return MoveShift.DOWNGRADE
@@ -0,0 +1,94 @@
+from collections import deque
+from enum import Enum, auto
+
+from src.core.domain import Move
+from src.core.game_state import GameConfig
+
+
+class VotingRule(Enum):
+    MAJORITY = auto()             # more than half of the window agrees
+    CONFIDENCE_WEIGHTED = auto()  # summed confidence exceeds half of the window
+    EARLY_STOP = auto()           # leader is ahead of the runner-up by the margin
+
+
+class MoveVoter:
+    """
+    Aggregates per-frame predictions of the player's move during ROUND_ACTIVE.
+
+    It keeps a ring buffer of the last ``window_size`` predictions and commits
+    to a move only when the decision rule is satisfied, so a single noisy
+    frame in the middle of the hand's transition can't decide the round.
+    After ``timeout`` seconds the current leader is committed anyway.
+
+    ``committed_stamp`` is the stamp of the oldest frame in the window that
+    voted for the committed move, the frame the player's gesture was first
+    seen in.
+    """
+
+    def __init__(
+            self,
+            window_size: int = GameConfig.MOVE_VOTING_WINDOW,
+            rule: VotingRule = VotingRule.EARLY_STOP,
+            early_stop_margin: float = GameConfig.MOVE_VOTING_MARGIN,
+            timeout: float = GameConfig.MOVE_VOTING_TIMEOUT,
+    ):
+        self.window_size = window_size
+        self.rule = rule
+        self.early_stop_margin = early_stop_margin
+        self.timeout = timeout
+
+        self._votes = deque(maxlen=window_size)
+        self._start_time = None
+        self.committed_stamp = None
+
+    def reset(self, current_time=None):
+        self._votes.clear()
+        self._start_time = current_time
+        self.committed_stamp = None
+
+    @property
+    def leader(self) -> Move | None:
+        """Move with the highest score in the window, None while nothing was recognised."""
+        scores = self._scores()
+        return max(scores, key=scores.get) if scores else None
+
+    def add(self, move: Move | None, confidence: float, current_time, stamp=None) -> Move | None:
+        """
+        Records the prediction for one frame.
+
+        :param move: predicted move or None if nothing was recognised
+        :param confidence: classifier confidence in range [0, 1]
+        :param current_time: frame time, used for the timeout
+        :param stamp: FrameStamp of the frame, see ``committed_stamp``
+        :return: committed move or None if it is too early to decide
+        """
+        if self._start_time is None:
+            self._start_time = current_time
+
+        self._votes.append((move, confidence if move is not None else 0.0, stamp))
+
+        scores = self._scores()
+        if not scores:
+            return None
+
+        ranking = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        leader, leader_score = ranking[0]
+        runner_up_score = ranking[1][1] if len(ranking) > 1 else 0.0
+
+        if self._is_decided(leader_score, runner_up_score) or current_time - self._start_time >= self.timeout:
+            self.committed_stamp = next(vote_stamp for vote, _, vote_stamp in self._votes if vote == leader)
+            return leader
+        return None
+
+    def _scores(self):
+        use_confidence = self.rule != VotingRule.MAJORITY
+        scores = {}
+        for move, confidence, _ in self._votes:
+            if move is not None:
+                scores[move] = scores.get(move, 0.0) + (confidence if use_confidence else 1.0)
+        return scores
+
+    def _is_decided(self, leader_score, runner_up_score):
+        if self.rule == VotingRule.EARLY_STOP:
+            return leader_score - runner_up_score >= self.early_stop_margin
+        return leader_score > self.window_size / 2
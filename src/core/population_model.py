@@ -0,0 +1,146 @@
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from src.core.domain import Move, RoundRecord
+from src.core.match_history import MOVES, MOVE_INDEX
+
+# Resolve the store relative to the project root, next to config.json
+DEFAULT_POPULATION_PATH = Path(__file__).resolve().parents[2] / "population.sqlite"
+
+_NO_PREVIOUS = -1
+_logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PopulationPrior:
+    """
+    What players usually do, aggregated over all past sessions: counts of
+    opening moves and of the player's move transitions (in MOVES order).
+    """
+    opening: np.ndarray = field(default_factory=lambda: np.zeros(len(MOVES)))
+    transitions: np.ndarray = field(default_factory=lambda: np.zeros((len(MOVES), len(MOVES))))
+
+    def player_move_distribution(self, match_history=None, strength: float = 10.0) -> np.ndarray | None:
+        """
+        Probabilities of the player's next move, or None if no player was
+        seen in this situation yet. The population's habits count as
+        ``strength`` pseudo-rounds, the current session's transitions are
+        added on top of them.
+        """
+        if not match_history:
+            population, session = self.opening, np.zeros(len(MOVES))
+        else:
+            previous = MOVE_INDEX[match_history[-1].player_move]
+            population = self.transitions[previous]
+            session_transitions = getattr(match_history, "transitions", None)
+            session = session_transitions[previous] if session_transitions is not None else np.zeros(len(MOVES))
+
+        if not population.any():
+            return None
+        return _blend(population, strength, session)
+
+
+def _blend(prior_counts, strength, session_counts):
+    # add-one smoothing keeps unseen moves possible
+    prior = (prior_counts + 1.0) / (prior_counts.sum() + len(prior_counts))
+    counts = strength * prior + session_counts
+    return counts / counts.sum()
+
+
+class PopulationStore:
+    """
+    SQLite store of the population statistics.
+
+    ``record_round`` never touches the disk: rounds are queued and a
+    background thread writes them in batches (every ``batch_size`` rounds
+    or ``flush_interval`` seconds, whichever comes first).
+    """
+
+    def __init__(self, path=DEFAULT_POPULATION_PATH, batch_size: int = 50, flush_interval: float = 5.0):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS move_counts ("
+                " previous INTEGER NOT NULL,"
+                " next INTEGER NOT NULL,"
+                " count INTEGER NOT NULL,"
+                " PRIMARY KEY (previous, next))"
+            )
+        connection.close()
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="population-writer", daemon=True)
+        self._writer.start()
+
+    def load_prior(self) -> PopulationPrior:
+        prior = PopulationPrior()
+        connection = self._connect()
+        try:
+            for previous, next_move, count in connection.execute("SELECT previous, next, count FROM move_counts"):
+                if previous == _NO_PREVIOUS:
+                    prior.opening[next_move] = count
+                else:
+                    prior.transitions[previous, next_move] = count
+        finally:
+            connection.close()
+        return prior
+
+    def record_round(self, round_record: RoundRecord, previous_player_move: Move | None):
+        previous = MOVE_INDEX[previous_player_move] if previous_player_move is not None else _NO_PREVIOUS
+        self._queue.put((previous, MOVE_INDEX[round_record.player_move]))
+
+    def close(self):
+        self._queue.put(None)
+        self._writer.join()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+    def _write_loop(self):
+        connection = self._connect()
+        pending, pending_rounds = {}, 0
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    item = ()
+
+                if item:
+                    pending[item] = pending.get(item, 0) + 1
+                    pending_rounds += 1
+                if item is None or pending_rounds >= self.batch_size or time.monotonic() >= deadline:
+                    self._flush(connection, pending)
+                    pending, pending_rounds = {}, 0
+                    deadline = time.monotonic() + self.flush_interval
+                if item is None:
+                    return
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _flush(connection, pending):
+        if not pending:
+            return
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO move_counts (previous, next, count) VALUES (?, ?, ?) "
+                    "ON CONFLICT (previous, next) DO UPDATE SET count = count + excluded.count",
+                    [(previous, next_move, count) for (previous, next_move), count in pending.items()],
+                )
+        except sqlite3.Error:
+            _logger.exception("Could not write population statistics")
@@ -0,0 +1,109 @@
+import logging
+from collections import deque
+from enum import Enum, auto
+
+import numpy as np
+
+from src.core.game_state import GameState, GameConfig
+
+_PROBE_STRIDE = 16   # the probe looks at every 16th pixel of every 16th row
+_logger = logging.getLogger(__name__)
+
+
+class PowerState(Enum):
+    ACTIVE = auto()
+    SUSPENDED = auto()
+
+
+class PowerManager:
+    """
+    Decides when the controller suspends its hardware and when it wakes up.
+
+    The controller reports activity (a hand in view, a game being played, a
+    command from the UI). Without activity for ``game_over_timeout`` on the
+    end screen or while detection is paused, or for ``idle_timeout`` while
+    idle, ``should_suspend`` says so: the controller then frees the hand
+    detector, releases the showing camera and only probes the detection
+    camera every ``probe_interval`` seconds. ``motion`` compares probe frames
+    on a coarse grid, so waking up costs no inference.
+
+    Warm-ups are timed from ``waking`` to ``warmed_up`` (the first detection
+    on the new graph) and logged, with a warning above ``warm_up_budget``.
+    """
+
+    def __init__(
+            self,
+            idle_timeout: float = GameConfig.IDLE_SUSPEND_TIMEOUT,
+            game_over_timeout: float = GameConfig.GAME_OVER_SUSPEND_TIMEOUT,
+            probe_interval: float = GameConfig.WAKE_PROBE_INTERVAL,
+            motion_threshold: float = GameConfig.WAKE_MOTION_THRESHOLD,
+            warm_up_budget: float = GameConfig.WARM_UP_BUDGET,
+    ):
+        self.idle_timeout = idle_timeout
+        self.game_over_timeout = game_over_timeout
+        self.probe_interval = probe_interval
+        self.motion_threshold = motion_threshold
+        self.warm_up_budget = warm_up_budget
+
+        self.state = PowerState.ACTIVE
+        self.warm_up_times = deque(maxlen=100)
+        self._last_activity = None
+        self._previous_probe = None
+        self._waking_since = None
+
+    @property
+    def suspended(self) -> bool:
+        return self.state == PowerState.SUSPENDED
+
+    @property
+    def last_warm_up(self) -> float | None:
+        return self.warm_up_times[-1] if self.warm_up_times else None
+
+    def on_activity(self, now):
+        self._last_activity = now
+
+    def should_suspend(self, game_state: GameState, paused: bool, now) -> bool:
+        if self.suspended:
+            return False
+        if self._last_activity is None:
+            self._last_activity = now
+
+        if paused or game_state == GameState.GAME_OVER:
+            timeout = self.game_over_timeout
+        elif game_state == GameState.IDLE:
+            timeout = self.idle_timeout
+        else:
+            # never in the middle of a game
+            return False
+        return now - self._last_activity >= timeout
+
+    def suspend(self, now):
+        self.state = PowerState.SUSPENDED
+        self._previous_probe = None
+        _logger.info("Suspending detection after %.1f s without activity", now - self._last_activity)
+
+    def motion(self, frame) -> bool:
+        """Whether the probe frame differs enough from the previous one."""
+        probe = frame[::_PROBE_STRIDE, ::_PROBE_STRIDE].astype(np.int16)
+        previous, self._previous_probe = self._previous_probe, probe
+        if previous is None or previous.shape != probe.shape:
+            return False
+        change = np.abs(probe - previous).mean() / 255.0
+        return change >= self.motion_threshold
+
+    def waking(self, now):
+        self._waking_since = now
+
+    def warmed_up(self, now) -> float:
+        """Marks the hardware as running again, returns the warm-up time in seconds."""
+        warm_up = now - self._waking_since
+        self.warm_up_times.append(warm_up)
+        self.state = PowerState.ACTIVE
+        self._last_activity = now
+        self._waking_since = None
+
+        if warm_up > self.warm_up_budget:
+            _logger.warning("Detection warm-up took %.2f s, over the %.2f s budget", warm_up, self.warm_up_budget)
+        else:
+            _logger.info("Detection warmed up in %.2f s", warm_up)
+        return warm_up
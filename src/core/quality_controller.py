@@ -0,0 +1,149 @@
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.game_state import GameConfig
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class QualityLevel:
+    model_complexity: int       # MediaPipe hand landmark model, 0 is the light one
+    detection_scale: float      # frames are downscaled by it before detection
+    max_num_hands: int
+    fps: float
+
+
+# best first, every step is cheaper than the one before; the game only
+# plays the primary hand, a second hand is a nicety of the analytics
+QUALITY_LEVELS = (
+    QualityLevel(model_complexity=1, detection_scale=1.0, max_num_hands=2, fps=20.0),
+    QualityLevel(model_complexity=1, detection_scale=0.75, max_num_hands=2, fps=20.0),
+    QualityLevel(model_complexity=0, detection_scale=0.75, max_num_hands=2, fps=20.0),
+    QualityLevel(model_complexity=0, detection_scale=0.5, max_num_hands=1, fps=20.0),
+    QualityLevel(model_complexity=0, detection_scale=0.5, max_num_hands=1, fps=15.0),
+    QualityLevel(model_complexity=0, detection_scale=0.4, max_num_hands=1, fps=10.0),
+)
+
+
+class QualityController:
+    """
+    Holds the p95 per-frame latency under ``latency_budget`` by moving along
+    QUALITY_LEVELS.
+
+    Latencies of ``window`` frames are collected at a level (the first
+    ``settle_frames`` after a change are skipped, a rebuilt graph is slow on
+    its first frames). A full window over the budget steps one level down.
+    A window under ``upgrade_ratio`` of the budget, with at least
+    ``min_headroom`` of the machine's CPU idle, steps one level up, but only after
+    ``upgrade_delay`` seconds at the level. The delay doubles whenever an
+    upgrade has to be undone, so a machine on the edge of a level settles
+    on the cheaper one instead of oscillating.
+    """
+
+    def __init__(
+            self,
+            latency_budget: float = GameConfig.FRAME_LATENCY_BUDGET,
+            levels=QUALITY_LEVELS,
+            window: int = 40,
+            settle_frames: int = 5,
+            upgrade_ratio: float = 0.6,
+            min_headroom: float = 0.3,
+            upgrade_delay: float = 10.0,
+            max_upgrade_delay: float = 600.0,
+    ):
+        self.latency_budget = latency_budget
+        self.levels = tuple(levels)
+        self.window = window
+        self.settle_frames = settle_frames
+        self.upgrade_ratio = upgrade_ratio
+        self.min_headroom = min_headroom
+        self.upgrade_delay = upgrade_delay
+        self.max_upgrade_delay = max_upgrade_delay
+
+        self.index = 0
+        self._latencies = deque(maxlen=window)
+        self._skip = 0
+        self._changed_at = None
+        self._last_change_was_upgrade = False
+        self._cpu_mark = None
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def record(self, latency: float, now: float) -> QualityLevel | None:
+        """
+        Adds the latency of a frame in seconds, ``now`` on the perf_counter
+        clock. Returns the new level when it changes, None otherwise.
+        """
+        if self._changed_at is None:
+            self._start_window(now)
+        if self._skip:
+            self._skip -= 1
+            return None
+
+        self._latencies.append(latency)
+        if len(self._latencies) < self.window:
+            return None
+
+        p95 = float(np.percentile(self._latencies, 95))
+        headroom = self._cpu_headroom(now)
+        self._latencies.clear()
+
+        if p95 > self.latency_budget and self.index < len(self.levels) - 1:
+            if self._last_change_was_upgrade and now - self._changed_at < self.upgrade_delay:
+                # the last upgrade did not hold, wait longer before the next one
+                self.upgrade_delay = min(self.upgrade_delay * 2, self.max_upgrade_delay)
+            return self._change(self.index + 1, now, p95, headroom)
+
+        if (
+                p95 < self.latency_budget * self.upgrade_ratio and headroom >= self.min_headroom and
+                self.index > 0 and now - self._changed_at >= self.upgrade_delay
+        ):
+            return self._change(self.index - 1, now, p95, headroom)
+        return None
+
+    def _change(self, index, now, p95, headroom):
+        self._last_change_was_upgrade = index < self.index
+        self.index = index
+        self._start_window(now)
+        _logger.info(
+            "Quality %s -> %s (p95 frame latency %.1f ms, budget %.1f ms, CPU headroom %.0f%%): %s",
+            "up" if self._last_change_was_upgrade else "down", index,
+            p95 * 1000, self.latency_budget * 1000, headroom * 100, self.level,
+        )
+        return self.level
+
+    def _start_window(self, now):
+        self._changed_at = now
+        self._skip = self.settle_frames
+        self._latencies.clear()
+        self._cpu_mark = (now, time.process_time())
+
+    def _cpu_headroom(self, now):
+        """
+        Share of the machine's CPU left idle: one minus the one minute load
+        average per core. Where the OS has no load average (Windows), only
+        this process's CPU time since the window started is known, the rest
+        of the machine is assumed idle.
+        """
+        cpu = time.process_time()
+        started, cpu_started = self._cpu_mark
+        self._cpu_mark = (now, cpu)
+        cores = os.cpu_count() or 1
+        try:
+            return max(0.0, 1.0 - os.getloadavg()[0] / cores)
+        except (AttributeError, OSError):
+            pass
+
+        elapsed = now - started
+        if elapsed <= 0:
+            return 1.0
+        used = (cpu - cpu_started) / (elapsed * cores)
+        return max(0.0, 1.0 - used)
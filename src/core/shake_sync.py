@@ -0,0 +1,94 @@
+from src.core.domain import SyncPhase, SyncStatus
+from src.core.game_state import GameConfig
+
+_WRIST = 0
+_Y = 1
+
+
+class ShakeTracker:
+    """
+    Follows the "rock, paper, scissors, shoot" pumping of the player's hand.
+
+    The wrist's vertical position is smoothed and fed to an incremental peak
+    detector with hysteresis: a pump cycle is counted every time the hand
+    reaches the bottom of a stroke and comes back up by at least
+    ``min_amplitude``. After ``shake_cycles`` cycles the next stroke is the
+    "shoot": the phase switches to LOCKING as soon as the hand stops going
+    down, which is the natural moment to lock the player's move.
+    """
+
+    def __init__(
+            self,
+            shake_cycles: int = GameConfig.SHAKE_CYCLES,
+            min_amplitude: float = GameConfig.SHAKE_MIN_AMPLITUDE,
+            idle_timeout: float = GameConfig.SHAKE_IDLE_TIMEOUT,
+            smoothing: float = 0.6,
+    ):
+        self.shake_cycles = shake_cycles
+        self.min_amplitude = min_amplitude
+        self.idle_timeout = idle_timeout
+        self.smoothing = smoothing
+
+        self.reset()
+
+    def reset(self):
+        self._phase = SyncPhase.WAITING
+        self._cycles = 0
+        self._y = None
+        self._moving_down = True
+        self._top = None
+        self._extreme = None
+        self._last_peak_time = None
+
+    @property
+    def status(self) -> SyncStatus:
+        return SyncStatus(
+            phase=self._phase,
+            cycles=self._cycles,
+            progress=min(self._cycles / self.shake_cycles, 1.0),
+        )
+
+    def update(self, landmarks, current_time) -> SyncStatus:
+        if self._phase == SyncPhase.LOCKING:
+            return self.status
+
+        if (
+            self._last_peak_time is not None and
+            current_time - self._last_peak_time > self.idle_timeout
+        ):
+            # the hand stopped pumping, start counting again
+            self.reset()
+
+        if landmarks:
+            self._track(landmarks[_WRIST][_Y], current_time)
+
+        return self.status
+
+    def _track(self, wrist_y, current_time):
+        # image y grows downwards
+        if self._y is None:
+            self._y = self._top = self._extreme = wrist_y
+            return
+        self._y = self.smoothing * wrist_y + (1 - self.smoothing) * self._y
+
+        if self._moving_down:
+            if self._y > self._extreme:
+                self._extreme = self._y
+            elif self._cycles >= self.shake_cycles and self._extreme - self._top >= self.min_amplitude:
+                self._phase = SyncPhase.LOCKING
+            elif self._extreme - self._y >= self.min_amplitude:
+                self._on_bottom_peak(current_time)
+        else:
+            if self._y < self._extreme:
+                self._extreme = self._y
+            elif self._y - self._extreme >= self.min_amplitude:
+                self._moving_down = True
+                self._top = self._extreme
+                self._extreme = self._y
+
+    def _on_bottom_peak(self, current_time):
+        self._moving_down = False
+        self._extreme = self._y
+        self._last_peak_time = current_time
+        self._cycles += 1
+        self._phase = SyncPhase.SHAKING
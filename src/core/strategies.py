@@ -1,18 +1,38 @@
-import random as rd
+from collections import OrderedDict, deque
+
+import numpy as np
 
 from .domain import Move, Outcome, MOVE_BEATS, MOVE_LOSES
+from .match_history import MatchHistory, MoveShift, MOVES, MOVE_INDEX
+from .population_model import PopulationPrior
 
 
 class NaiveStrategy:
-    def __init__(self, action_weights: list = [0.25, 0.40, 0.35]):
+    def __init__(self, action_weights: list = [0.25, 0.40, 0.35], population_prior: PopulationPrior = None,
+                 rng: np.random.Generator | int | None = None):
+        """
+        :param rng: generator or seed of the random moves, a fixed seed makes
+            simulations repeatable
+        """
         self.action_weights = action_weights
+        self.population_prior = population_prior
+        self.rng = np.random.default_rng(rng)
 
     def select_move(self, match_history=None):
-        if not match_history:
-            return self.first_move()
+        return self.first_move(match_history)
+
+    def first_move(self, match_history=None):
+        weights = self.action_weights
+        player_moves = (
+            self.population_prior.player_move_distribution(match_history)
+            if self.population_prior is not None else None
+        )
+        if player_moves is not None:
+            # play each move as often as the player is expected to play the move it beats
+            weights = [player_moves[MOVE_INDEX[MOVE_BEATS[move]]] for move in Move]
 
-    def first_move(self):
-        return rd.choices(tuple(Move), self.action_weights, k=1)[0]
+        cumulative = np.cumsum(weights)
+        return MOVES[int(np.searchsorted(cumulative, self.rng.random() * cumulative[-1], side="right"))]
 
 
 class ResearchBasedStrategy(NaiveStrategy):
@@ -22,7 +42,7 @@ class ResearchBasedStrategy(NaiveStrategy):
             return self.first_move()
 
         previous_round =  self._get_previous_round(match_history)
-        last_three_moves = self._get_last_moves(match_history)[-3:]
+        last_three_moves = self._get_last_moves(match_history, 3)
 
         if self._are_moves_same(last_three_moves):
             return MOVE_LOSES[previous_round.player_move]
@@ -32,13 +52,283 @@ class ResearchBasedStrategy(NaiveStrategy):
         elif previous_round.outcome == Outcome.COMPUTER:
             return previous_round.player_move
 
-        return self.first_move()
+        return self.first_move(match_history)
         
     def _get_previous_round(self, match_history):
         return match_history[-1]
 
-    def _get_last_moves(self, match_history):
-        return [round.player_move.value for round in match_history]
+    def _get_last_moves(self, match_history, n):
+        return [round.player_move.value for round in match_history[-n:]]
 
     def _are_moves_same(self, moves):
-        return len(set(moves)) == 1
\ No newline at end of file
+        return len(set(moves)) == 1
+
+
+class IncrementalStrategy(NaiveStrategy):
+    """
+    Base for strategies with their own statistics: only rounds that were
+    not seen yet are passed to ``_observe``, so the cost per round doesn't
+    grow with the length of the session.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._reset()
+
+    def select_move(self, match_history=None):
+        self._sync(match_history or ())
+
+        return self._select_move(match_history)
+
+    def _reset(self):
+        self._seen_rounds = 0
+
+    def _sync(self, match_history):
+        if len(match_history) < self._seen_rounds:
+            # a new game has started
+            self._reset()
+
+        for round_record in match_history[self._seen_rounds:]:
+            self._observe(round_record)
+        self._seen_rounds = len(match_history)
+
+    def _observe(self, round_record):
+        raise NotImplementedError
+
+    def _select_move(self, match_history):
+        raise NotImplementedError
+
+
+class MarkovStrategy(IncrementalStrategy):
+    """
+    Variable-order Markov predictor of the player's next move.
+
+    Contexts are the last 1..max_order rounds of joint (player, computer)
+    moves - the outcome follows from them. Each context keeps exponentially
+    decayed counts of the move the player made next. The longest context
+    with enough evidence predicts the player's move and the strategy plays
+    the move that beats it.
+
+    At most ``max_contexts`` contexts are kept and the least recently used
+    ones are evicted, so the memory stays bounded however long the session
+    is.
+    """
+
+    def __init__(
+            self,
+            max_order: int = 4,
+            decay: float = 0.95,
+            min_evidence: float = 0.5,
+            max_contexts: int = 4096,
+            **kwargs,
+    ):
+        self.max_order = max_order
+        self.decay = decay
+        self.min_evidence = min_evidence
+        self.max_contexts = max_contexts
+
+        super().__init__(**kwargs)
+
+    def _select_move(self, match_history):
+        predicted = self.predict_player_move()
+        if predicted is None:
+            return self.first_move(match_history)
+
+        return MOVE_LOSES[predicted]
+
+    def _reset(self):
+        super()._reset()
+        self._step = 0
+        self._symbols = deque(maxlen=self.max_order)
+        # context -> [decayed counts of the player's next move, step of the last update]
+        self._contexts = OrderedDict()
+
+    def _observe(self, round_record):
+        step = self._step
+        player = MOVE_INDEX[round_record.player_move]
+        symbols = tuple(self._symbols)
+
+        for order in range(1, len(symbols) + 1):
+            context = symbols[-order:]
+            entry = self._contexts.get(context)
+            if entry is None:
+                entry = self._contexts[context] = [np.zeros(len(MOVES)), step]
+                if len(self._contexts) > self.max_contexts:
+                    self._contexts.popitem(last=False)
+            else:
+                self._contexts.move_to_end(context)
+
+            counts = self._decayed(entry, step)
+            counts[player] += 1.0
+
+        self._symbols.append(player * len(MOVES) + MOVE_INDEX[round_record.computer_move])
+        self._step += 1
+
+    def predict_player_move(self) -> Move | None:
+        symbols = tuple(self._symbols)
+        for order in range(len(symbols), 0, -1):
+            entry = self._contexts.get(symbols[-order:])
+            if entry is None:
+                continue
+            counts = self._decayed(entry, self._step)
+            if counts.sum() >= self.min_evidence:
+                return MOVES[int(counts.argmax())]
+        return None
+
+    def _decayed(self, entry, step):
+        counts, last_step = entry
+        if step != last_step:
+            counts *= self.decay ** (step - last_step)
+            entry[1] = step
+        return counts
+
+
+# _PAYOFF[computer move, player move] in MOVES order, a move beats the previous one
+_PAYOFF = np.array([
+    [0, -1, 1],
+    [1, 0, -1],
+    [-1, 1, 0],
+])
+_SHIFT_STEP = {MoveShift.STAY: 0, MoveShift.UPGRADE: 1, MoveShift.DOWNGRADE: 2}
+
+
+class IocaineStrategy(IncrementalStrategy):
+    """
+    Meta-strategy in the spirit of Iocaine Powder.
+
+    Many simple predictors guess the player's next move: move frequencies
+    of both sides over several windows, n-grams of the player's moves,
+    win-stay/lose-shift habits, MarkovStrategy and the ResearchBasedStrategy
+    rules. Every guess is turned into three variants - beat the guess, or
+    assume the player is one or two steps ahead of it. Every variant is
+    scored with several decay rates and the current leader is played.
+
+    The scores of all (decay, variant) pairs are updated with one NumPy
+    step per round.
+    """
+
+    def __init__(
+            self,
+            windows: tuple = (5, 10, 20, 50, 100),
+            ngram_order: int = 4,
+            score_decays: tuple = (1.0, 0.9, 0.7),
+            **kwargs,
+    ):
+        self.windows = np.array(windows)
+        self.ngram_order = ngram_order
+        self.score_decays = np.array(score_decays, dtype=np.float64)[:, None]
+
+        super().__init__(**kwargs)
+
+    @property
+    def n_predictors(self):
+        return self._scores.size
+
+    def _reset(self):
+        super()._reset()
+        self._history = MatchHistory(max_order=self.ngram_order)
+        self._markov = [MarkovStrategy(decay=0.95, rng=self.rng), MarkovStrategy(max_order=2, decay=0.7, rng=self.rng)]
+        self._research = ResearchBasedStrategy(self.action_weights, self.population_prior, rng=self.rng)
+
+        # last max(windows) moves of the player (row 0) and the computer (row 1)
+        self._recent = np.zeros((2, int(self.windows.max())), dtype=np.intp)
+        # move counts per side, per window; the last window is the whole game
+        self._window_counts = np.zeros((2, len(self.windows) + 1, len(MOVES)), dtype=np.int64)
+
+        self._guesses = None
+        self._variant_moves = None
+        self._variant_moves_round = -1
+        self._scores = np.zeros((len(self.score_decays), 3 * self._n_guesses()))
+
+    def _select_move(self, match_history):
+        if not self._history:
+            return self.first_move()
+
+        leader = int(self._scores.argmax()) % self._scores.shape[1]
+        return MOVES[self._current_variant_moves()[leader]]
+
+    def predict_player_move(self) -> Move | None:
+        """The player's move the leading variant assumes: its predictor's guess, shifted by the variant."""
+        if not self._history:
+            return None
+        leader = int(self._scores.argmax()) % self._scores.shape[1]
+        # every guess has three consecutive variants, shifted by 0, 1 and 2 moves
+        guess, shift = divmod(leader, 3)
+        self._current_variant_moves()
+        return MOVES[(self._guesses[guess] + shift) % len(MOVES)]
+
+    def _observe(self, round_record):
+        if self._history:
+            player = MOVE_INDEX[round_record.player_move]
+            self._scores *= self.score_decays
+            self._scores += _PAYOFF[self._current_variant_moves(), player]
+
+        self._update_window_counts(round_record)
+        self._history.append(round_record)
+        for markov in self._markov:
+            markov.select_move(self._history)
+
+    def _current_variant_moves(self):
+        # select_move and the next _observe need the same variants, compute them once per round
+        if self._variant_moves_round != len(self._history):
+            guesses = self._guess_player_moves()
+            self._guesses = guesses
+            # beat the guess, or the move that beats it, or the one beating that
+            self._variant_moves = ((guesses[:, None] + np.arange(1, 4)) % len(MOVES)).ravel()
+            self._variant_moves_round = len(self._history)
+        return self._variant_moves
+
+    def _n_guesses(self):
+        return 2 * (len(self.windows) + 1) + self.ngram_order + 1 + len(self._markov) + 1 + 2
+
+    def _guess_player_moves(self):
+        """Indices of the player's next move guessed by every predictor."""
+        history = self._history
+        previous = history[-1]
+        player_last = MOVE_INDEX[previous.player_move]
+        computer_last = MOVE_INDEX[previous.computer_move]
+        fallback = int(self._window_counts[0, -1].argmax())
+
+        # the player's favourite moves; the computer's favourite moves countered by the player
+        player_favourites = self._window_counts[0].argmax(axis=1)
+        computer_favourites = (self._window_counts[1].argmax(axis=1) + 1) % len(MOVES)
+
+        guesses = []
+        for order in range(1, self.ngram_order + 1):
+            counts = history.ngram_counts(history.recent_player_moves(order)) if len(history) >= order else None
+            guesses.append(int(counts.argmax()) if counts is not None else fallback)
+
+        shifts = history.shift_counts(previous.outcome)
+        if shifts.any():
+            guesses.append((player_last + _SHIFT_STEP[int(shifts.argmax())]) % len(MOVES))
+        else:
+            guesses.append(player_last)
+
+        for markov in self._markov:
+            move = markov.predict_player_move()
+            guesses.append(MOVE_INDEX[move] if move is not None else fallback)
+
+        # ResearchBasedStrategy picks a move against the player, guess the move it beats
+        guesses.append(MOVE_INDEX[MOVE_BEATS[self._research.select_move(history)]])
+
+        # the player repeats the last move, or copies the computer's last move
+        guesses.append(player_last)
+        guesses.append(computer_last)
+
+        return np.concatenate([player_favourites, computer_favourites, guesses])
+
+    def _update_window_counts(self, round_record):
+        step = len(self._history)
+        moves = np.array([MOVE_INDEX[round_record.player_move], MOVE_INDEX[round_record.computer_move]])
+        sides = np.arange(2)
+
+        # moves leaving the windows
+        expired = self.windows <= step
+        if expired.any():
+            old_moves = self._recent[:, (step - self.windows[expired]) % self._recent.shape[1]]
+            window_ids = np.flatnonzero(expired)
+            np.subtract.at(self._window_counts, (sides[:, None], window_ids[None, :], old_moves), 1)
+
+        self._window_counts[sides, :, moves] += 1
+        self._recent[:, step % self._recent.shape[1]] = moves
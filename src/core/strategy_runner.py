@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class StrategyRunner:
+    """
+    Runs the computer's strategy off the critical path.
+
+    Strategies only depend on the rounds played so far, so the computer's
+    next move is computed on a background thread as soon as the previous
+    round is recorded (``prepare``) and handed back instantly when the
+    player commits (``select_move``). If the history changed since
+    ``prepare`` the precomputed move is thrown away and computed again.
+
+    Strategies with a ``predict_player_move`` are asked for it together with
+    their move, the guess is kept in ``predicted_player_move`` (None when the
+    strategy made no guess) for the game's statistics.
+    """
+
+    def __init__(self, strategy, background: bool = True):
+        """:param background: False runs the strategy inline in ``select_move``, for headless sessions"""
+        self.strategy = strategy
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="strategy") if background else None
+        self._pending = None
+        self.predicted_player_move = None
+
+    def prepare(self, match_history):
+        if self._executor is None:
+            return
+        self._wait_for_pending()
+        self._pending = (
+            self._history_key(match_history),
+            self._executor.submit(self._choose, match_history),
+        )
+
+    def select_move(self, match_history):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            key, future = pending
+            # waits only if the strategy is slower than the countdown
+            move, self.predicted_player_move = future.result()
+            if key == self._history_key(match_history):
+                return move
+
+        move, self.predicted_player_move = self._choose(match_history)
+        return move
+
+    def set_strategy(self, strategy):
+        """Replaces the strategy, a move precomputed by the old one is discarded."""
+        self._wait_for_pending()
+        self.strategy = strategy
+
+    def close(self):
+        self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _choose(self, match_history):
+        move = self.strategy.select_move(match_history)
+        # the prediction reflects the state the strategy chose its move in
+        predict = getattr(self.strategy, "predict_player_move", None)
+        return move, predict() if predict is not None else None
+
+    def _wait_for_pending(self):
+        # strategies are not thread safe, never run two computations at once
+        if self._pending is not None:
+            self._pending[1].result()
+            self._pending = None
+
+    @staticmethod
+    def _history_key(match_history):
+        return id(match_history), len(match_history), match_history[-1] if match_history else None
@@ -0,0 +1,176 @@
+"""
+Extracts hand landmarks from a folder of images and videos into a
+LandmarkDataset. The label of every file is the name of its top-level
+folder, e.g. ``data/ROCK/001.jpg`` is labelled ``ROCK``; files lying
+directly in the root folder are labelled ``NONE``.
+
+    python -m src.ml.build_landmark_dataset data/ -o data/landmarks.npz
+
+Extraction runs in a process pool with one MediaPipe graph per worker.
+Results are cached per file content hash, so re-runs only process new or
+changed files.
+"""
+import argparse
+import hashlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from src.ml.landmark_dataset import LandmarkDataset, N_LANDMARKS
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+VIDEO_SUFFIXES = {".mp4", ".avi", ".mov", ".mkv", ".webm"}
+NO_LABEL = "NONE"
+
+_CACHE_VERSION = "1"
+_logger = logging.getLogger(__name__)
+
+# one detector per worker process, created on the first cache miss
+_detector = None
+
+
+def find_files(root: Path) -> list[tuple[Path, str]]:
+    files = []
+    for path in sorted(root.rglob("*")):
+        if path.suffix.lower() not in IMAGE_SUFFIXES | VIDEO_SUFFIXES:
+            continue
+        relative = path.relative_to(root)
+        label = relative.parts[0] if len(relative.parts) > 1 else NO_LABEL
+        files.append((path, label))
+    return files
+
+
+def file_key(path: Path, settings: str) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{_CACHE_VERSION}:{settings}:".encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _get_detector(min_detection_confidence):
+    global _detector
+    if _detector is None:
+        # imported here so that the main process never loads MediaPipe
+        from src.ml.hand_detector import HandDetector
+
+        _detector = HandDetector(
+            user_perspective=True,
+            static_image_mode=True,
+            max_num_hands=2,
+            min_detection_confidence=min_detection_confidence,
+        )
+    return _detector
+
+
+def _read_frames(path: Path, video_stride: int):
+    import cv2
+
+    if path.suffix.lower() in IMAGE_SUFFIXES:
+        frame = cv2.imread(str(path))
+        if frame is not None:
+            yield frame
+        return
+
+    capture = cv2.VideoCapture(str(path))
+    try:
+        index = 0
+        while True:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            if index % video_stride == 0:
+                yield frame
+            index += 1
+    finally:
+        capture.release()
+
+
+def _extract(path: Path, video_stride: int, min_detection_confidence: float):
+    detector = _get_detector(min_detection_confidence)
+    landmarks, sides = [], []
+    for frame in _read_frames(path, video_stride):
+        for side, coords in detector.detect(frame).items():
+            landmarks.append(coords)
+            sides.append(side)
+
+    return (
+        np.asarray(landmarks, dtype=np.float32).reshape(-1, N_LANDMARKS, 3),
+        np.asarray(sides, dtype=str),
+    )
+
+
+def _process_file(task):
+    path, cache_dir, video_stride, min_detection_confidence = task
+    key = file_key(path, f"{video_stride}:{min_detection_confidence}")
+    cache_file = cache_dir / key[:2] / f"{key}.npz"
+
+    if cache_file.exists():
+        with np.load(cache_file, allow_pickle=False) as data:
+            return data["landmarks"], data["sides"], True
+
+    landmarks, sides = _extract(path, video_stride, min_detection_confidence)
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # write under a temporary name, so that a killed run can't leave a broken entry
+    tmp_file = cache_file.with_name(f"{key}.{os.getpid()}.tmp.npz")
+    np.savez(tmp_file, landmarks=landmarks, sides=sides)
+    os.replace(tmp_file, cache_file)
+
+    return landmarks, sides, False
+
+
+def build_dataset(root: Path, cache_dir: Path, *, workers=None, video_stride=5,
+                  min_detection_confidence=0.5) -> LandmarkDataset:
+    files = find_files(root)
+    tasks = [(path, cache_dir, video_stride, min_detection_confidence) for path, _ in files]
+    _logger.info("Found %d files in %s", len(files), root)
+
+    datasets, cached = [], 0
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        results = executor.map(_process_file, tasks, chunksize=16)
+        for i, ((_, label), (landmarks, sides, was_cached)) in enumerate(zip(files, results), start=1):
+            cached += was_cached
+            datasets.append(LandmarkDataset(landmarks, sides, np.full(len(landmarks), label)))
+            if i % 1000 == 0:
+                _logger.info("%d/%d files done (%d from cache)", i, len(files), cached)
+
+    dataset = LandmarkDataset.concatenate(datasets)
+    _logger.info("Extracted %d hands from %d files (%d from cache)", len(dataset), len(files), cached)
+    return dataset
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", type=Path, help="folder with labelled images and videos")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="where to write the dataset (.npz)")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help="landmark cache (default: <root>/.landmark_cache)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--video-stride", type=int, default=5, help="use every n-th video frame")
+    parser.add_argument("--min-detection-confidence", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    dataset = build_dataset(
+        args.root,
+        args.cache_dir or args.root / ".landmark_cache",
+        workers=args.workers,
+        video_stride=args.video_stride,
+        min_detection_confidence=args.min_detection_confidence,
+    )
+    dataset.save(args.output)
+    _logger.info("Dataset saved to %s", args.output)
+
+
+if __name__ == "__main__":
+    main()
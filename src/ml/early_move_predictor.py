@@ -0,0 +1,117 @@
+from collections import deque
+
+import numpy as np
+
+from src.core.domain import Move
+from src.ml.gesture_classifier import VectorBasedClassifier
+
+_MOVES = (Move.ROCK, Move.PAPER, Move.SCISSORS)
+# straightened index, middle, ring and pinky finger for every move
+_MOVE_PATTERNS = np.array([
+    [False, False, False, False],
+    [True, True, True, True],
+    [True, True, False, False],
+])
+
+
+class EarlyMovePredictor:
+    """
+    Predicts the gesture the hand is forming before it settles.
+
+    Every frame the PIP joint cosines from VectorBasedClassifier are pushed
+    to a short history, their trend is extrapolated ``horizon`` seconds ahead
+    and turned into per-finger "straightened" probabilities. Move
+    probabilities are the likelihoods of the move patterns, normalized over
+    the three moves.
+
+    The pose from the first update (the one held while shaking, usually a
+    fist) is the baseline. A move is committed only when it differs from the
+    baseline and the fingers that have to change already moved by
+    ``min_change`` towards it, so jitter of a still hand is not extrapolated
+    into a move.
+
+    The cosines and the straightening threshold come from ``classifier``;
+    classifiers that don't compute the cosines (the rule based and the
+    learned one) are replaced by a default VectorBasedClassifier.
+    """
+
+    def __init__(
+            self,
+            classifier: VectorBasedClassifier = None,
+            horizon: float = 0.15,
+            sharpness: float = 10.0,
+            commit_confidence: float = 0.8,
+            min_change: float = 0.25,
+            history_size: int = 4,
+    ):
+        self.classifier = classifier if isinstance(classifier, VectorBasedClassifier) else VectorBasedClassifier()
+        self.horizon = horizon
+        self.sharpness = sharpness
+        self.commit_confidence = commit_confidence
+        self.min_change = min_change
+
+        self._history = deque(maxlen=history_size)
+        self._baseline = None
+        self._curve = []
+
+    def reset(self):
+        self._history.clear()
+        self._baseline = None
+        self._curve = []
+
+    @property
+    def confidence_curve(self) -> list[tuple[float, Move, float]]:
+        """(time, most probable move, its probability) for every update since reset."""
+        return self._curve
+
+    def update(self, landmarks, current_time) -> dict[Move, float]:
+        cosines = np.nan_to_num(self.classifier.calculate_dot_products(landmarks), nan=0.0)
+        if self._baseline is None:
+            self._baseline = cosines
+        self._history.append((current_time, cosines))
+
+        probabilities = self._move_probabilities(self._extrapolate())
+        best = int(probabilities.argmax())
+        self._curve.append((current_time, _MOVES[best], float(probabilities[best])))
+
+        return dict(zip(_MOVES, probabilities.tolist()))
+
+    def committed_move(self) -> Move | None:
+        if not self._curve:
+            return None
+
+        _, move, confidence = self._curve[-1]
+        if confidence < self.commit_confidence:
+            return None
+
+        pattern = _MOVE_PATTERNS[_MOVES.index(move)]
+        changing = pattern != (self._baseline > self.classifier.straightening_threshold)
+        if not changing.any():
+            return None
+
+        change = self._history[-1][1] - self._baseline
+        progress = np.where(pattern, change, -change)[changing].mean()
+        return move if progress >= self.min_change else None
+
+    def _extrapolate(self):
+        times = np.array([t for t, _ in self._history])
+        cosines = np.array([c for _, c in self._history])
+        if len(times) < 2:
+            return cosines[-1]
+
+        # least squares slope of every finger's cosine over the history
+        times = times - times.mean()
+        variance = times @ times
+        if variance <= 0:
+            return cosines[-1]
+        slopes = times @ (cosines - cosines.mean(axis=0)) / variance
+
+        return np.clip(cosines[-1] + slopes * self.horizon, -1.0, 1.0)
+
+    def _move_probabilities(self, cosines):
+        straightened = 1.0 / (1.0 + np.exp(
+            -self.sharpness * (cosines - self.classifier.straightening_threshold)
+        ))
+
+        likelihoods = np.where(_MOVE_PATTERNS, straightened, 1.0 - straightened).prod(axis=1)
+        return likelihoods / max(likelihoods.sum(), 1e-12)
@@ -1,8 +1,10 @@
-import random
 import numpy as np
 import mediapipe as mp
 
 from src.core.domain import Move, ThumbDirection
+from src.ml.gesture_model import GestureModel
+
+_HL = mp.solutions.hands.HandLandmark
 
 
 class GestureClassifier:
@@ -59,6 +61,11 @@ class GestureClassifier:
 
         return patterns.get(self._finger_states(side, landmarks))
 
+    def determine_move_with_confidence(self, side, landmarks):
+        """Rule based classifiers are either sure about the move or return None."""
+        move = self.determine_move(side, landmarks)
+        return move, 1.0 if move is not None else 0.0
+
     def _finger_states(self, side, landmarks):
         return (
             self._is_thumb_straightened_x(side, landmarks),
@@ -97,68 +104,150 @@ class GestureClassifier:
     
     
 class MockClassifier: 
-    def __init__(self):
+    def __init__(self, rng: np.random.Generator | int | None = None):
         self.moves= list(Move)
+        self.rng = np.random.default_rng(rng)
 
     def classify_something(self, landmarks):
         if not landmarks:
             return None
 
-        return random.choice(self.moves)
+        return self.moves[self.rng.integers(len(self.moves))]
     
 
 class VectorBasedClassifier(GestureClassifier):
+    """Classifies moves from the bend of each finger at its PIP joint.
+
+    All landmark math is done with index-array gathers, so a single hand
+    ``(21, 3)`` and a batch of hands ``(N, 21, 3)`` go through the same code.
+    """
+
+    _FINGER_PIP_IDS = np.array([
+        _HL.INDEX_FINGER_PIP,
+        _HL.MIDDLE_FINGER_PIP,
+        _HL.RING_FINGER_PIP,
+        _HL.PINKY_PIP,
+    ], dtype=np.intp)
+    _FINGER_MCP_IDS = _FINGER_PIP_IDS - 1
+    _FINGER_TIP_IDS = _FINGER_PIP_IDS + 2
+
+    # finger states packed as bits (index finger is the most significant one)
+    _STATE_WEIGHTS = np.array([8, 4, 2, 1], dtype=np.intp)
+    _MOVE_BY_STATE_CODE = np.array([
+        {0b0000: Move.ROCK, 0b1111: Move.PAPER, 0b1100: Move.SCISSORS}.get(code)
+        for code in range(16)
+    ], dtype=object)
+
     def __init__(self, straightening_threshold: float = 0):
         super().__init__()
 
         self.straightening_threshold = straightening_threshold
 
     def determine_move(self, side, landmarks):
-        patterns = {
-            (False, False, False, False): Move.ROCK,
-            (True, True, True, True): Move.PAPER,
-            (True, True, False, False): Move.SCISSORS
-        }
+        code = int(self._finger_states_array(landmarks) @ self._STATE_WEIGHTS)
 
-        return patterns.get(self._finger_states(side, landmarks))
-    
-    def _finger_states(self, side, landmarks):
-        return (
-            self._is_finger_straightened(landmarks, self._HL.INDEX_FINGER_PIP),
-            self._is_finger_straightened(landmarks, self._HL.MIDDLE_FINGER_PIP),
-            self._is_finger_straightened(landmarks, self._HL.RING_FINGER_PIP),
-            self._is_finger_straightened(landmarks, self._HL.PINKY_PIP),
-        )
-    
-    def _is_finger_straightened(self, landmarks, finger_pip_id):
-        dot_product = self._calculate_dot_product(landmarks, finger_pip_id)
+        return self._MOVE_BY_STATE_CODE[code]
+
+    def classify_batch(self, landmarks):
+        """
+        Classifies many hands at once.
+
+        :param landmarks: array-like of shape (N, 21, 3)
+        :return: tuple (moves, directions) - two lists of length N holding
+            ``Move | None`` and ``ThumbDirection | None`` for every hand
+        """
+        points = np.asarray(landmarks, dtype=np.float64)
 
-        return True if dot_product > self.straightening_threshold else False
+        codes = self._finger_states_array(points) @ self._STATE_WEIGHTS
+        moves = self._MOVE_BY_STATE_CODE[codes].tolist()
 
-    def _calculate_dot_product(self, landmarks, finger_pip_id):
-        inner_vector = self._calculate_inner_vector(landmarks, finger_pip_id)
-        outer_vector = self._calculate_outer_vector(landmarks, finger_pip_id)
+        return moves, self._hand_directions_batch(points)
 
-        return float(
-            np.dot(inner_vector, outer_vector) /
-            (np.linalg.norm(inner_vector) * np.linalg.norm(outer_vector))
+    def calculate_dot_products(self, landmarks):
+        """
+        Cosine of the angle between the inner (MCP->PIP) and outer (PIP->TIP)
+        segment of the index, middle, ring and pinky fingers.
+
+        :param landmarks: array-like of shape (21, 3) or (N, 21, 3)
+        :return: array of shape (4,) or (N, 4)
+        """
+        points = np.asarray(landmarks, dtype=np.float64)
+
+        pips = points[..., self._FINGER_PIP_IDS, :]
+        inner_vectors = pips - points[..., self._FINGER_MCP_IDS, :]
+        outer_vectors = points[..., self._FINGER_TIP_IDS, :] - pips
+
+        dot_products = np.einsum("...ij,...ij->...i", inner_vectors, outer_vectors)
+        norms = (
+            np.linalg.norm(inner_vectors, axis=-1) *
+            np.linalg.norm(outer_vectors, axis=-1)
         )
 
-    def _calculate_outer_vector(self, landmarks, finger_pip_id):
-        return self._calculate_vector(
-            landmarks, finger_pip_id, finger_pip_id + 2
+        return dot_products / norms
+
+    def _finger_states(self, side, landmarks):
+        return tuple(self._finger_states_array(landmarks).tolist())
+
+    def _finger_states_array(self, landmarks):
+        return self.calculate_dot_products(landmarks) > self.straightening_threshold
+
+    def _hand_directions_batch(self, points):
+        y_coords = points[..., 1]
+        thumb_tip_y = y_coords[:, _HL.THUMB_TIP]
+
+        is_thumb_straightened = (
+            np.abs(thumb_tip_y - y_coords[:, _HL.THUMB_IP]) > self.thumb_straight_threshold
         )
+        wrist_to_thumb = y_coords[:, _HL.WRIST] - thumb_tip_y
+        index_to_thumb = y_coords[:, _HL.INDEX_FINGER_MCP] - thumb_tip_y
 
-    def _calculate_inner_vector(self, landmarks, finger_pip_id):
-        return self._calculate_vector(
-            landmarks, finger_pip_id - 1, finger_pip_id
+        is_up = is_thumb_straightened & (
+            (wrist_to_thumb > self.wrist_thumb_threshold) &
+            (index_to_thumb > self.index_thumb_threshold)
         )
+        is_down = is_thumb_straightened & (
+            (wrist_to_thumb < -self.wrist_thumb_threshold) &
+            (index_to_thumb < -self.index_thumb_threshold)
+        )
+
+        directions = np.full(len(points), None, dtype=object)
+        directions[is_up] = ThumbDirection.UP
+        directions[is_down] = ThumbDirection.DOWN
+
+        return directions.tolist()
+
 
-    def _calculate_vector(self, landmarks, lm1_id, lm2_id):
-        lm1_coords = np.array(self._get_all_coordinates(landmarks, lm1_id))
-        lm2_coords = self._get_all_coordinates(landmarks, lm2_id)
+class LearnedClassifier(GestureClassifier):
+    """
+    Classifies moves with a GestureModel trained on recorded landmarks
+    (see ``src.ml.train_gesture_model``). Thumb direction still uses the
+    rule from GestureClassifier.
+    """
 
-        return lm2_coords - lm1_coords
+    def __init__(self, model_path, min_confidence: float = 0.6, **kwargs):
+        super().__init__(**kwargs)
 
-    def _get_all_coordinates(self, hand_landmarks, landmark_id):
-        return hand_landmarks[int(landmark_id)]
\ No newline at end of file
+        self.model = GestureModel.load(model_path)
+        self.min_confidence = min_confidence
+        # model classes that are not moves (e.g. "NONE") map to None
+        self._moves = [Move.__members__.get(name) for name in self.model.classes]
+
+    def determine_move(self, side, landmarks):
+        move, confidence = self.determine_move_with_confidence(side, landmarks)
+
+        return move if confidence >= self.min_confidence else None
+
+    def determine_move_with_confidence(self, side, landmarks):
+        probabilities = self.model.predict_proba([landmarks], [side])[0]
+        best = int(probabilities.argmax())
+
+        return self._moves[best], float(probabilities[best])
+
+    def move_probabilities(self, side, landmarks):
+        probabilities = self.model.predict_proba([landmarks], [side])[0]
+
+        return {
+            move: float(probability)
+            for move, probability in zip(self._moves, probabilities)
+            if move is not None
+        }
@@ -0,0 +1,122 @@
+import numpy as np
+
+# landmark ids (same numbering as mediapipe's HandLandmark)
+_WRIST = 0
+_MIDDLE_FINGER_MCP = 9
+_FINGER_PIP_IDS = np.array([6, 10, 14, 18], dtype=np.intp)
+
+
+def normalize_landmarks(landmarks, sides):
+    """
+    Makes landmarks independent of hand position, size and side: moves the
+    wrist to the origin, scales by the wrist -> middle finger MCP distance and
+    mirrors left hands so that both sides share one model.
+
+    :param landmarks: array-like of shape (N, 21, 3)
+    :param sides: sequence of N "Left"/"Right" labels
+    :return: float32 array of shape (N, 21, 3)
+    """
+    points = np.asarray(landmarks, dtype=np.float32)
+    points = points - points[:, _WRIST:_WRIST + 1, :]
+
+    scale = np.linalg.norm(points[:, _MIDDLE_FINGER_MCP, :], axis=-1)
+    points = points / np.maximum(scale, 1e-6)[:, None, None]
+
+    is_left = np.asarray(sides) == "Left"
+    points[is_left, :, 0] *= -1
+
+    return points
+
+
+def extract_features(landmarks, sides):
+    """Normalized coordinates followed by the four PIP joint cosines."""
+    points = normalize_landmarks(landmarks, sides)
+
+    pips = points[:, _FINGER_PIP_IDS, :]
+    inner_vectors = pips - points[:, _FINGER_PIP_IDS - 1, :]
+    outer_vectors = points[:, _FINGER_PIP_IDS + 2, :] - pips
+    norms = (
+        np.linalg.norm(inner_vectors, axis=-1) *
+        np.linalg.norm(outer_vectors, axis=-1)
+    )
+    cosines = np.einsum("nij,nij->ni", inner_vectors, outer_vectors) / np.maximum(norms, 1e-6)
+
+    return np.concatenate([points.reshape(len(points), -1), cosines], axis=1)
+
+
+class GestureModel:
+    """
+    Multinomial logistic regression over landmark features.
+
+    The whole model (class names, feature standardization and weights) is
+    stored in a single ``.npz`` file.
+    """
+
+    def __init__(self, classes, mean, std, weights, bias):
+        self.classes = np.asarray(classes, dtype=str)
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.std = np.asarray(std, dtype=np.float32)
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+
+    def predict_proba(self, landmarks, sides):
+        """
+        :param landmarks: array-like of shape (N, 21, 3)
+        :param sides: sequence of N "Left"/"Right" labels
+        :return: array of shape (N, n_classes), rows sum up to 1
+        """
+        features = (extract_features(landmarks, sides) - self.mean) / self.std
+        return _softmax(features @ self.weights + self.bias)
+
+    @staticmethod
+    def fit(
+            landmarks,
+            sides,
+            labels,
+            *,
+            epochs: int = 500,
+            learning_rate: float = 0.5,
+            l2: float = 1e-4,
+    ) -> "GestureModel":
+        classes, targets = np.unique(np.asarray(labels, dtype=str), return_inverse=True)
+        features = extract_features(landmarks, sides).astype(np.float64)
+
+        mean = features.mean(axis=0)
+        std = np.maximum(features.std(axis=0), 1e-6)
+        features = (features - mean) / std
+
+        n_samples, n_features = features.shape
+        one_hot = np.eye(len(classes))[targets]
+        weights = np.zeros((n_features, len(classes)))
+        bias = np.zeros(len(classes))
+
+        # full-batch gradient descent, data sets are small enough
+        for _ in range(epochs):
+            error = (_softmax(features @ weights + bias) - one_hot) / n_samples
+            weights -= learning_rate * (features.T @ error + l2 * weights)
+            bias -= learning_rate * error.sum(axis=0)
+
+        return GestureModel(classes, mean, std, weights, bias)
+
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            classes=self.classes,
+            mean=self.mean,
+            std=self.std,
+            weights=self.weights,
+            bias=self.bias,
+        )
+
+    @staticmethod
+    def load(path) -> "GestureModel":
+        with np.load(path, allow_pickle=False) as data:
+            return GestureModel(
+                data["classes"], data["mean"], data["std"], data["weights"], data["bias"]
+            )
+
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
@@ -12,16 +12,26 @@ class HandDetector:
         max_num_hands: int = 2,
         min_detection_confidence: float = 0.5,
         min_tracking_confidence: float = 0.5,
+        landmark_filter=None,
+        model_complexity: int = 1,
+        detection_scale: float = 1.0,
     ):
-        self.landmark_filter = LandmarkFilter()
+        """:param detection_scale: frames are downscaled by it before detection, landmarks are normalized anyway"""
+        self.landmark_filter = landmark_filter or LandmarkFilter()
+        self.detection_scale = detection_scale
         self._user_perspective = user_perspective
         self._mp_hands = mp.solutions.hands
-        self._hands = self._mp_hands.Hands(
+        self._graph_params = dict(
             static_image_mode=static_image_mode,
             max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
         )
+        self._hands = self._mp_hands.Hands(**self._graph_params)
+        # reconfigure never goes above what the detector was configured with
+        self._max_num_hands = max_num_hands
+        self._max_model_complexity = model_complexity
 
     def __enter__(self):
         return self
@@ -31,16 +41,40 @@ class HandDetector:
 
     def close(self):
         self._hands.close()
+
+    def reconfigure(self, *, model_complexity=None, max_num_hands=None, detection_scale=None):
+        """
+        Changes the detection quality, the graph is only rebuilt if one of its
+        params changed. ``model_complexity`` and ``max_num_hands`` are capped
+        at the values the detector was created with.
+        """
+        if detection_scale is not None:
+            self.detection_scale = detection_scale
+
+        graph_params = dict(self._graph_params)
+        if model_complexity is not None:
+            graph_params["model_complexity"] = min(model_complexity, self._max_model_complexity)
+        if max_num_hands is not None:
+            graph_params["max_num_hands"] = min(max_num_hands, self._max_num_hands)
+        if graph_params != self._graph_params:
+            self._hands.close()
+            self._graph_params = graph_params
+            self._hands = self._mp_hands.Hands(**graph_params)
         
-    def detect(self, frame_bgr):
+    def detect(self, frame_bgr, captured_at=None):
+        """:param captured_at: ``time.perf_counter()`` when the frame was captured, filters time the landmarks by it"""
+        if self.detection_scale < 1.0:
+            frame_bgr = cv2.resize(
+                frame_bgr, None, fx=self.detection_scale, fy=self.detection_scale, interpolation=cv2.INTER_AREA
+            )
         frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
         results = self._hands.process(frame_rgb)
 
-        return self._extract_hands_by_side(results)
+        return self._extract_hands_by_side(results, captured_at)
     
-    def _extract_hands_by_side(self, results):
+    def _extract_hands_by_side(self, results, captured_at=None):
         hands_by_side = {}
-        now = self.filter.check_seen()
+        now = self.landmark_filter.check_seen(captured_at)
 
         if not results.multi_hand_landmarks or not results.multi_handedness:
             return hands_by_side
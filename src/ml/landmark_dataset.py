@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+N_LANDMARKS = 21
+
+
+@dataclass
+class LandmarkDataset:
+    """
+    Columnar set of recorded hands.
+
+    ``landmarks`` has shape (N, 21, 3), ``sides`` and ``labels`` are string
+    arrays of length N. The label is the name of the gesture shown on the
+    recording (e.g. ``"ROCK"``), any label that is not a ``Move`` name is
+    treated as "no move".
+    """
+    landmarks: np.ndarray
+    sides: np.ndarray
+    labels: np.ndarray
+
+    def __len__(self):
+        return len(self.labels)
+
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            landmarks=self.landmarks.astype(np.float32),
+            sides=self.sides.astype(str),
+            labels=self.labels.astype(str),
+        )
+
+    @staticmethod
+    def load(path) -> "LandmarkDataset":
+        with np.load(path, allow_pickle=False) as data:
+            landmarks = data["landmarks"].astype(np.float32)
+            sides = data["sides"].astype(str)
+            labels = data["labels"].astype(str)
+
+        if landmarks.ndim != 3 or landmarks.shape[1:] != (N_LANDMARKS, 3):
+            raise ValueError(f"{path}: expected landmarks of shape (N, 21, 3), got {landmarks.shape}")
+        if not len(landmarks) == len(sides) == len(labels):
+            raise ValueError(f"{path}: landmarks, sides and labels have different lengths")
+
+        return LandmarkDataset(landmarks, sides, labels)
+
+    @staticmethod
+    def concatenate(datasets) -> "LandmarkDataset":
+        datasets = list(datasets)
+        if not datasets:
+            return LandmarkDataset(
+                np.empty((0, N_LANDMARKS, 3), dtype=np.float32),
+                np.empty(0, dtype=str),
+                np.empty(0, dtype=str),
+            )
+
+        return LandmarkDataset(
+            np.concatenate([d.landmarks for d in datasets]),
+            np.concatenate([d.sides for d in datasets]),
+            np.concatenate([d.labels for d in datasets]),
+        )
+
+    @staticmethod
+    def load_many(paths) -> "LandmarkDataset":
+        return LandmarkDataset.concatenate(LandmarkDataset.load(Path(p)) for p in paths)
@@ -0,0 +1,61 @@
+"""
+Trains a GestureModel on recorded landmark datasets.
+
+    python -m src.ml.train_gesture_model data/*.npz -o models/gesture_model.npz
+"""
+import argparse
+import logging
+
+import numpy as np
+
+from src.ml.gesture_model import GestureModel
+from src.ml.landmark_dataset import LandmarkDataset
+
+_logger = logging.getLogger(__name__)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("datasets", nargs="+", help="landmark dataset files (.npz)")
+    parser.add_argument("-o", "--output", required=True, help="where to write the model (.npz)")
+    parser.add_argument("--epochs", type=int, default=500)
+    parser.add_argument("--learning-rate", type=float, default=0.5)
+    parser.add_argument("--l2", type=float, default=1e-4)
+    parser.add_argument("--validation-split", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    dataset = LandmarkDataset.load_many(args.datasets)
+    if len(dataset) == 0:
+        parser.error("datasets are empty")
+    labels, counts = np.unique(dataset.labels, return_counts=True)
+    _logger.info("Loaded %d hands, labels: %s", len(dataset), dict(zip(labels.tolist(), counts.tolist())))
+
+    order = np.random.default_rng(args.seed).permutation(len(dataset))
+    n_validation = int(len(order) * args.validation_split)
+    validation, train = order[:n_validation], order[n_validation:]
+
+    model = GestureModel.fit(
+        dataset.landmarks[train],
+        dataset.sides[train],
+        dataset.labels[train],
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        l2=args.l2,
+    )
+
+    for name, indices in (("train", train), ("validation", validation)):
+        if len(indices) == 0:
+            continue
+        probabilities = model.predict_proba(dataset.landmarks[indices], dataset.sides[indices])
+        accuracy = np.mean(model.classes[probabilities.argmax(axis=1)] == dataset.labels[indices])
+        _logger.info("%s accuracy: %.3f (%d hands)", name, accuracy, len(indices))
+
+    model.save(args.output)
+    _logger.info("Model saved to %s", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Players for the tournament simulator.
+
+Vectorized players play thousands of independent games at once: every
+method works on arrays with one entry per game, moves are indices into
+``MOVES``. Stateful strategies from ``src.core.strategies`` are played one
+game at a time through ``StrategyPlayer``.
+"""
+import numpy as np
+
+from src.core.domain import RoundRecord, evaluate_round
+from src.core.match_history import MatchHistory, MOVES
+
+N_MOVES = len(MOVES)
+
+
+def beating(moves):
+    """The move that beats ``moves`` (in MOVES order every move beats the previous one)."""
+    return (moves + 1) % N_MOVES
+
+
+class VectorPlayer:
+    """
+    Base of vectorized players. ``noise`` is the probability of playing a
+    random move instead, which makes the bots a bit more human.
+    """
+
+    def __init__(self, noise: float = 0.0):
+        self.noise = noise
+
+    def reset(self, n_games, rng: np.random.Generator):
+        self._rng = rng
+        self._n_games = n_games
+        self._round = 0
+        self._own_last = np.zeros(n_games, dtype=np.intp)
+        self._opponent_last = np.zeros(n_games, dtype=np.intp)
+        self._outcome_last = np.zeros(n_games, dtype=np.intp)  # 1 won, -1 lost, 0 draw
+
+    def select(self) -> np.ndarray:
+        moves = self._select()
+        if self.noise:
+            random_moves = self._rng.integers(0, N_MOVES, self._n_games)
+            moves = np.where(self._rng.random(self._n_games) < self.noise, random_moves, moves)
+        return moves
+
+    def observe(self, own, opponent):
+        self._outcome_last = np.where(
+            own == opponent, 0, np.where(own == beating(opponent), 1, -1)
+        )
+        self._own_last = own
+        self._opponent_last = opponent
+        self._round += 1
+
+    def _random_moves(self, weights=None):
+        return self._rng.choice(N_MOVES, size=self._n_games, p=weights)
+
+    def _select(self):
+        raise NotImplementedError
+
+
+class NaivePlayer(VectorPlayer):
+    """NaiveStrategy: every move is drawn from the fixed action weights."""
+
+    def __init__(self, action_weights=(0.25, 0.40, 0.35), **kwargs):
+        super().__init__(**kwargs)
+        self.action_weights = np.asarray(action_weights) / np.sum(action_weights)
+
+    def _select(self):
+        return self._random_moves(self.action_weights)
+
+
+class ResearchBasedPlayer(NaivePlayer):
+    """ResearchBasedStrategy rules applied to all games at once."""
+
+    def reset(self, n_games, rng):
+        super().reset(n_games, rng)
+        self._opponent_streak = np.zeros(n_games, dtype=np.intp)
+
+    def observe(self, own, opponent):
+        repeated = (opponent == self._opponent_last) & (self._round > 0)
+        self._opponent_streak = np.where(repeated, self._opponent_streak + 1, 1)
+        super().observe(own, opponent)
+
+    def _select(self):
+        moves = self._random_moves(self.action_weights)
+        if self._round == 0:
+            return moves
+
+        # won the last round: play the opponent's last move
+        moves = np.where(self._outcome_last == 1, self._opponent_last, moves)
+        # lost the last round: play the move our last move beats
+        moves = np.where(self._outcome_last == -1, (self._own_last + 2) % N_MOVES, moves)
+        # the same move three times in a row: beat it
+        moves = np.where(
+            self._opponent_streak >= min(self._round, 3), beating(self._opponent_last), moves
+        )
+        return moves
+
+
+class BiasedBot(VectorPlayer):
+    """A player with a favourite move."""
+
+    def __init__(self, weights=(0.5, 0.3, 0.2), **kwargs):
+        super().__init__(**kwargs)
+        self.weights = np.asarray(weights) / np.sum(weights)
+
+    def _select(self):
+        return self._random_moves(self.weights)
+
+
+class CyclerBot(VectorPlayer):
+    """Rock, paper, scissors, rock... from a random starting move."""
+
+    def __init__(self, step: int = 1, **kwargs):
+        super().__init__(**kwargs)
+        self.step = step
+
+    def _select(self):
+        if self._round == 0:
+            return self._random_moves()
+        return (self._own_last + self.step) % N_MOVES
+
+
+class WinStayLoseShiftBot(VectorPlayer):
+    """Repeats a winning move, after a loss switches to what beats the opponent's move."""
+
+    def _select(self):
+        moves = self._random_moves()
+        if self._round == 0:
+            return moves
+
+        moves = np.where(self._outcome_last == 1, self._own_last, moves)
+        return np.where(self._outcome_last == -1, beating(self._opponent_last), moves)
+
+
+class BeatLastBot(VectorPlayer):
+    """Plays what would have beaten the opponent's last move."""
+
+    def _select(self):
+        if self._round == 0:
+            return self._random_moves()
+        return beating(self._opponent_last)
+
+
+class StrategyPlayer:
+    """
+    Plays games with a strategy from ``src.core.strategies``. The
+    strategy sees the match from the computer's side, so the opponent is
+    the "player" in its MatchHistory.
+    """
+
+    def __init__(self, strategy_factory):
+        """:param strategy_factory: strategy class, or a callable taking its ``rng``"""
+        self._strategy_factory = strategy_factory
+        self.reset(None)
+
+    def reset(self, rng: np.random.Generator | None):
+        """Starts a new game with a new strategy drawing its random moves from ``rng``."""
+        self.strategy = self._strategy_factory(rng=rng)
+        self._history = MatchHistory()
+
+    def select(self) -> int:
+        return MOVES.index(self.strategy.select_move(self._history))
+
+    def observe(self, own: int, opponent: int):
+        player_move, computer_move = MOVES[opponent], MOVES[own]
+        self._history.append(RoundRecord(
+            round_number=len(self._history),
+            player_move=player_move,
+            computer_move=computer_move,
+            outcome=evaluate_round(player_move, computer_move),
+        ))
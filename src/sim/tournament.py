@@ -0,0 +1,175 @@
+"""
+Round-robin tournament between strategies and synthetic human-like bots.
+
+    python -m src.sim.tournament --games 10000 --rounds 100
+    python -m src.sim.tournament --players research markov biased cycler
+
+Pairs of vectorized players play all their games at once as NumPy arrays.
+Pairs with a stateful strategy are played game by game in a process pool.
+Win rates are averaged over games and reported with 95% confidence
+intervals.
+
+Every match, and every chunk of games within a match, gets its own spawn
+of the ``--seed`` SeedSequence, so results are the same for any number of
+workers.
+"""
+import argparse
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.strategies import MarkovStrategy, IocaineStrategy, ResearchBasedStrategy
+from src.sim.players import (
+    VectorPlayer, StrategyPlayer, NaivePlayer, ResearchBasedPlayer, BiasedBot, CyclerBot,
+    WinStayLoseShiftBot, BeatLastBot, beating,
+)
+
+# name -> factory; factories returning a VectorPlayer are played vectorized
+ROSTER = {
+    "naive": NaivePlayer,
+    "research": ResearchBasedPlayer,
+    "biased": lambda: BiasedBot(noise=0.1),
+    "cycler": lambda: CyclerBot(noise=0.2),
+    "wsls": lambda: WinStayLoseShiftBot(noise=0.2),
+    "beat-last": lambda: BeatLastBot(noise=0.2),
+    "markov": lambda: StrategyPlayer(MarkovStrategy),
+    "iocaine": lambda: StrategyPlayer(IocaineStrategy),
+    "research-py": lambda: StrategyPlayer(ResearchBasedStrategy),
+}
+
+
+@dataclass
+class MatchResult:
+    first: str
+    second: str
+    games: int
+    rounds: int
+    wins: np.ndarray    # per game, of the first player
+    losses: np.ndarray
+    seconds: float
+
+    def rate(self, counts):
+        rates = counts / self.rounds
+        half_width = 1.96 * rates.std(ddof=1) / np.sqrt(self.games) if self.games > 1 else np.nan
+        return rates.mean(), half_width
+
+    def __str__(self):
+        win, win_ci = self.rate(self.wins)
+        loss, loss_ci = self.rate(self.losses)
+        speed = self.games * self.rounds / self.seconds
+        return (
+            f"{self.first:>12} vs {self.second:<12} "
+            f"wins {win:6.1%} ±{win_ci:5.1%}  losses {loss:6.1%} ±{loss_ci:5.1%}  "
+            f"draws {1 - win - loss:6.1%}  {speed:12,.0f} rounds/s"
+        )
+
+
+def _is_vectorized(name):
+    return isinstance(ROSTER[name](), VectorPlayer)
+
+
+def _score(first_moves, second_moves):
+    return first_moves == beating(second_moves), second_moves == beating(first_moves)
+
+
+def play_vectorized(first: VectorPlayer, second: VectorPlayer, games, rounds, rng):
+    first.reset(games, rng)
+    second.reset(games, rng)
+    wins = np.zeros(games, dtype=np.int64)
+    losses = np.zeros(games, dtype=np.int64)
+
+    for _ in range(rounds):
+        first_moves, second_moves = first.select(), second.select()
+        won, lost = _score(first_moves, second_moves)
+        wins += won
+        losses += lost
+        first.observe(first_moves, second_moves)
+        second.observe(second_moves, first_moves)
+
+    return wins, losses
+
+
+def _single_game_player(name, rng):
+    player = ROSTER[name]()
+    if isinstance(player, VectorPlayer):
+        player.reset(1, rng)
+        return _OneOfVector(player)
+    player.reset(rng)
+    return player
+
+
+class _OneOfVector:
+    """Lets a vectorized player take part in a single python game."""
+
+    def __init__(self, player: VectorPlayer):
+        self._player = player
+
+    def select(self):
+        return int(self._player.select()[0])
+
+    def observe(self, own, opponent):
+        self._player.observe(np.array([own]), np.array([opponent]))
+
+
+def _play_games(task):
+    first_name, second_name, games, rounds, seed = task
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(games, dtype=np.int64)
+    losses = np.zeros(games, dtype=np.int64)
+
+    for game in range(games):
+        first = _single_game_player(first_name, rng)
+        second = _single_game_player(second_name, rng)
+        for _ in range(rounds):
+            first_move, second_move = first.select(), second.select()
+            won, lost = _score(first_move, second_move)
+            wins[game] += won
+            losses[game] += lost
+            first.observe(first_move, second_move)
+            second.observe(second_move, first_move)
+
+    return wins, losses
+
+
+def play_match(first, second, games, rounds, seed_sequence, executor=None, chunk_size=25) -> MatchResult:
+    start = time.perf_counter()
+
+    if _is_vectorized(first) and _is_vectorized(second):
+        rng = np.random.default_rng(seed_sequence)
+        wins, losses = play_vectorized(ROSTER[first](), ROSTER[second](), games, rounds, rng)
+    else:
+        chunks = [min(chunk_size, games - i) for i in range(0, games, chunk_size)]
+        seeds = seed_sequence.spawn(len(chunks))
+        tasks = [(first, second, n, rounds, seed) for n, seed in zip(chunks, seeds)]
+        results = list(executor.map(_play_games, tasks)) if executor else [_play_games(t) for t in tasks]
+        wins = np.concatenate([w for w, _ in results])
+        losses = np.concatenate([l for _, l in results])
+
+    return MatchResult(first, second, games, rounds, wins, losses, time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", nargs="+", choices=ROSTER, default=list(ROSTER))
+    parser.add_argument("--games", type=int, default=10_000, help="games per vectorized pair")
+    parser.add_argument("--python-games", type=int, default=200, help="games per pair with a stateful strategy")
+    parser.add_argument("--rounds", type=int, default=100, help="rounds per game")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    pairs = list(itertools.combinations(args.players, 2))
+    seeds = np.random.SeedSequence(args.seed).spawn(len(pairs))
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for (first, second), seed in zip(pairs, seeds):
+            vectorized = _is_vectorized(first) and _is_vectorized(second)
+            games = args.games if vectorized else args.python_games
+            print(play_match(first, second, games, args.rounds, seed, executor), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,20 @@
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QColor
+from html import escape
+from pathlib import Path
+
+from PySide6.QtCore import Qt, QSize, Signal
+from PySide6.QtGui import QColor, QPixmap
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QSizePolicy, QWidget,
+    QPushButton, QSizePolicy, QWidget, QLineEdit,
 )
 from qt_material_icons import MaterialIcon
 
+from src.core.domain import GameSummary
+from src.core.leaderboard import Leaderboard, game_score, MAX_NICKNAME_LENGTH
 from src.ui.screens.screen_base import ScreenBase
 
+_ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+
 
 def _icon_label(name: str, color: str, icon_size: int = 48) -> QLabel:
     """Return a QLabel showing a Material icon pixmap tinted with *color*.
@@ -35,14 +42,22 @@ class GameOverScreen(ScreenBase):
     # Badge right-edge overhangs the circle by half its width
     _OVERHANG = _BADGE_W // 2  # 45 px to the right of circle center
     _WRAPPER_W = _CIRCLE + _OVERHANG  # 157 px — badge fully inside
-    def __init__(self, parent=None):
+
+    # emitted from the leaderboard's writer thread, delivered on the UI thread
+    _score_saved = Signal(object)
+
+    def __init__(self, parent=None, leaderboard: Leaderboard = None):
         """
             The screen shown at the end of the game, displaying the final score and performance summary, and allowing the player to save their score with a nickname. It also shows a QR code linking to the global leaderboard.
         :param parent: It has to be the ContentManager, because the "Restart game" button needs to call the reset_game method of the ContentManager to reset the game state and switch back to the pre-game screen. The parent is also used to inherit the style from the main window.
+        :param leaderboard: where scores are saved, without it the save section and the leaderboard are hidden.
         """
         super().__init__(parent)
 
         self._parent = parent
+        self._leaderboard = leaderboard
+        self._wins = 0
+        self._losses = 0
 
         self.setObjectName("endGameContent")
 
@@ -54,6 +69,11 @@ class GameOverScreen(ScreenBase):
         self._perf_wins_label = QLabel()
         self._perf_losses_label = QLabel()
         self._total_score_label = QLabel()
+        self._stats_label = QLabel()
+        self._name_input = QLineEdit()
+        self._save_button = QPushButton("Save score")
+        self._save_status = QLabel()
+        self._leader_rows = QLabel()
 
         root = QVBoxLayout(self)
         root.setContentsMargins(32, 32, 32, 32)
@@ -69,6 +89,8 @@ class GameOverScreen(ScreenBase):
         cols = QHBoxLayout()
         cols.setSpacing(20)
         cols.addWidget(self._build_score_panel(), 2)
+        if leaderboard is not None:
+            cols.addWidget(self._build_leaderboard_panel(), 1)
         root.addLayout(cols, 1)
 
         root.addLayout(self._build_actions())
@@ -87,20 +109,23 @@ class GameOverScreen(ScreenBase):
         self._subtitle.setText("Review the final score below.")
         self._perf_wins_label.setText("0 Wins × 10 = 0")
         self._perf_losses_label.setText("0 Losses × 5 = -0")
+        self._stats_label.setText("")
         self._total_score_label.setText(
             "<span style='font-size:28px;font-weight:900;color:#0f172a;'>0</span>"
             "<span style='font-size:13px;color:#94a3b8;font-weight:600;'> pts</span>"
         )
-        if hasattr(self, "_name_input"):
-            self._name_input.clear()
+        self._name_input.clear()
+        self._save_button.setEnabled(True)
+        self._save_status.setText("")
 
-    def update_game_over(self, player_score: int, computer_score: int) -> None:
+    def update_game_over(self, player_score: int, computer_score: int, summary: GameSummary | None = None) -> None:
         self._player_score.setText(str(player_score))
         self._computer_score.setText(str(computer_score))
 
-        wins = player_score
-        losses = computer_score
-        total = wins * 10 - losses * 5
+        wins = summary.wins if summary else player_score
+        losses = summary.losses if summary else computer_score
+        total = game_score(wins, losses)
+        self._wins, self._losses = wins, losses
 
         if player_score > computer_score:
             self._title.setText("Victory!")
@@ -130,6 +155,56 @@ class GameOverScreen(ScreenBase):
             f"<span style='font-size:28px;font-weight:900;color:#0f172a;'>{total}</span>"
             f"<span style='font-size:13px;color:#94a3b8;font-weight:600;'> pts</span>"
         )
+        self._stats_label.setText(self._format_stats(summary) if summary else "")
+        self._save_button.setEnabled(True)
+        self._save_status.setText("")
+        self._refresh_leaderboard()
+
+    def _save_score(self) -> None:
+        nickname = self._name_input.text().strip()
+        if not nickname or self._leaderboard is None:
+            return
+        # only queued, the leaderboard writes it on its own thread and resolves the future there
+        future = self._leaderboard.submit(nickname, self._wins, self._losses)
+        future.add_done_callback(
+            lambda f: self._score_saved.emit(None if f.exception() is not None else f.result())
+        )
+        self._save_button.setEnabled(False)
+        self._save_status.setText(f"Saving {game_score(self._wins, self._losses)} pts as {nickname}...")
+
+    def _on_score_saved(self, entry) -> None:
+        if entry is None:
+            self._save_button.setEnabled(True)
+            self._save_status.setText("Could not save the score, try again")
+            return
+        self._save_status.setText(f"Saved {entry.score} pts as {entry.nickname}, rank {entry.rank}")
+        self._refresh_leaderboard()
+
+    def _refresh_leaderboard(self) -> None:
+        if self._leaderboard is None:
+            return
+        rows = [
+            f"<b>{entry.rank}.</b> {escape(entry.nickname)} "
+            f"<span style='color:#94a3b8;'>{entry.score} pts</span>"
+            for entry in self._leaderboard.top_page()
+        ]
+        self._leader_rows.setText("<br>".join(rows) or "No scores yet, be the first!")
+
+    @staticmethod
+    def _format_stats(summary: GameSummary) -> str:
+        """One line of the summary's highlights, the end screen never reads the match history."""
+        parts = [f"{summary.draws} Draws", f"Best streak {summary.longest_win_streak}"]
+
+        favourite = summary.favourite_move()
+        if favourite is not None:
+            win_rate = summary.win_rate_by_move()[favourite]
+            parts.append(f"Favourite {favourite.name.title()} (won {win_rate:.0%})")
+
+        if summary.average_decision_time is not None:
+            parts.append(f"Avg. decision {summary.average_decision_time:.2f} s")
+        if summary.prediction_hit_rate is not None:
+            parts.append(f"AI read you {summary.prediction_hit_rate:.0%}")
+        return " · ".join(parts)
 
     # ------------------------------------------------------------------
     def _build_score_panel(self) -> QFrame:
@@ -145,6 +220,8 @@ class GameOverScreen(ScreenBase):
 
         # Performance summary card
         layout.addWidget(self._build_perf_summary())
+        if self._leaderboard is not None:
+            layout.addWidget(self._build_save_section())
 
         return panel
 
@@ -279,8 +356,12 @@ class GameOverScreen(ScreenBase):
         self._perf_losses_label.setTextFormat(Qt.TextFormat.RichText)
         self._perf_losses_label.setText("0 Losses × 5 = -0")
 
+        self._stats_label.setObjectName("endPerfRow")
+        self._stats_label.setWordWrap(True)
+
         left.addWidget(self._perf_wins_label)
         left.addWidget(self._perf_losses_label)
+        left.addWidget(self._stats_label)
 
         # Right: total score box
         total_box = QFrame()
@@ -301,6 +382,74 @@ class GameOverScreen(ScreenBase):
         layout.addWidget(total_box, 0, Qt.AlignmentFlag.AlignVCenter)
         return card
 
+    def _build_save_section(self) -> QFrame:
+        section = QFrame()
+        section.setObjectName("endAdminSection")
+        layout = QVBoxLayout(section)
+        layout.setContentsMargins(0, 16, 0, 0)
+        layout.setSpacing(8)
+
+        label = QLabel("Save your score")
+        label.setObjectName("endAdminLabel")
+
+        row = QHBoxLayout()
+        row.setSpacing(12)
+        self._name_input.setObjectName("endNameInput")
+        self._name_input.setPlaceholderText("Nickname")
+        self._name_input.setMaxLength(MAX_NICKNAME_LENGTH)
+        self._name_input.setFixedHeight(44)
+        self._name_input.returnPressed.connect(self._save_score)
+        self._save_button.setObjectName("endSaveButton")
+        self._save_button.setFixedHeight(44)
+        self._save_button.clicked.connect(self._save_score)
+        self._score_saved.connect(self._on_score_saved)
+        row.addWidget(self._name_input, 1)
+        row.addWidget(self._save_button)
+
+        self._save_status.setObjectName("endPerfRow")
+        self._save_status.setTextFormat(Qt.TextFormat.PlainText)
+
+        layout.addWidget(label)
+        layout.addLayout(row)
+        layout.addWidget(self._save_status)
+        return section
+
+    def _build_leaderboard_panel(self) -> QFrame:
+        panel = QFrame()
+        panel.setObjectName("endLeaderboardPanel")
+        layout = QVBoxLayout(panel)
+        layout.setContentsMargins(28, 28, 28, 28)
+        layout.setSpacing(12)
+
+        title = QLabel("Leaderboard")
+        title.setObjectName("endLeaderTitle")
+        subtitle = QLabel("Scan to see all scores")
+        subtitle.setObjectName("endLeaderSubtitle")
+
+        self._leader_rows.setObjectName("endPerfRow")
+        self._leader_rows.setTextFormat(Qt.TextFormat.RichText)
+        self._leader_rows.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+
+        qr_box = QFrame()
+        qr_box.setObjectName("endQrBox")
+        qr_layout = QVBoxLayout(qr_box)
+        qr_layout.setContentsMargins(12, 12, 12, 12)
+        qr = QLabel()
+        qr.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        qr.setPixmap(QPixmap(str(_ASSETS_DIR / "qr_code.png")).scaled(
+            QSize(120, 120),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        ))
+        qr_layout.addWidget(qr)
+
+        layout.addWidget(title)
+        layout.addWidget(subtitle)
+        layout.addWidget(self._leader_rows, 1)
+        layout.addWidget(qr_box, 0, Qt.AlignmentFlag.AlignHCenter)
+        self._refresh_leaderboard()
+        return panel
+
     def _build_actions(self) -> QHBoxLayout:
         actions = QHBoxLayout()
         actions.setSpacing(16)
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
 from src.core.domain import Outcome, Move
 from src.ui.components.game_panel import GamePanel
 from src.ui.screens.screen_base import ScreenBase
-from src.ui.utils.bridge import EventGameRoundResult
+from src.ui.utils.bridge import EventGameRoundResult, frame_pixmap
 
 
 class GameScreen(ScreenBase):
@@ -158,7 +158,7 @@ class GameScreen(ScreenBase):
             self._set_ai_move_icon(data.round_record.computer_move)
         if self._player_panel is not None:
             self._player_panel.set_detected_text(data.round_record.player_move.name.upper())
-            self._player_panel.set_frame(data.get_pixmap())
+            self._player_panel.set_frame(frame_pixmap(data.frame))
 
     # ------------------------------------------------------------------
     def _save_current_title_and_subtitle(self) -> None:
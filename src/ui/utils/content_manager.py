@@ -1,21 +1,26 @@
+import logging
 import time
 
 from PySide6.QtWidgets import QWidget, QStackedLayout
 
+from src.core.domain import GameSummary
 from src.core.game_controller import GameController
+from src.core.leaderboard import Leaderboard
 from src.ui.components.camera import CameraFrame
 from src.ui.screens.game_over_screen import GameOverScreen
 from src.ui.screens.game_screen import GameScreen
 from src.ui.screens.pre_game_screen import PreGameScreen
 from src.ui.screens.screen_base import ScreenBase
-from src.ui.utils.bridge import EventFrameChanged, EventGameRoundResult
+from src.ui.utils.bridge import EventFrameChanged, EventGameRoundResult, mirror_frame, frame_pixmap
 from src.ui.utils.type_of_screen import TypeOfScreen
 from src.ui.utils.visualizer import AnnotationsVisualizer
 
+_logger = logging.getLogger(__name__)
+
 
 class ContentManager(QWidget):
     def __init__(self, parent=None, /, show_ai_analytics: bool = False, game_controller: GameController = None,
-                 mirror_camera: bool = True):
+                 mirror_camera: bool = True, leaderboard: Leaderboard = None):
         super().__init__(parent)
 
         self._show_ai_analytics = show_ai_analytics
@@ -37,7 +42,7 @@ class ContentManager(QWidget):
             TypeOfScreen.BEFORE_START: PreGameScreen(self._camera_frame, self),
             TypeOfScreen.DURING_ROUND: GameScreen(self),
             TypeOfScreen.RESULT_OF_ROUND: GameScreen(self, during_round=False),
-            TypeOfScreen.END_OF_GAME: GameOverScreen(self),
+            TypeOfScreen.END_OF_GAME: GameOverScreen(self, leaderboard=leaderboard),
         }
 
         added = set()
@@ -74,7 +79,7 @@ class ContentManager(QWidget):
             screen = self._screens.get(self._type_of_screen)
             if screen is not None:
                 if self._mirror_camera:
-                    data.mirror_frame()
+                    mirror_frame(data)
 
                 if self._show_ai_analytics:
                     self._update_fps()
@@ -82,7 +87,7 @@ class ContentManager(QWidget):
                     data.frame = self._visualizer.render(data.frame, data.detected_hands,
                                                          mirror_display=self._mirror_camera)
 
-                screen.update_frame(data.get_pixmap())
+                screen.update_frame(frame_pixmap(data.frame))
         finally:
             self._frame_pending = False
 
@@ -123,15 +128,20 @@ class ContentManager(QWidget):
         screen = self._screens.get(TypeOfScreen.RESULT_OF_ROUND)
         if screen is not None and isinstance(screen, GameScreen):
             if self._mirror_camera:
-                data.mirror_frame()
+                mirror_frame(data)
             screen.on_game_round_result(data)
+            if data.stamp is not None and self._game_controller is not None:
+                # paint now instead of on the next event loop pass, the result is on screen after this
+                screen.repaint()
+                latency = time.perf_counter() - data.stamp.captured_at
+                self._game_controller.report_result_latency(data.stamp.frame_id, latency)
         else:
-            print("No screen found for round result update.")
+            _logger.warning("No screen found for round result update.")
 
-    def update_game_over(self, player_score: int, computer_score: int) -> None:
+    def update_game_over(self, player_score: int, computer_score: int, summary: GameSummary | None = None) -> None:
         screen = self._screens.get(TypeOfScreen.END_OF_GAME)
         if screen is not None and isinstance(screen, GameOverScreen):
-            screen.update_game_over(player_score, computer_score)
+            screen.update_game_over(player_score, computer_score, summary)
 
     def change_content(self, new_type: TypeOfScreen):
         if self._type_of_screen == new_type:
@@ -142,8 +152,9 @@ class ContentManager(QWidget):
 
     def reset_game(self):
         self._camera_frame.reset()
+        # both only queued, the controller thread applies them in order
         self._game_controller.reset()
-        self._game_controller.set_stop_detection(False)
+        self._game_controller.resume()
         for screen in self._screens.values():
             screen.reset()
 
@@ -7,9 +7,10 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget,
 )
 
-from src.core.domain import ThumbDirection
+from src.core.domain import SyncPhase, SyncStatus, ThumbDirection
 from src.core.game_controller import GameController
-from src.core.game_state import GameState
+from src.core.game_state import GameConfig, GameState
+from src.core.leaderboard import Leaderboard
 from src.ui.components.bottom import Bottom
 from src.ui.components.header import Header
 from src.ui.utils.bridge import EventScoreChanged, EventGameIdle, EventGameCountdown, EventGameRoundActive, \
@@ -23,12 +24,13 @@ _logger = logging.getLogger(__name__)
 
 class Window(QMainWindow):
     def __init__(self, game_controller: GameController, /, *, show_ai_analytics: bool = False,
-                 mirror_camera: bool = True):
+                 mirror_camera: bool = True, leaderboard: Leaderboard = None):
         super().__init__()
 
         self._show_ai_analytics = show_ai_analytics
         self._mirror_camera = mirror_camera
         self._game_controller = game_controller
+        self._leaderboard = leaderboard
 
         self.setWindowTitle("SINUZ - Kamień Papier Nożyce")
         self.resize(1280, 800)
@@ -51,6 +53,7 @@ class Window(QMainWindow):
             show_ai_analytics=self._show_ai_analytics,
             game_controller=self._game_controller,
             mirror_camera=self._mirror_camera,
+            leaderboard=self._leaderboard,
         )
         self._bottom = Bottom(central)
 
@@ -100,10 +103,20 @@ class Window(QMainWindow):
         if during_round_screen is not None:
             during_round_screen.show_alert(
                 title=f"Round starts in {data.count_down_time}...",
-                subtitle=f"Get ready!",
+                subtitle=self._sync_hint(data.sync_status),
                 duration=1000,
             )
 
+    @staticmethod
+    def _sync_hint(status: SyncStatus | None) -> str:
+        if status is None:
+            return "Get ready!"
+        if status.phase == SyncPhase.LOCKING:
+            return "Shoot!"
+        if status.phase == SyncPhase.SHAKING:
+            return f"Rock, paper, scissors... {status.cycles}/{GameConfig.SHAKE_CYCLES}"
+        return "Pump your fist to play along"
+
     def on_game_round_active(self, data: EventGameRoundActive):
         _logger.debug("Game round active: %s", data)
         self._content.change_content(TypeOfScreen.DURING_ROUND)
@@ -116,8 +129,8 @@ class Window(QMainWindow):
     def on_game_over(self, data: EventGameOver):
         _logger.debug("Game over: %s", data)
         self._content.change_content(TypeOfScreen.END_OF_GAME)
-        self._content.update_game_over(data.player_score, data.computer_score)
-        self._game_controller.set_stop_detection(True)
+        self._content.update_game_over(data.player_score, data.computer_score, data.summary)
+        self._game_controller.pause()
 
     def on_score_change(self, data: EventScoreChanged):
         _logger.debug("Player score: %s  Computer score: %s", data.player_score, data.computer_score)
@@ -133,4 +146,6 @@ class Window(QMainWindow):
     def closeEvent(self, event):
         if getattr(self, "_game_controller", None) is not None:
             self._game_controller.close()
+        if getattr(self, "_leaderboard", None) is not None:
+            self._leaderboard.close()
         super().closeEvent(event)
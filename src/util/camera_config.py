@@ -0,0 +1,271 @@
+"""
+Opens cameras in their lowest-latency mode.
+
+The modes a camera supports are probed once and cached in
+``camera_modes.json`` by device identity, probing costs a few seconds
+because every mode change restarts the camera's stream. The chosen mode is
+the smallest one meeting the CaptureRequest, with a one frame buffer so a
+read returns the newest frame instead of a queued one.
+
+    python -m src.util.camera_config 0     # probe again and measure camera 0
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+import cv2
+
+# Resolve the cache relative to the project root, next to config.json
+DEFAULT_CAMERA_CACHE_PATH = Path(__file__).resolve().parents[2] / "camera_modes.json"
+
+_CANDIDATE_SIZES = ((1920, 1080), (1280, 720), (960, 540), (800, 600), (640, 480), (424, 240), (320, 240))
+_CANDIDATE_FOURCCS = ("MJPG", "YUYV")
+_FOURCC_ALIASES = {"YUY2": "YUYV"}     # DirectShow's name of the same format
+_PROBE_FPS = 60.0               # asked for while probing, the driver answers with the best it has
+_RAW_BANDWIDTH = 20_000_000     # bytes/s of uncompressed YUYV a USB 2 camera delivers reliably
+_MEASURED_FRAMES = 30
+_WARM_UP_FRAMES = 5
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CaptureRequest:
+    """The worst mode the game can work with, from config.json's ``capture``."""
+    width: int = 640
+    height: int = 480
+    fps: float = 30.0
+
+    @staticmethod
+    def from_json(data) -> "CaptureRequest":
+        return CaptureRequest(**data) if data else CaptureRequest()
+
+    def to_json(self):
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class CameraMode:
+    width: int
+    height: int
+    fps: float
+    fourcc: str
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+    def meets(self, request: CaptureRequest) -> bool:
+        return self.width >= request.width and self.height >= request.height and self.fps >= request.fps
+
+    def __str__(self):
+        return f"{self.width}x{self.height} {self.fourcc} @ {self.fps:g} fps"
+
+
+def open_camera(index: int, request: CaptureRequest = CaptureRequest(), cache_path=DEFAULT_CAMERA_CACHE_PATH,
+                measure: bool = True) -> cv2.VideoCapture:
+    """
+    Opens camera ``index`` in the lowest-latency mode meeting ``request``,
+    probing its modes on first use. With ``measure`` the achieved frame
+    rate and read latency are logged.
+    """
+    backend = _preferred_backend()
+    cap = cv2.VideoCapture(index, backend)
+    if not cap.isOpened() and backend != cv2.CAP_ANY:
+        cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        _logger.error("Could not open camera %d", index)
+        return cap
+
+    identity = _device_identity(index, cap)
+    modes = _cached_modes(cache_path, identity)
+    if modes is None:
+        _logger.info("Probing the modes of camera %d (%s), this happens once", index, identity)
+        modes = probe_modes(cap)
+        _store_modes(cache_path, identity, modes)
+
+    mode = select_mode(modes, request)
+    if mode is None:
+        _logger.warning("Camera %d reported no modes, keeping its defaults", index)
+    else:
+        apply_mode(cap, mode)
+    # a single buffered frame, reads return the newest frame (not every backend supports it)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    if measure:
+        fps, read_latency = measure_capture(cap)
+        _logger.info(
+            "Camera %d (%s, %s): %s, %.1f fps achieved, %.1f ms median read",
+            index, identity, cap.getBackendName(), mode or "default mode", fps, read_latency * 1000
+        )
+    return cap
+
+
+def probe_modes(cap: cv2.VideoCapture) -> list[CameraMode]:
+    """Modes the camera accepts, as the driver reports them back after setting them."""
+    modes = set()
+    for fourcc in _CANDIDATE_FOURCCS:
+        for width, height in _CANDIDATE_SIZES:
+            mode = apply_mode(cap, CameraMode(width, height, _PROBE_FPS, fourcc))
+            if mode is not None:
+                modes.add(mode)
+    return sorted(modes, key=lambda m: (m.pixels, m.fps, m.fourcc))
+
+
+def apply_mode(cap: cv2.VideoCapture, mode: CameraMode) -> CameraMode | None:
+    """Sets ``mode`` and returns the mode the camera actually switched to, None if it kept another format."""
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+    cap.set(cv2.CAP_PROP_FPS, mode.fps)
+
+    fourcc = _fourcc_name(cap.get(cv2.CAP_PROP_FOURCC))
+    fourcc = _FOURCC_ALIASES.get(fourcc, fourcc)
+    if fourcc != mode.fourcc:
+        return None
+    return CameraMode(
+        width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        fps=round(cap.get(cv2.CAP_PROP_FPS), 2),
+        fourcc=fourcc,
+    )
+
+
+def select_mode(modes, request: CaptureRequest) -> CameraMode | None:
+    """
+    The fewest pixels meeting the request (fewer to transfer, decode and
+    downscale), then the highest frame rate (a shorter wait for the next
+    frame), then uncompressed if the USB bus can carry it (no decoding).
+    Without a mode meeting the request, the one coming closest.
+    """
+    if not modes:
+        return None
+
+    def latency_key(mode):
+        raw_fits = mode.pixels * 2 * mode.fps <= _RAW_BANDWIDTH
+        prefers_format = (mode.fourcc == "YUYV") == raw_fits
+        return mode.pixels, -mode.fps, not prefers_format
+
+    candidates = [mode for mode in modes if mode.meets(request)]
+    if candidates:
+        return min(candidates, key=latency_key)
+
+    def shortfall(mode):
+        return min(mode.fps / request.fps, 1.0) + min(mode.pixels / (request.width * request.height), 1.0)
+    best = max(shortfall(mode) for mode in modes)
+    return min((mode for mode in modes if shortfall(mode) == best), key=latency_key)
+
+
+def measure_capture(cap: cv2.VideoCapture, frames: int = _MEASURED_FRAMES) -> tuple[float, float]:
+    """Achieved frames per second and median time blocked in ``read``, in seconds."""
+    for _ in range(_WARM_UP_FRAMES):
+        cap.read()
+
+    reads = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        t = time.perf_counter()
+        ok, _frame = cap.read()
+        if not ok:
+            break
+        reads.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+
+    if not reads or elapsed <= 0:
+        return 0.0, 0.0
+    return len(reads) / elapsed, statistics.median(reads)
+
+
+def _preferred_backend():
+    # MSMF buffers several frames on Windows, DirectShow honours MJPG and the buffer size
+    if sys.platform.startswith("linux"):
+        return cv2.CAP_V4L2
+    if sys.platform == "win32":
+        return cv2.CAP_DSHOW
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def _device_identity(index, cap):
+    """Name and USB port of the device where the OS tells them, so a cache entry follows the camera."""
+    sysfs = Path(f"/sys/class/video4linux/video{index}")
+    try:
+        name = (sysfs / "name").read_text().strip()
+        port = (sysfs / "device").resolve().name
+        return f"{name}@{port}"
+    except OSError:
+        return f"{cap.getBackendName() if cap.isOpened() else 'camera'}:{index}"
+
+
+def _fourcc_name(code):
+    code = int(code)
+    return "".join(chr((code >> 8 * i) & 0xFF) for i in range(4))
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _cached_modes(cache_path, identity):
+    entry = _load_cache(cache_path).get(identity)
+    if entry is None:
+        return None
+    return [CameraMode(**mode) for mode in entry["modes"]]
+
+
+def _store_modes(cache_path, identity, modes):
+    cache = _load_cache(cache_path)
+    cache[identity] = {"probed_at": time.time(), "modes": [asdict(mode) for mode in modes]}
+    try:
+        _write_cache(cache_path, cache)
+    except OSError:
+        _logger.exception("Could not cache the camera modes in %s", cache_path)
+
+
+def _write_cache(cache_path, cache):
+    cache_path = Path(cache_path)
+    # write under a temporary name, so that a killed run can't leave a broken cache
+    tmp_file = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(cache, f, indent=4)
+    os.replace(tmp_file, cache_path)
+
+
+def main(argv=None):
+    defaults = CaptureRequest()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("index", type=int, nargs="?", default=0)
+    parser.add_argument("--width", type=int, default=defaults.width)
+    parser.add_argument("--height", type=int, default=defaults.height)
+    parser.add_argument("--fps", type=float, default=defaults.fps)
+    parser.add_argument("--cache", default=str(DEFAULT_CAMERA_CACHE_PATH))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    cap = cv2.VideoCapture(args.index, _preferred_backend())
+    identity = _device_identity(args.index, cap)
+    cap.release()
+    # forget the cached modes of this camera, open_camera probes them again
+    cache = _load_cache(args.cache)
+    if cache.pop(identity, None) is not None:
+        _write_cache(args.cache, cache)
+
+    cap = open_camera(args.index, CaptureRequest(args.width, args.height, args.fps), args.cache)
+    cap.release()
+    for mode in _cached_modes(args.cache, identity) or ():
+        _logger.info("Camera %d supports %s", args.index, mode)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@ import json
 from pathlib import Path
 from typing import Optional
 
+from src.util.camera_config import CaptureRequest
+from src.util.plugins import PluginConfig, STRATEGIES, CLASSIFIERS, FILTERS, DETECTORS
+
 # Resolve config.json relative to the project root (two levels up from this file)
 _CONFIG_PATH = Path(__file__).resolve().parents[2] / "config.json"
 
@@ -12,6 +15,14 @@ class Config:
         self.detection_camera: int = 0
         self.showing_camera: Optional[int] = None
         self.mirror_camera: bool = True
+        self.leaderboard_port: Optional[int] = None
+        self.adaptive_quality: bool = True
+        self.early_move_prediction: bool = False
+        self.capture = CaptureRequest()
+        self.strategy = PluginConfig(STRATEGIES.default)
+        self.classifier = PluginConfig(CLASSIFIERS.default)
+        self.landmark_filter = PluginConfig(FILTERS.default)
+        self.detector = PluginConfig(DETECTORS.default)
 
     def _create_config_file(self):
         with open(_CONFIG_PATH, "w") as f:
@@ -20,6 +31,14 @@ class Config:
                 "detection_camera_index": self.detection_camera,
                 "showing_camera_index": self.showing_camera,
                 "mirror_camera": self.mirror_camera,
+                "leaderboard_port": self.leaderboard_port,
+                "adaptive_quality": self.adaptive_quality,
+                "early_move_prediction": self.early_move_prediction,
+                "capture": self.capture.to_json(),
+                "strategy": self.strategy.to_json(),
+                "classifier": self.classifier.to_json(),
+                "landmark_filter": self.landmark_filter.to_json(),
+                "detector": self.detector.to_json(),
             }, f, indent=4)
 
     @staticmethod
@@ -32,6 +51,14 @@ class Config:
             config.detection_camera = data.get("detection_camera_index", 0)
             config.showing_camera = data.get("showing_camera_index", None)
             config.mirror_camera = data.get("mirror_camera", True)
+            config.leaderboard_port = data.get("leaderboard_port", None)
+            config.adaptive_quality = data.get("adaptive_quality", True)
+            config.early_move_prediction = data.get("early_move_prediction", False)
+            config.capture = CaptureRequest.from_json(data.get("capture"))
+            config.strategy = PluginConfig.from_json(data.get("strategy"), STRATEGIES.default)
+            config.classifier = PluginConfig.from_json(data.get("classifier"), CLASSIFIERS.default)
+            config.landmark_filter = PluginConfig.from_json(data.get("landmark_filter"), FILTERS.default)
+            config.detector = PluginConfig.from_json(data.get("detector"), DETECTORS.default)
             return config
         except FileNotFoundError:
             config = Config()
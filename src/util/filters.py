@@ -10,8 +10,10 @@ class BaseFilter:
     self._filters = {"Left": None, "Right": None}
     self._last_seen = {"Left": 0.0, "Right": 0.0}
 
-  def check_seen(self):
-    now = time.perf_counter()
+  def check_seen(self, now=None):
+    #now is the frame's capture time if the caller knows it
+    if now is None:
+      now = time.perf_counter()
 
     for side in ["Left", "Right"]:
       if now - self._last_seen.get(side, 0) > self.timeout:
@@ -114,9 +116,9 @@ class OneEuroFilter(BaseFilter):
 
   def _smooth_point(self, state, x, y, z, t):
     return (
-      self._filter_scalar(state.setdefault("x", {}), x, t),
-      self._filter_scalar(state.setdefault("y", {}), y, t),
-      self._filter_scalar(state.setdefault("z", {}), z, t),
+      self._filter_scalar(state.setdefault("x", self._make_state()), x, t),
+      self._filter_scalar(state.setdefault("y", self._make_state()), y, t),
+      self._filter_scalar(state.setdefault("z", self._make_state()), z, t),
     )
 
 class SimpleFilter(BaseFilter):
@@ -145,9 +147,9 @@ class SimpleFilter(BaseFilter):
 
   def _smooth_point(self, state, x, y, z, t):
     return (
-      self._filter_scalar(state.setdefault("x", {}), x),
-      self._filter_scalar(state.setdefault("y", {}), y),
-      self._filter_scalar(state.setdefault("z", {}), z),
+      self._filter_scalar(state.setdefault("x", self._make_state()), x),
+      self._filter_scalar(state.setdefault("y", self._make_state()), y),
+      self._filter_scalar(state.setdefault("z", self._make_state()), z),
     )
 
 class NoFilter(BaseFilter):
@@ -0,0 +1,93 @@
+import importlib
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class PluginConfig:
+    """Plugin selected in config.json: ``{"name": "...", "params": {...}}``."""
+    name: str
+    params: dict = field(default_factory=dict)
+
+    @staticmethod
+    def from_json(data, default_name) -> "PluginConfig":
+        if data is None:
+            return PluginConfig(default_name)
+        if isinstance(data, str):
+            return PluginConfig(data)
+        return PluginConfig(data.get("name", default_name), dict(data.get("params", {})))
+
+    def to_json(self):
+        return {"name": self.name, "params": self.params}
+
+
+@dataclass(frozen=True)
+class Plugin:
+    name: str
+    target: str                # "module:attribute", imported on first use
+    expected_cost_ms: float    # expected time of one call on a kiosk laptop
+    params: dict = field(default_factory=dict)
+
+    def load(self):
+        module_name, attribute = self.target.split(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def create(self, **params):
+        return self.load()(**{**self.params, **params})
+
+
+class Registry:
+    def __init__(self, kind: str, default: str):
+        self.kind = kind
+        self.default = default
+        self._plugins: dict[str, Plugin] = {}
+
+    def register(self, name, target, *, expected_cost_ms, **params):
+        self._plugins[name] = Plugin(name, target, expected_cost_ms, params)
+
+    def get(self, name) -> Plugin:
+        try:
+            return self._plugins[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown {self.kind} '{name}', available: {', '.join(self._plugins)}"
+            ) from None
+
+    def create(self, config: PluginConfig, **params):
+        """Creates the plugin with params from the config, ``params`` override them."""
+        return self.get(config.name).create(**{**config.params, **params})
+
+    def __iter__(self):
+        return iter(self._plugins.values())
+
+
+# the cost is per select_move
+STRATEGIES = Registry("strategy", default="research")
+STRATEGIES.register("naive", "src.core.strategies:NaiveStrategy", expected_cost_ms=0.005)
+STRATEGIES.register("research", "src.core.strategies:ResearchBasedStrategy", expected_cost_ms=0.005)
+STRATEGIES.register("markov", "src.core.strategies:MarkovStrategy", expected_cost_ms=0.03)
+STRATEGIES.register("iocaine", "src.core.strategies:IocaineStrategy", expected_cost_ms=0.3)
+
+# the cost is per determine_move
+CLASSIFIERS = Registry("classifier", default="vector")
+CLASSIFIERS.register("rules", "src.ml.gesture_classifier:GestureClassifier", expected_cost_ms=0.02)
+CLASSIFIERS.register("vector", "src.ml.gesture_classifier:VectorBasedClassifier", expected_cost_ms=0.05)
+CLASSIFIERS.register("learned", "src.ml.gesture_classifier:LearnedClassifier", expected_cost_ms=0.1)
+
+# the cost is per smoothen of one hand
+FILTERS = Registry("landmark filter", default="none")
+FILTERS.register("none", "src.util.filters:NoFilter", expected_cost_ms=0.001)
+FILTERS.register("simple", "src.util.filters:SimpleFilter", expected_cost_ms=0.08)
+FILTERS.register("one_euro", "src.util.filters:OneEuroFilter", expected_cost_ms=0.2)
+
+# the cost is per detect of one frame
+DETECTORS = Registry("detector", default="mediapipe")
+DETECTORS.register(
+    "mediapipe", "src.ml.hand_detector:HandDetector", expected_cost_ms=20.0,
+    user_perspective=True, static_image_mode=False, max_num_hands=2,
+    min_detection_confidence=0.7, min_tracking_confidence=0.5,
+)
+DETECTORS.register(
+    "mediapipe_single_hand", "src.ml.hand_detector:HandDetector", expected_cost_ms=12.0,
+    user_perspective=True, static_image_mode=False, max_num_hands=1,
+    min_detection_confidence=0.7, min_tracking_confidence=0.5,
+)
@@ -0,0 +1,360 @@
+"""
+Leaderboard over HTTP for the phones scanning the end screen's QR code.
+
+    python -m src.web.leaderboard_server --port 8080
+
+Routes: ``/`` (HTML page), ``/api/top?n=10&since=<unix time>`` and
+``/api/rank?score=<score>`` (JSON). Plain asyncio, no dependencies.
+
+Responses are cached for ``cache_ttl`` seconds and carry an ETag, so a
+crowd refreshing the page costs one database query per TTL and mostly 304s.
+Concurrent misses of the same URL share one query, and queries run on a
+small thread pool so the event loop never waits on SQLite.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html import escape
+from urllib.parse import urlsplit, parse_qs
+
+from src.core.leaderboard import Leaderboard, DEFAULT_LEADERBOARD_PATH
+
+MAX_TOP = 100
+_MAX_HEADER_BYTES = 8 * 1024
+_KEEP_ALIVE_TIMEOUT = 5.0
+_MAX_CACHED_RESPONSES = 1024
+_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            500: "Internal Server Error"}
+
+_logger = logging.getLogger(__name__)
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    content_type: str
+    etag: str
+    expires_at: float
+
+
+class LeaderboardServer:
+    def __init__(
+            self,
+            leaderboard: Leaderboard,
+            host: str = "0.0.0.0",
+            port: int = 8080,
+            cache_ttl: float = 2.0,
+            query_workers: int = 2,
+    ):
+        self.leaderboard = leaderboard
+        self.host = host
+        self.port = port
+        self.cache_ttl = cache_ttl
+
+        self._query_workers = query_workers
+        self._executor = ThreadPoolExecutor(max_workers=query_workers, thread_name_prefix="leaderboard-query")
+        self._cache: dict[str, CachedResponse] = {}
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._server = None
+        self._loop = None
+        self._thread = None
+
+    async def serve(self):
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=_MAX_HEADER_BYTES
+        )
+        # port 0 picks a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+        _logger.info("Leaderboard served on http://%s:%d", self.host, self.port)
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self):
+        """Runs the server on its own event loop in a daemon thread, next to the game."""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.call_soon(started.set)
+            try:
+                self._loop.run_until_complete(self.serve())
+            except asyncio.CancelledError:
+                pass
+            finally:
+                # keep-alive connections still wait for their next request, end them on the loop
+                pending = asyncio.all_tasks(self._loop)
+                if pending:
+                    for task in pending:
+                        task.cancel()
+                    self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="leaderboard-server", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        self._close_query_connections()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _close_query_connections(self, timeout=1.0):
+        # a sqlite connection can only be closed by its own thread: one task per worker,
+        # held at a barrier until every worker has one
+        barrier = threading.Barrier(self._query_workers, timeout=timeout)
+
+        def close_connection():
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                # a worker is stuck in a query, the others still close theirs
+                pass
+            self.leaderboard.close_connection()
+
+        futures = [self._executor.submit(close_connection) for _ in range(self._query_workers)]
+        for future in futures:
+            future.result(timeout=timeout * 2)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), _KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    return
+
+                keep_alive = False
+                try:
+                    method, target, version, headers = self._parse_head(head)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                    if method not in ("GET", "HEAD"):
+                        raise HttpError(405, "only GET and HEAD are supported")
+                    response = await self._response(target)
+                except HttpError as e:
+                    # the request may have a body (a POST answered with 405) that was never read,
+                    # the next request can't be found after it
+                    keep_alive = False
+                    self._write_error(writer, e, keep_alive)
+                except Exception:
+                    # e.g. the database failing, the client gets an answer and the server keeps running
+                    _logger.exception("Could not answer %r", head.split(b"\r\n", 1)[0])
+                    keep_alive = False
+                    self._write_error(writer, HttpError(500, "internal server error"), keep_alive)
+                else:
+                    if headers.get("if-none-match") == response.etag:
+                        self._write(writer, 304, response, keep_alive, send_body=False)
+                    else:
+                        self._write(writer, 200, response, keep_alive, send_body=method != "HEAD")
+                await writer.drain()
+
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head):
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            raise HttpError(400, "malformed request line") from None
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        return method, target, version, headers
+
+    async def _response(self, target) -> CachedResponse:
+        url = urlsplit(target)
+        key = url.path + "?" + url.query
+        cached = self._cache.get(key)
+        if cached is not None and cached.expires_at > time.monotonic():
+            return cached
+
+        # everyone missing the same URL at the same time waits for one query
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self._render(url.path, parse_qs(url.query))
+            self._store(key, response)
+            future.set_result(response)
+            return response
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # nobody else may be waiting, don't warn about a never retrieved exception
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+    def _store(self, key, response):
+        if len(self._cache) >= _MAX_CACHED_RESPONSES:
+            # e.g. many different ranks asked for, keep the memory bounded
+            now = time.monotonic()
+            self._cache = {k: cached for k, cached in self._cache.items() if cached.expires_at > now}
+            if len(self._cache) >= _MAX_CACHED_RESPONSES:
+                self._cache.clear()
+        self._cache[key] = response
+
+    async def _render(self, path, query) -> CachedResponse:
+        loop = asyncio.get_running_loop()
+
+        if path == "/api/top":
+            n = min(_int_param(query, "n", 10), MAX_TOP)
+            if n < 1:
+                raise HttpError(400, "n must be at least 1")
+            since = _float_param(query, "since")
+            entries = await loop.run_in_executor(self._executor, self.leaderboard.top, n, since)
+            return self._cache_entry(json.dumps([_entry_json(entry) for entry in entries]), "application/json")
+
+        if path == "/api/rank":
+            score = _int_param(query, "score")
+            rank = await loop.run_in_executor(self._executor, self.leaderboard.rank, score)
+            return self._cache_entry(json.dumps({"score": score, "rank": rank}), "application/json")
+
+        if path in ("/", "/index.html"):
+            entries = await loop.run_in_executor(self._executor, self.leaderboard.top, MAX_TOP)
+            return self._cache_entry(_render_page(entries), "text/html; charset=utf-8")
+
+        raise HttpError(404, f"no such page: {path}")
+
+    def _cache_entry(self, text, content_type):
+        body = text.encode("utf-8")
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        return CachedResponse(body, content_type, etag, time.monotonic() + self.cache_ttl)
+
+    def _write(self, writer, status, response, keep_alive, send_body):
+        writer.write((
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: {response.content_type}\r\n"
+            f"Content-Length: {len(response.body) if status == 200 else 0}\r\n"
+            f"ETag: {response.etag}\r\n"
+            f"Cache-Control: public, max-age={int(self.cache_ttl)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        ).encode("latin-1") + (response.body if send_body else b""))
+
+    @staticmethod
+    def _write_error(writer, error, keep_alive):
+        body = json.dumps({"error": str(error)}).encode("utf-8")
+        writer.write((
+            f"HTTP/1.1 {error.status} {_REASONS[error.status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        ).encode("latin-1") + body)
+
+
+def _int_param(query, name, default=None):
+    values = query.get(name)
+    if not values:
+        if default is None:
+            raise HttpError(400, f"missing parameter: {name}")
+        return default
+    try:
+        return int(values[0])
+    except ValueError:
+        raise HttpError(400, f"{name} must be an integer") from None
+
+
+def _float_param(query, name):
+    values = query.get(name)
+    if not values:
+        return None
+    try:
+        return float(values[0])
+    except ValueError:
+        raise HttpError(400, f"{name} must be a number") from None
+
+
+def _entry_json(entry):
+    return {
+        "rank": entry.rank,
+        "nickname": entry.nickname,
+        "score": entry.score,
+        "wins": entry.wins,
+        "losses": entry.losses,
+        "played_at": entry.played_at,
+    }
+
+
+def _render_page(entries):
+    rows = "\n".join(
+        f"<tr><td>{entry.rank}</td><td>{escape(entry.nickname)}</td><td>{entry.score}</td>"
+        f"<td>{entry.wins}</td><td>{entry.losses}</td></tr>"
+        for entry in entries
+    ) or "<tr><td colspan='5'>No scores yet</td></tr>"
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta http-equiv="refresh" content="15">
+<title>Rock Paper Scissors - Leaderboard</title>
+<style>
+body {{ font-family: sans-serif; margin: 16px; color: #0f172a; }}
+table {{ width: 100%; border-collapse: collapse; }}
+th, td {{ padding: 8px; text-align: left; border-bottom: 1px solid #e2e8f0; }}
+th {{ color: #64748b; font-size: 13px; }}
+</style>
+</head>
+<body>
+<h1>Leaderboard</h1>
+<table>
+<tr><th>#</th><th>Player</th><th>Score</th><th>Wins</th><th>Losses</th></tr>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db", default=str(DEFAULT_LEADERBOARD_PATH))
+    parser.add_argument("--cache-ttl", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    leaderboard = Leaderboard(args.db)
+    server = LeaderboardServer(leaderboard, args.host, args.port, args.cache_ttl)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        leaderboard.close()
+
+
+if __name__ == "__main__":
+    main()
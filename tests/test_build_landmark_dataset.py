@@ -0,0 +1,55 @@
+import numpy as np
+
+from src.ml import build_landmark_dataset
+from src.ml.build_landmark_dataset import NO_LABEL, file_key, find_files
+
+
+def test_labels_are_top_level_folders(tmp_path):
+    for name in ("ROCK/a.jpg", "ROCK/nested/b.mp4", "loose.png", "PAPER/notes.txt"):
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_bytes(b"x")
+
+    files = find_files(tmp_path)
+
+    assert [(p.relative_to(tmp_path).as_posix(), label) for p, label in files] == [
+        ("ROCK/a.jpg", "ROCK"),
+        ("ROCK/nested/b.mp4", "ROCK"),
+        ("loose.png", NO_LABEL),
+    ]
+
+
+def test_key_depends_on_content_and_settings(tmp_path):
+    first, second, same = tmp_path / "1.jpg", tmp_path / "2.jpg", tmp_path / "3.jpg"
+    first.write_bytes(b"one")
+    second.write_bytes(b"two")
+    same.write_bytes(b"one")
+
+    assert file_key(first, "5:0.5") == file_key(same, "5:0.5")
+    assert file_key(first, "5:0.5") != file_key(second, "5:0.5")
+    assert file_key(first, "5:0.5") != file_key(first, "1:0.5")
+
+
+def test_extracts_once_per_file_content(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_extract(path, video_stride, min_detection_confidence):
+        calls.append(path)
+        return np.full((1, 21, 3), 0.5, dtype=np.float32), np.array(["Right"])
+
+    monkeypatch.setattr(build_landmark_dataset, "_extract", fake_extract)
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"image")
+    task = (image, tmp_path / "cache", 5, 0.5)
+
+    landmarks, sides, cached = build_landmark_dataset._process_file(task)
+    assert not cached
+    landmarks_again, sides_again, cached = build_landmark_dataset._process_file(task)
+    assert cached
+    np.testing.assert_array_equal(landmarks_again, landmarks)
+    assert sides_again.tolist() == ["Right"]
+    assert len(calls) == 1
+
+    image.write_bytes(b"edited image")
+    assert not build_landmark_dataset._process_file(task)[2]
+    assert len(calls) == 2
+    assert not list((tmp_path / "cache").rglob("*.tmp.npz"))
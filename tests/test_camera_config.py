@@ -0,0 +1,136 @@
+import logging
+
+import cv2
+import pytest
+
+from src.util import camera_config
+from src.util.camera_config import CameraMode, CaptureRequest, apply_mode, probe_modes, select_mode
+
+
+class FakeCamera:
+    """Accepts MJPG up to 1280x720 at 30 fps and YUYV up to 640x480 at 30 fps, like a cheap webcam."""
+
+    def __init__(self, *args):
+        self.props = {cv2.CAP_PROP_FOURCC: cv2.VideoWriter_fourcc(*"YUYV")}
+
+    def isOpened(self):
+        return True
+
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_FOURCC and value not in (cv2.VideoWriter_fourcc(*f) for f in ("MJPG", "YUYV")):
+            return False
+        self.props[prop] = value
+        return True
+
+    def get(self, prop):
+        fourcc = camera_config._fourcc_name(self.props[cv2.CAP_PROP_FOURCC])
+        max_width, max_height = (1280, 720) if fourcc == "MJPG" else (640, 480)
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return min(self.props.get(prop, 640), max_width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return min(self.props.get(prop, 480), max_height)
+        if prop == cv2.CAP_PROP_FPS:
+            return min(self.props.get(prop, 30), 30.0)
+        return self.props.get(prop, 0)
+
+    def getBackendName(self):
+        return "FAKE"
+
+    def read(self):
+        return True, None
+
+    def release(self):
+        pass
+
+
+def test_selects_the_fewest_pixels_then_the_highest_frame_rate():
+    modes = [
+        CameraMode(1280, 720, 60.0, "MJPG"),
+        CameraMode(640, 480, 30.0, "MJPG"),
+        CameraMode(640, 480, 60.0, "MJPG"),
+        CameraMode(320, 240, 60.0, "MJPG"),
+    ]
+
+    assert select_mode(modes, CaptureRequest(640, 480, 30.0)) == CameraMode(640, 480, 60.0, "MJPG")
+
+
+def test_prefers_uncompressed_when_the_bus_can_carry_it():
+    modes = [
+        CameraMode(640, 480, 30.0, "MJPG"),
+        CameraMode(640, 480, 30.0, "YUYV"),
+        CameraMode(1920, 1080, 30.0, "MJPG"),
+        CameraMode(1920, 1080, 30.0, "YUYV"),
+    ]
+
+    assert select_mode(modes, CaptureRequest(640, 480, 30.0)).fourcc == "YUYV"
+    assert select_mode(modes, CaptureRequest(1920, 1080, 30.0)).fourcc == "MJPG"
+
+
+def test_without_a_matching_mode_the_closest_one_is_used():
+    modes = [CameraMode(640, 480, 25.0, "MJPG"), CameraMode(320, 240, 30.0, "MJPG")]
+
+    assert select_mode(modes, CaptureRequest(640, 480, 30.0)) == CameraMode(640, 480, 25.0, "MJPG")
+    assert select_mode([], CaptureRequest()) is None
+
+
+def test_probe_keeps_the_modes_the_camera_reports_back():
+    modes = probe_modes(FakeCamera())
+
+    assert CameraMode(1280, 720, 30.0, "MJPG") in modes
+    assert CameraMode(640, 480, 30.0, "YUYV") in modes
+    assert all(mode.fourcc == "MJPG" or mode.pixels <= 640 * 480 for mode in modes)
+    assert apply_mode(FakeCamera(), CameraMode(640, 480, 30.0, "H264")) is None
+
+
+def test_modes_are_probed_once_per_camera(tmp_path, monkeypatch):
+    cache_path = tmp_path / "camera_modes.json"
+    probes = []
+    monkeypatch.setattr(camera_config.cv2, "VideoCapture", FakeCamera)
+    monkeypatch.setattr(camera_config, "_device_identity", lambda index, cap: f"fake:{index}")
+    monkeypatch.setattr(camera_config, "probe_modes", lambda cap: probes.append(cap) or [
+        CameraMode(640, 480, 30.0, "YUYV"),
+    ])
+
+    camera_config.open_camera(0, cache_path=cache_path, measure=False)
+    cap = camera_config.open_camera(0, cache_path=cache_path, measure=False)
+
+    assert len(probes) == 1
+    assert camera_config._cached_modes(cache_path, "fake:0") == [CameraMode(640, 480, 30.0, "YUYV")]
+    assert camera_config._cached_modes(cache_path, "fake:1") is None
+    assert cap.get(cv2.CAP_PROP_FRAME_WIDTH) == 640
+
+
+def test_broken_cache_is_probed_again(tmp_path):
+    cache_path = tmp_path / "camera_modes.json"
+    cache_path.write_text("{not json")
+
+    assert camera_config._cached_modes(cache_path, "fake:0") is None
+
+
+@pytest.mark.parametrize("request_json, expected", (
+    (None, CaptureRequest()),
+    ({"width": 1280, "height": 720, "fps": 60}, CaptureRequest(1280, 720, 60)),
+))
+def test_capture_request_from_config(request_json, expected):
+    assert CaptureRequest.from_json(request_json) == expected
+
+
+def test_cache_is_replaced_without_leaving_a_temporary_file(tmp_path):
+    cache_path = tmp_path / "camera_modes.json"
+    cache_path.write_text("{not json")
+
+    camera_config._store_modes(cache_path, "fake:0", [CameraMode(640, 480, 30.0, "YUYV")])
+
+    assert camera_config._cached_modes(cache_path, "fake:0") == [CameraMode(640, 480, 30.0, "YUYV")]
+    assert [path.name for path in tmp_path.iterdir()] == ["camera_modes.json"]
+
+
+def test_cli_logs_the_probed_modes(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(camera_config.cv2, "VideoCapture", FakeCamera)
+    monkeypatch.setattr(camera_config, "_device_identity", lambda index, cap: f"fake:{index}")
+    monkeypatch.setattr(camera_config, "probe_modes", lambda cap: [CameraMode(640, 480, 30.0, "YUYV")])
+
+    with caplog.at_level(logging.INFO, logger="src.util.camera_config"):
+        camera_config.main(["0", "--cache", str(tmp_path / "camera_modes.json")])
+
+    assert "Camera 0 supports" in caplog.text
@@ -0,0 +1,16 @@
+import json
+
+from src.util import config as config_module
+from src.util.config import Config
+
+
+def test_early_move_prediction_is_off_unless_configured(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.json"
+    monkeypatch.setattr(config_module, "_CONFIG_PATH", config_path)
+    assert not Config().early_move_prediction
+
+    config_path.write_text(json.dumps({}))
+    assert not Config.load_config().early_move_prediction
+
+    config_path.write_text(json.dumps({"early_move_prediction": True}))
+    assert Config.load_config().early_move_prediction
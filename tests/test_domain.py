@@ -0,0 +1,67 @@
+import pytest
+
+from src.core.domain import GameSummary, Move, Outcome, RoundRecord, evaluate_round
+
+
+def round_record(number, player, computer):
+    return RoundRecord(number, player, computer, evaluate_round(player, computer))
+
+
+def test_evaluate_round():
+    assert evaluate_round(Move.ROCK, Move.SCISSORS) == Outcome.PLAYER
+    assert evaluate_round(Move.ROCK, Move.PAPER) == Outcome.COMPUTER
+    assert evaluate_round(Move.PAPER, Move.PAPER) == Outcome.DRAW
+
+
+def test_summary_counts_outcomes_and_streaks():
+    summary = GameSummary()
+    for number, (player, computer) in enumerate([
+        (Move.ROCK, Move.SCISSORS),
+        (Move.PAPER, Move.ROCK),
+        (Move.PAPER, Move.PAPER),
+        (Move.SCISSORS, Move.ROCK),
+        (Move.ROCK, Move.PAPER),
+    ], start=1):
+        summary.record_round(round_record(number, player, computer))
+
+    assert (summary.rounds, summary.wins, summary.losses, summary.draws) == (5, 2, 2, 1)
+    assert summary.longest_win_streak == 2
+    assert summary.longest_loss_streak == 2
+    assert summary.win_rate == pytest.approx(0.4)
+    assert summary.win_rate_by_move() == {Move.ROCK: 0.5, Move.PAPER: 0.5, Move.SCISSORS: 0.0}
+    assert summary.favourite_move() in (Move.ROCK, Move.PAPER)
+
+
+def test_empty_summary():
+    summary = GameSummary()
+
+    assert summary.win_rate == 0.0
+    assert summary.favourite_move() is None
+    assert summary.average_decision_time is None
+    assert summary.average_latency is None
+    assert summary.prediction_hit_rate is None
+
+
+def test_prediction_hits_count_only_rounds_with_a_prediction():
+    summary = GameSummary()
+    # the computer wins without a prediction, that is no hit
+    summary.record_round(round_record(1, Move.ROCK, Move.PAPER))
+    summary.record_round(round_record(2, Move.ROCK, Move.ROCK), predicted_move=Move.ROCK)
+    summary.record_round(round_record(3, Move.PAPER, Move.PAPER), predicted_move=Move.SCISSORS)
+
+    assert summary.predicted_rounds == 2
+    assert summary.prediction_hits == 1
+    assert summary.prediction_hit_rate == pytest.approx(0.5)
+
+
+def test_decision_times_and_latencies_are_averaged():
+    summary = GameSummary()
+    summary.record_round(round_record(1, Move.ROCK, Move.ROCK), decision_time=0.4)
+    summary.record_round(round_record(2, Move.ROCK, Move.ROCK))
+    summary.record_round(round_record(3, Move.ROCK, Move.ROCK), decision_time=0.8)
+    summary.record_latency(0.1)
+    summary.record_latency(0.3)
+
+    assert summary.average_decision_time == pytest.approx(0.6)
+    assert summary.average_latency == pytest.approx(0.2)
+    assert summary.latency_max == pytest.approx(0.3)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from benchmarks.synthetic_hands import MOVE_CURLS, make_hand, shoot_sequence
+from src.core.domain import Move
+from src.ml.early_move_predictor import EarlyMovePredictor
+from src.ml.gesture_classifier import GestureClassifier, VectorBasedClassifier
+
+
+def first_commit(predictor, times, frames):
+    for t, landmarks in zip(times, frames):
+        predictor.update(landmarks, t)
+        move = predictor.committed_move()
+        if move is not None:
+            return move, t
+    return None, None
+
+
+@pytest.mark.parametrize("target", (Move.PAPER, Move.SCISSORS))
+def test_commits_the_move_before_the_hand_settles(target):
+    classifier = VectorBasedClassifier()
+    times, frames, _ = shoot_sequence(target, fps=30.0, rng=np.random.default_rng(0))
+
+    move, committed_at = first_commit(EarlyMovePredictor(classifier), times, frames)
+    settled_at = next(t for t, f in zip(times, frames) if classifier.determine_move("Right", f) == target)
+
+    assert move == target
+    assert committed_at < settled_at
+
+
+def test_never_commits_the_pump_fist():
+    predictor = EarlyMovePredictor()
+    rng = np.random.default_rng(1)
+    times = np.arange(30) / 30.0
+    frames = [make_hand(MOVE_CURLS[Move.ROCK], noise=0.002, rng=rng) for _ in times]
+
+    assert first_commit(predictor, times, frames) == (None, None)
+    assert [move for _, move, _ in predictor.confidence_curve] == [Move.ROCK] * len(times)
+
+
+def test_probabilities_sum_to_one_and_reset_forgets_the_baseline():
+    predictor = EarlyMovePredictor()
+    probabilities = predictor.update(make_hand(MOVE_CURLS[Move.PAPER]), 0.0)
+
+    assert set(probabilities) == set(Move)
+    assert sum(probabilities.values()) == pytest.approx(1.0)
+    # paper is the baseline, showing it is no change
+    assert predictor.committed_move() is None
+
+    predictor.reset()
+    assert predictor.confidence_curve == []
+    predictor.update(make_hand(MOVE_CURLS[Move.ROCK]), 1.0)
+    predictor.update(make_hand(MOVE_CURLS[Move.PAPER]), 1.1)
+    assert predictor.committed_move() == Move.PAPER
+
+
+def test_classifier_without_joint_cosines_falls_back_to_the_vector_one():
+    vector = VectorBasedClassifier(straightening_threshold=0.2)
+
+    assert EarlyMovePredictor(vector).classifier is vector
+    assert isinstance(EarlyMovePredictor(GestureClassifier()).classifier, VectorBasedClassifier)
@@ -0,0 +1,94 @@
+from src.core.domain import Move, Outcome, RoundRecord, SyncPhase, SyncStatus, ThumbDirection
+from src.core.events import (
+    EventGameCountdown, EventGameOver, EventGameRoundActive, EventGameRoundResult, EventGestureProgress,
+    EventScoreChanged,
+)
+from src.core.event_journal import EVENT_DTYPE, EventJournal, EventKind, journal_files, read_journal
+from src.core.game_state import GameState
+from src.core.match_history import MOVE_INDEX, OUTCOME_INDEX
+
+
+def test_events_are_read_back_as_columns(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.record(GameState.COUNTDOWN, now=1.0)
+    for count in (3, 3, 2):
+        journal.record(EventGameCountdown(count, SyncStatus(SyncPhase.SHAKING, 2, 0.5)), now=2.0)
+    journal.record(EventGameRoundActive(), now=3.0)
+    journal.record(EventGameRoundResult(RoundRecord(1, Move.PAPER, Move.ROCK, Outcome.PLAYER), None), now=4.0)
+    journal.record(EventScoreChanged(1, 0), now=4.0)
+    journal.record(EventGameOver(1, 0), now=5.0)
+    journal.close()
+
+    events = read_journal(tmp_path)
+
+    assert events.dtype == EVENT_DTYPE
+    assert events["kind"].tolist() == [
+        EventKind.GAME_STARTED, EventKind.COUNTDOWN, EventKind.COUNTDOWN, EventKind.ROUND_ACTIVE,
+        EventKind.ROUND_RESULT, EventKind.SCORE_CHANGED, EventKind.GAME_OVER,
+    ]
+    assert events["time"].tolist() == [1.0, 2.0, 2.0, 3.0, 4.0, 4.0, 5.0]
+    countdown = events[1]
+    assert (countdown["a"], countdown["b"], countdown["c"]) == (3, list(SyncPhase).index(SyncPhase.SHAKING) + 1, 2)
+    result = events[events["kind"] == EventKind.ROUND_RESULT][0]
+    assert (result["a"], result["b"], result["c"], result["x"]) == (
+        MOVE_INDEX[Move.PAPER], MOVE_INDEX[Move.ROCK], OUTCOME_INDEX[Outcome.PLAYER], 1,
+    )
+    assert (events[-1]["x"], events[-1]["y"]) == (1, 0)
+
+
+def test_gesture_progress_is_journaled_at_milestones(tmp_path):
+    journal = EventJournal(tmp_path)
+    for progress in (0.0, 0.1, 0.3, 0.55, 0.6, 1.0):
+        journal.record(EventGestureProgress(progress, ThumbDirection.UP))
+    journal.close()
+
+    events = read_journal(tmp_path)
+
+    assert events["b"].tolist() == [0, 1, 2, 4]
+    assert set(events["a"].tolist()) == {list(ThumbDirection).index(ThumbDirection.UP)}
+
+
+def test_a_new_hold_is_journaled_from_its_first_milestone(tmp_path):
+    journal = EventJournal(tmp_path)
+    for progress in (0.0, 0.1, 0.0, 0.1, 0.3):
+        journal.record(EventGestureProgress(progress, ThumbDirection.DOWN))
+    journal.close()
+
+    assert read_journal(tmp_path)["b"].tolist() == [0, 0, 1]
+
+
+def test_values_out_of_the_column_range_are_clamped(tmp_path):
+    journal = EventJournal(tmp_path)
+    journal.record(EventScoreChanged(70000, -1), now=1.0)
+    journal.close()
+
+    events = read_journal(tmp_path)
+
+    assert (events[0]["x"], events[0]["y"]) == (65535, 0)
+
+
+def test_a_bad_batch_is_skipped_and_the_journal_keeps_writing(tmp_path):
+    journal = EventJournal(tmp_path, batch_size=1)
+    journal._queue.put((1.0, EventKind.SCORE_CHANGED, 300, 0, 0, 0, 0))
+    journal.record(EventScoreChanged(2, 1), now=2.0)
+    journal.close()
+
+    events = read_journal(tmp_path)
+
+    assert events["time"].tolist() == [2.0]
+
+
+def test_files_are_rotated_and_read_in_order(tmp_path):
+    journal = EventJournal(tmp_path, batch_size=1, max_file_bytes=8 + 2 * EVENT_DTYPE.itemsize)
+    for score in range(5):
+        journal.record(EventScoreChanged(score, 0), now=float(score))
+    journal.close()
+
+    assert len(journal_files(tmp_path)) == 3
+    assert read_journal(tmp_path)["x"].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_files_of_other_programs_are_skipped(tmp_path):
+    (tmp_path / "events-00000000-000000-000.bin").write_bytes(b"not a journal")
+
+    assert len(read_journal(tmp_path)) == 0
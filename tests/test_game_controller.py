@@ -0,0 +1,150 @@
+import logging
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("cv2")
+
+from src.core.game_controller import GameController, Pause, Reset, Stop, SwapStrategy, ChangeConfig
+from src.core.strategies import MarkovStrategy, NaiveStrategy
+from src.ml.gesture_classifier import VectorBasedClassifier
+from src.ui.utils.bridge import UiBridge
+from src.util.config import Config
+from src.util.plugins import PluginConfig
+
+
+class FakeCapture:
+    """A camera that delivers ``frames`` empty frames."""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.reads = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        if self.reads >= self.frames:
+            return False, None
+        self.reads += 1
+        return True, None
+
+    def release(self):
+        pass
+
+
+class FakeDetector:
+    def __init__(self):
+        self.threads = set()
+        self.closed = False
+
+    def detect(self, frame, captured_at=None):
+        self.threads.add(threading.get_ident())
+        return {}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def controller():
+    controller = GameController(
+        VectorBasedClassifier(),
+        NaiveStrategy(rng=0),
+        UiBridge(),
+        cap=FakeCapture(frames=3),
+        detector_factory=FakeDetector,
+        config=Config(),
+    )
+    yield controller
+    controller.close()
+
+
+def test_commands_are_applied_on_the_controller_thread_in_order(controller):
+    strategy = MarkovStrategy(rng=0)
+    controller.submit(Reset())
+    controller.submit(SwapStrategy(strategy))
+    controller.submit(Stop())
+
+    thread = threading.Thread(target=controller.start)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert controller.logic.computer_strategy is strategy
+    # stopped before the first frame
+    assert controller._cap.reads == 0
+    assert controller._detector.closed
+
+
+def test_frames_are_processed_until_the_camera_runs_out(controller):
+    thread = threading.Thread(target=controller.start)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert controller._cap.reads == 3
+    assert controller._detector.threads == {thread.ident}
+
+
+def test_paused_controller_reads_no_frames(controller):
+    controller.submit(Pause())
+    thread = threading.Thread(target=controller.start)
+    thread.start()
+    thread.join(timeout=0.3)
+
+    assert thread.is_alive()
+    assert controller._cap.reads == 0
+    controller.submit(Stop())
+    thread.join(timeout=5)
+
+
+def test_config_change_rebuilds_only_what_differs(controller):
+    classifier = controller.logic.classifier
+    config = Config()
+    config.strategy = PluginConfig("markov")
+    controller.submit(ChangeConfig(config))
+    controller.submit(Stop())
+
+    controller.start()
+
+    assert isinstance(controller.logic.computer_strategy, MarkovStrategy)
+    assert controller.logic.classifier is classifier
+
+
+def test_paused_probe_reads_no_frame(controller):
+    # as after a Pause command on the end screen
+    controller._stop_detection = True
+    controller._power.probe_interval = 0.0
+    controller._power.motion = lambda frame: False
+
+    controller._probe()
+    assert controller._cap.reads == 0
+
+    controller._stop_detection = False
+    controller._probe()
+    assert controller._cap.reads == 1
+
+
+def test_unknown_command_is_logged_and_skipped(controller, caplog):
+    controller.submit(object())
+    controller.submit(Stop())
+
+    with caplog.at_level(logging.WARNING, logger="src.core.game_controller"):
+        controller.start()
+
+    assert "Ignoring unknown command" in caplog.text
+
+
+def test_early_move_predictor_follows_the_configured_classifier(controller):
+    assert controller.logic.session.early_move_predictor is None
+
+    config = Config()
+    config.early_move_prediction = True
+    config.classifier = PluginConfig("vector", {"straightening_threshold": 0.3})
+    controller.submit(ChangeConfig(config))
+    controller.submit(Stop())
+    controller.start()
+
+    predictor = controller.logic.session.early_move_predictor
+    assert predictor.classifier is controller.logic.classifier
+    assert predictor.classifier.straightening_threshold == 0.3
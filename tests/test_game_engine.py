@@ -0,0 +1,161 @@
+from src.core.domain import FrameStamp, Move, ThumbDirection
+from src.core.game_engine import GameEngine, GameSession, Gesture
+from src.core.game_state import GameConfig, GameState
+from src.core.strategies import NaiveStrategy
+
+FRAME_TIME = 0.05
+
+
+class FakeHand(list):
+    """21 landmarks at the image centre, ``pose`` says what the fake classifier sees."""
+
+    def __init__(self, pose):
+        super().__init__([(0.5, 0.5, 0.0)] * 21)
+        self.pose = pose
+
+
+class FakeClassifier:
+    def determine_hand_direction(self, landmarks):
+        return {"up": ThumbDirection.UP, "down": ThumbDirection.DOWN}.get(landmarks.pose)
+
+    def determine_move_with_confidence(self, side, landmarks):
+        if landmarks.pose in Move.__members__:
+            return Move[landmarks.pose], 1.0
+        return None, 0.0
+
+
+class FakePredictor:
+    """Always confident in ``move``."""
+
+    def __init__(self, move):
+        self.move = move
+
+    def reset(self):
+        pass
+
+    def update(self, landmarks, current_time):
+        return {}
+
+    def committed_move(self):
+        return self.move
+
+
+class Player:
+    """Feeds one headless session frame by frame on a fake clock."""
+
+    def __init__(self, early_move_predictor=None):
+        self.engine = GameEngine(FakeClassifier())
+        self.session = GameSession(
+            NaiveStrategy(rng=0), background_strategy=False, early_move_predictor=early_move_predictor
+        )
+        self.now = 0.0
+        self.frame_id = 0
+
+    def hold(self, pose, seconds):
+        hand = ("Right", FakeHand(pose)) if pose is not None else None
+        for _ in range(round(seconds / FRAME_TIME)):
+            self.frame_id += 1
+            self.engine.step(self.session, hand, None, self.now, FrameStamp(self.frame_id, self.now))
+            self.now += FRAME_TIME
+        return self.session.state
+
+    def start(self):
+        return self.hold("up", GameConfig.GESTURE_HOLD_DURATION + 0.1)
+
+    def play_round(self, move):
+        assert self.hold(None, GameConfig.COUNTDOWN_DURATION + 0.1) == GameState.ROUND_ACTIVE
+        return self.hold(move.name, 0.5)
+
+
+def test_thumb_up_held_starts_the_game():
+    player = Player()
+
+    assert player.hold("up", GameConfig.GESTURE_HOLD_DURATION - 0.5) == GameState.IDLE
+    assert player.hold("up", 0.6) == GameState.COUNTDOWN
+
+
+def test_round_is_played_and_recorded():
+    player = Player()
+    player.start()
+
+    assert player.play_round(Move.ROCK) == GameState.ROUND_RESULT
+    session = player.session
+    assert session.round_number == 1
+    assert session.current_player_move == Move.ROCK
+    assert len(session.match_history) == 1
+    assert session.summary.rounds == 1
+    # latency is measured from the first frame showing the move
+    assert session.result_stamp.frame_id == player.frame_id - round(0.5 / FRAME_TIME) + 1
+
+    assert player.hold(None, GameConfig.RESULT_DURATION + 0.1) == GameState.COUNTDOWN
+    assert session.current_player_move is None
+
+
+def test_prediction_agreeing_with_the_vote_commits_on_the_first_frame():
+    player = Player(FakePredictor(Move.PAPER))
+    player.start()
+    player.hold(None, GameConfig.COUNTDOWN_DURATION + 0.1)
+
+    assert player.hold(Move.PAPER.name, FRAME_TIME) == GameState.ROUND_RESULT
+    assert player.session.current_player_move == Move.PAPER
+
+
+def test_prediction_against_the_vote_is_ignored():
+    player = Player(FakePredictor(Move.PAPER))
+    player.start()
+    player.hold(None, GameConfig.COUNTDOWN_DURATION + 0.1)
+
+    assert player.hold(Move.ROCK.name, FRAME_TIME) == GameState.ROUND_ACTIVE
+    assert player.hold(Move.ROCK.name, 0.5) == GameState.ROUND_RESULT
+    assert player.session.current_player_move == Move.ROCK
+
+
+def test_thumb_down_held_quits_and_thumb_up_restarts():
+    player = Player()
+    player.start()
+    player.play_round(Move.PAPER)
+
+    assert player.hold("down", GameConfig.GESTURE_HOLD_DURATION + 0.1) == GameState.GAME_OVER
+    assert player.session.summary.rounds == 1
+
+    assert player.hold("up", GameConfig.GESTURE_HOLD_DURATION + 0.1) == GameState.IDLE
+    assert player.session.round_number == 0
+    assert len(player.session.match_history) == 0
+
+
+def test_quit_hold_pauses_the_countdown():
+    player = Player()
+    player.start()
+
+    # shorter than the hold, longer than the countdown
+    assert player.hold("down", GameConfig.COUNTDOWN_DURATION - 1.5) == GameState.COUNTDOWN
+    player.hold(None, FRAME_TIME)
+    assert player.hold(None, GameConfig.COUNTDOWN_DURATION - 0.5) == GameState.COUNTDOWN
+    assert player.hold(None, 0.6) == GameState.ROUND_ACTIVE
+
+
+def test_quit_hold_carries_over_into_the_next_countdown():
+    player = Player()
+    player.start()
+    player.play_round(Move.SCISSORS)
+
+    # the hold starts on the result screen and ends in the countdown after it
+    player.hold(None, GameConfig.RESULT_DURATION - 1.0)
+    assert player.hold("down", 1.5) == GameState.COUNTDOWN
+    assert player.session.gesture_started[Gesture.QUIT] is not None
+    assert player.hold("down", GameConfig.GESTURE_HOLD_DURATION - 1.4) == GameState.GAME_OVER
+
+
+def test_step_many_advances_every_session_with_its_stamp():
+    engine = GameEngine(FakeClassifier())
+    sessions = [GameSession(NaiveStrategy(rng=i), background_strategy=False) for i in range(3)]
+    hands = [("Right", FakeHand("up"))] * len(sessions)
+
+    now = 0.0
+    for frame_id in range(round((GameConfig.GESTURE_HOLD_DURATION + 0.1) / FRAME_TIME)):
+        stamps = [FrameStamp(frame_id, now)] * len(sessions)
+        engine.step_many(sessions, hands, now, stamps=stamps)
+        now += FRAME_TIME
+
+    assert all(session.state == GameState.COUNTDOWN for session in sessions)
+    assert all(session.frame_stamp == stamps[0] for session in sessions)
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from src.core.domain import Move, ThumbDirection
+from src.ml.gesture_classifier import VectorBasedClassifier
+
+FINGER_MCP_IDS = (5, 9, 13, 17)
+
+
+def hand(straight_fingers, thumb_dy=0.0, jitter=0.0, rng=None):
+    """A right hand pointing up, ``straight_fingers`` says which of index..pinky are extended."""
+    points = np.zeros((21, 3))
+    points[0] = (0.5, 0.8, 0.0)
+    for i in range(1, 5):
+        points[i] = (0.45 - 0.03 * i, 0.75 + thumb_dy * i / 4, 0.0)
+    for finger, (mcp, straight) in enumerate(zip(FINGER_MCP_IDS, straight_fingers)):
+        x = 0.44 + 0.04 * finger
+        points[mcp] = (x, 0.6, 0.0)
+        points[mcp + 1] = (x, 0.5, 0.0)
+        if straight:
+            points[mcp + 2] = (x, 0.45, 0.0)
+            points[mcp + 3] = (x, 0.4, 0.0)
+        else:
+            points[mcp + 2] = (x, 0.55, 0.0)
+            points[mcp + 3] = (x, 0.6, 0.0)
+    if rng is not None:
+        points += rng.normal(0.0, jitter, points.shape)
+    return points
+
+
+def test_recognises_the_three_moves():
+    classifier = VectorBasedClassifier()
+
+    assert classifier.determine_move("Right", hand((False,) * 4)) == Move.ROCK
+    assert classifier.determine_move("Right", hand((True,) * 4)) == Move.PAPER
+    assert classifier.determine_move("Right", hand((True, True, False, False))) == Move.SCISSORS
+    assert classifier.determine_move("Right", hand((True, False, False, True))) is None
+
+
+def test_batch_matches_one_hand_at_a_time():
+    classifier = VectorBasedClassifier()
+    rng = np.random.default_rng(0)
+    hands = np.stack([
+        hand(rng.random(4) < 0.5, thumb_dy=rng.choice((-0.4, 0.0, 0.4)), jitter=0.02, rng=rng)
+        for _ in range(200)
+    ])
+
+    moves, directions = classifier.classify_batch(hands)
+
+    assert moves == [classifier.determine_move("Right", h) for h in hands]
+    assert directions == [classifier.determine_hand_direction(h) for h in hands]
+    assert set(moves) > {None}
+    assert {ThumbDirection.UP, ThumbDirection.DOWN} <= set(directions)
+
+
+def test_dot_products_of_a_batch_stack_single_hands():
+    classifier = VectorBasedClassifier()
+    hands = np.stack([hand((True,) * 4), hand((False,) * 4)])
+
+    batch = classifier.calculate_dot_products(hands)
+
+    assert batch.shape == (2, 4)
+    np.testing.assert_allclose(batch[0], classifier.calculate_dot_products(hands[0]))
+    assert batch[0] == pytest.approx([1.0] * 4)
+    assert batch[1] == pytest.approx([-1.0] * 4)
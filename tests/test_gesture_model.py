@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from src.core.domain import Move
+from src.ml.gesture_classifier import LearnedClassifier
+from src.ml.gesture_model import GestureModel, normalize_landmarks
+from src.ml.landmark_dataset import LandmarkDataset
+
+STRAIGHT_FINGERS = {
+    "ROCK": (False, False, False, False),
+    "PAPER": (True, True, True, True),
+    "SCISSORS": (True, True, False, False),
+    "NONE": (True, False, False, True),
+}
+
+
+def hand(label, rng, side="Right"):
+    """A noisy hand showing ``label``, left hands are mirrored around the wrist."""
+    points = np.zeros((21, 3))
+    points[0] = (0.5, 0.8, 0.0)
+    for i in range(1, 5):
+        points[i] = (0.5 - 0.03 * i, 0.75, 0.0)
+    for finger, straight in enumerate(STRAIGHT_FINGERS[label]):
+        mcp, x = 5 + 4 * finger, 0.44 + 0.04 * finger
+        points[mcp:mcp + 4] = [(x, y, 0.0) for y in ((0.6, 0.5, 0.45, 0.4) if straight else (0.6, 0.5, 0.55, 0.6))]
+    points += rng.normal(0.0, 0.01, points.shape)
+    if side == "Left":
+        points[:, 0] = 1.0 - points[:, 0]
+    return points
+
+
+def dataset(size, rng):
+    labels = rng.choice(list(STRAIGHT_FINGERS), size)
+    sides = rng.choice(["Left", "Right"], size)
+    landmarks = np.stack([hand(label, rng, side) for label, side in zip(labels, sides)])
+    return LandmarkDataset(landmarks.astype(np.float32), sides, labels)
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    train = dataset(200, np.random.default_rng(0))
+    path = tmp_path_factory.mktemp("model") / "gesture_model.npz"
+    GestureModel.fit(train.landmarks, train.sides, train.labels, epochs=200).save(path)
+    return path
+
+
+def test_normalization_mirrors_left_hands():
+    rng = np.random.default_rng(1)
+    right = hand("PAPER", rng)
+    left = right.copy()
+    left[:, 0] = 1.0 - left[:, 0]
+
+    normalized = normalize_landmarks(np.stack([right, left]), ["Right", "Left"])
+
+    np.testing.assert_allclose(normalized[0], normalized[1], atol=1e-5)
+    np.testing.assert_allclose(normalized[:, 0], 0.0)
+
+
+def test_saved_model_predicts_the_same_after_loading(model_path):
+    test = dataset(50, np.random.default_rng(2))
+    model = GestureModel.load(model_path)
+
+    probabilities = model.predict_proba(test.landmarks, test.sides)
+
+    assert probabilities.shape == (50, 4)
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1.0, rtol=1e-5)
+    assert (model.classes[probabilities.argmax(axis=1)] == test.labels).mean() > 0.95
+
+
+def test_learned_classifier_maps_classes_to_moves(model_path):
+    classifier = LearnedClassifier(model_path, min_confidence=0.6)
+    rng = np.random.default_rng(3)
+
+    assert classifier.determine_move("Right", hand("ROCK", rng)) == Move.ROCK
+    assert classifier.determine_move("Left", hand("SCISSORS", rng, "Left")) == Move.SCISSORS
+    assert classifier.determine_move("Right", hand("NONE", rng)) is None
+    assert set(classifier.move_probabilities("Right", hand("PAPER", rng))) == set(Move)
+
+
+def test_low_confidence_is_no_move(model_path):
+    classifier = LearnedClassifier(model_path, min_confidence=1.01)
+
+    move, confidence = classifier.determine_move_with_confidence("Right", hand("PAPER", np.random.default_rng(4)))
+
+    assert move == Move.PAPER
+    assert confidence < 1.01
+    assert classifier.determine_move("Right", hand("PAPER", np.random.default_rng(4))) is None
+
+
+def test_dataset_round_trip(tmp_path):
+    data = dataset(10, np.random.default_rng(5))
+    data.save(tmp_path / "data.npz")
+
+    loaded = LandmarkDataset.load_many([tmp_path / "data.npz", tmp_path / "data.npz"])
+
+    assert len(loaded) == 20
+    np.testing.assert_array_equal(loaded.labels[:10], data.labels)
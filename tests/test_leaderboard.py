@@ -0,0 +1,76 @@
+import sqlite3
+
+import pytest
+
+from src.core.leaderboard import Leaderboard, game_score
+
+
+@pytest.fixture
+def leaderboard(tmp_path):
+    leaderboard = Leaderboard(tmp_path / "leaderboard.sqlite", page_size=3)
+    yield leaderboard
+    leaderboard.close()
+
+
+def test_submitted_score_comes_back_with_its_rank(leaderboard):
+    leaderboard.submit("ana", wins=3, losses=1, played_at=1.0).result(timeout=5)
+    entry = leaderboard.submit("  bo  ", wins=5, losses=0, played_at=2.0).result(timeout=5)
+
+    assert entry.nickname == "bo"
+    assert entry.score == game_score(5, 0)
+    assert entry.rank == 1
+    assert leaderboard.rank(game_score(3, 1)) == 2
+
+
+def test_top_page_is_cached_after_every_write(leaderboard):
+    assert leaderboard.top_page() == []
+
+    for i, wins in enumerate((1, 4, 4, 2)):
+        future = leaderboard.submit(f"player{i}", wins=wins, losses=0, played_at=float(i))
+    future.result(timeout=5)
+
+    page = leaderboard.top_page()
+    assert [(e.nickname, e.rank) for e in page] == [("player1", 1), ("player2", 1), ("player3", 3)]
+    assert leaderboard.top(2) == page[:2]
+    assert len(leaderboard.top(10)) == 4
+
+
+def test_top_since_and_best_of(leaderboard):
+    leaderboard.submit("old", wins=9, losses=0, played_at=10.0)
+    leaderboard.submit("new", wins=1, losses=0, played_at=20.0)
+    leaderboard.submit("new", wins=2, losses=0, played_at=30.0).result(timeout=5)
+
+    assert [e.nickname for e in leaderboard.top(5, since=15.0)] == ["new", "new"]
+    assert leaderboard.rank(game_score(2, 0), since=15.0) == 1
+
+    best = leaderboard.best_of("new")
+    assert (best.wins, best.rank) == (2, 2)
+    assert leaderboard.best_of("nobody") is None
+
+
+def test_blank_nickname_is_rejected(leaderboard):
+    with pytest.raises(ValueError):
+        leaderboard.submit("   ", wins=1, losses=0)
+
+
+def test_scores_survive_a_restart(tmp_path):
+    first = Leaderboard(tmp_path / "leaderboard.sqlite")
+    first.submit("ana", wins=2, losses=1).result(timeout=5)
+    first.close()
+
+    second = Leaderboard(tmp_path / "leaderboard.sqlite")
+    try:
+        assert [e.nickname for e in second.top_page()] == ["ana"]
+    finally:
+        second.close()
+
+
+def test_close_closes_the_connection_of_the_closing_thread(tmp_path):
+    leaderboard = Leaderboard(tmp_path / "leaderboard.sqlite")
+    leaderboard.rank(0)
+    connection = leaderboard._local.connection
+
+    leaderboard.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
@@ -0,0 +1,131 @@
+import http.client
+import json
+import threading
+import time
+
+import pytest
+
+from src.core.leaderboard import Leaderboard
+from src.web.leaderboard_server import LeaderboardServer
+
+
+@pytest.fixture
+def leaderboard(tmp_path):
+    leaderboard = Leaderboard(tmp_path / "leaderboard.sqlite")
+    leaderboard.submit("ana", wins=3, losses=1).result(timeout=5)
+    yield leaderboard
+    leaderboard.close()
+
+
+@pytest.fixture
+def server(leaderboard):
+    server = LeaderboardServer(leaderboard, host="127.0.0.1", port=0, cache_ttl=0.3)
+    server.start_in_thread()
+    while server.port == 0:
+        time.sleep(0.01)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(server):
+    client = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    yield client
+    client.close()
+
+
+def get(client, path, **headers):
+    client.request("GET", path, headers=headers)
+    response = client.getresponse()
+    return response, response.read()
+
+
+def test_top_is_served_as_json(client):
+    response, body = get(client, "/api/top?n=5")
+
+    assert response.status == 200
+    assert response.getheader("Content-Type") == "application/json"
+    assert [(e["nickname"], e["rank"]) for e in json.loads(body)] == [("ana", 1)]
+
+
+def test_page_and_rank(client):
+    response, body = get(client, "/")
+    assert response.status == 200
+    assert b"ana" in body
+
+    response, body = get(client, "/api/rank?score=1000")
+    assert json.loads(body) == {"score": 1000, "rank": 1}
+
+
+def test_matching_etag_is_answered_with_304_on_the_same_connection(client):
+    response, _ = get(client, "/api/top")
+    etag = response.getheader("ETag")
+
+    response, body = get(client, "/api/top", **{"If-None-Match": etag})
+
+    assert response.status == 304
+    assert body == b""
+    assert response.getheader("ETag") == etag
+
+
+def test_new_scores_show_up_once_the_cache_expires(client, leaderboard):
+    get(client, "/api/top")
+    leaderboard.submit("bo", wins=9, losses=0).result(timeout=5)
+
+    _, cached = get(client, "/api/top")
+    assert [e["nickname"] for e in json.loads(cached)] == ["ana"]
+
+    time.sleep(0.35)
+    _, fresh = get(client, "/api/top")
+    assert [e["nickname"] for e in json.loads(fresh)] == ["bo", "ana"]
+
+
+@pytest.mark.parametrize("path", ("/api/top?n=ten", "/api/top?n=0", "/api/top?since=yesterday", "/api/rank"))
+def test_bad_parameters_are_400(client, path):
+    response, body = get(client, path)
+
+    assert response.status == 400
+    assert "error" in json.loads(body)
+
+
+def test_unknown_page_is_404(client):
+    assert get(client, "/admin")[0].status == 404
+
+
+def test_failing_query_is_500(client, leaderboard, monkeypatch):
+    def broken_top(n, since=None):
+        raise RuntimeError("database is gone")
+    monkeypatch.setattr(leaderboard, "top", broken_top)
+
+    response, body = get(client, "/api/top?n=3")
+
+    assert response.status == 500
+    assert "error" in json.loads(body)
+
+
+def test_errors_close_the_connection(client):
+    client.request("POST", "/api/top", body=b'{"nickname": "eve"}', headers={"Content-Type": "application/json"})
+    response = client.getresponse()
+    response.read()
+
+    assert response.status == 405
+    assert response.getheader("Connection") == "close"
+    assert response.will_close
+
+
+def test_stop_closes_the_connections_of_the_query_threads(leaderboard, monkeypatch):
+    closed_by = []
+    close_connection = leaderboard.close_connection
+    monkeypatch.setattr(
+        leaderboard, "close_connection",
+        lambda: closed_by.append(threading.current_thread().name) or close_connection(),
+    )
+    server = LeaderboardServer(leaderboard, host="127.0.0.1", port=0, query_workers=2)
+    server.start_in_thread()
+    while server.port == 0:
+        time.sleep(0.01)
+
+    server.stop()
+
+    assert len(set(closed_by)) == 2
+    assert all(name.startswith("leaderboard-query") for name in closed_by)
@@ -0,0 +1,106 @@
+import math
+
+import pytest
+
+from src.core.domain import Move, Outcome, RoundRecord, evaluate_round
+from src.core.match_history import MatchHistory, MOVE_INDEX
+
+
+def round_record(number, player, computer):
+    return RoundRecord(number, player, computer, evaluate_round(player, computer))
+
+
+def history_of(*moves):
+    """A history of (player, computer) pairs, one round per second."""
+    history = MatchHistory()
+    for number, (player, computer) in enumerate(moves, start=1):
+        history.append(round_record(number, player, computer), float(number))
+    return history
+
+
+def test_counts_moves_and_outcomes():
+    history = history_of(
+        (Move.ROCK, Move.SCISSORS),
+        (Move.ROCK, Move.PAPER),
+        (Move.PAPER, Move.PAPER),
+    )
+
+    assert history.player_move_counts[MOVE_INDEX[Move.ROCK]] == 2
+    assert history.computer_move_counts[MOVE_INDEX[Move.PAPER]] == 2
+    assert history.outcome_counts == {Outcome.PLAYER: 1, Outcome.COMPUTER: 1, Outcome.DRAW: 1}
+    assert history.transitions[MOVE_INDEX[Move.ROCK], MOVE_INDEX[Move.ROCK]] == 1
+    assert history.transitions[MOVE_INDEX[Move.ROCK], MOVE_INDEX[Move.PAPER]] == 1
+
+
+def test_streaks_and_shifts():
+    history = history_of(
+        (Move.ROCK, Move.SCISSORS),
+        (Move.ROCK, Move.SCISSORS),
+        (Move.PAPER, Move.ROCK),
+        (Move.ROCK, Move.PAPER),
+    )
+
+    assert history.player_move_streak == 1
+    assert history.longest_outcome_streaks[Outcome.PLAYER] == 3
+    assert history.outcome_streak == 1
+    # after wins the player stayed once, upgraded rock to paper once and downgraded paper to rock once
+    assert history.shift_counts(Outcome.PLAYER).tolist() == [1, 1, 1]
+
+
+def test_ngram_counts():
+    history = history_of(*[(move, Move.ROCK) for move in (Move.ROCK, Move.PAPER, Move.ROCK, Move.PAPER)])
+
+    assert history.ngram_counts([Move.ROCK])[MOVE_INDEX[Move.PAPER]] == 2
+    assert history.ngram_counts([Move.PAPER, Move.ROCK])[MOVE_INDEX[Move.PAPER]] == 1
+    assert history.ngram_counts([Move.SCISSORS]) is None
+    with pytest.raises(ValueError):
+        history.ngram_counts([])
+
+
+def test_grows_past_its_initial_capacity():
+    moves = [(Move(i % 3 + 1), Move.ROCK) for i in range(MatchHistory.INITIAL_CAPACITY * 2 + 1)]
+    history = history_of(*moves)
+
+    assert len(history) == len(moves)
+    assert [r.player_move for r in history] == [player for player, _ in moves]
+    assert history.recent_player_moves(2) == (moves[-2][0], moves[-1][0])
+
+
+def test_snapshot_does_not_see_later_rounds():
+    history = history_of((Move.ROCK, Move.ROCK))
+    snapshot = history.snapshot()
+    history.append(round_record(2, Move.PAPER, Move.ROCK))
+
+    assert len(snapshot) == 1
+    assert snapshot[-1].player_move == Move.ROCK
+
+
+def test_timestamps_are_milliseconds_since_the_first_round():
+    history = history_of((Move.ROCK, Move.ROCK), (Move.ROCK, Move.ROCK))
+
+    assert history.timestamps.tolist() == [0, 1000]
+
+
+def test_timestamp_of_a_clock_stepping_back_is_clamped():
+    history = MatchHistory()
+    history.append(round_record(1, Move.ROCK, Move.ROCK), 100.0)
+    history.append(round_record(2, Move.ROCK, Move.ROCK), 40.0)
+
+    assert history.timestamps.tolist() == [0, 0]
+
+
+def test_latency_is_nan_until_measured():
+    history = history_of((Move.ROCK, Move.ROCK), (Move.PAPER, Move.ROCK))
+    history.set_latency(-1, 0.125)
+
+    assert math.isnan(history.latencies[0])
+    assert history[-1].latency == pytest.approx(0.125)
+    with pytest.raises(IndexError):
+        history.set_latency(2, 0.1)
+
+
+def test_columns_are_read_only():
+    history = history_of((Move.ROCK, Move.ROCK))
+
+    with pytest.raises(ValueError):
+        history.player_moves[0] = 1
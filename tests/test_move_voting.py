@@ -0,0 +1,75 @@
+from src.core.domain import Move
+from src.core.move_voting import MoveVoter, VotingRule
+
+
+def test_early_stop_commits_once_the_leader_is_ahead_by_the_margin():
+    voter = MoveVoter(window_size=5, rule=VotingRule.EARLY_STOP, early_stop_margin=1.5, timeout=10.0)
+
+    assert voter.add(Move.ROCK, 0.9, 0.0) is None
+    assert voter.add(Move.PAPER, 0.9, 0.1) is None
+    assert voter.add(Move.ROCK, 0.9, 0.2) is None
+    assert voter.add(Move.ROCK, 0.9, 0.3) == Move.ROCK
+
+
+def test_majority_needs_more_than_half_of_the_window():
+    voter = MoveVoter(window_size=5, rule=VotingRule.MAJORITY, timeout=10.0)
+
+    for t in range(2):
+        assert voter.add(Move.SCISSORS, 0.1, t) is None
+    assert voter.add(None, 0.0, 2) is None
+    assert voter.add(Move.SCISSORS, 0.1, 3) == Move.SCISSORS
+
+
+def test_confidence_weighted_sums_confidences():
+    voter = MoveVoter(window_size=4, rule=VotingRule.CONFIDENCE_WEIGHTED, timeout=10.0)
+
+    assert voter.add(Move.PAPER, 0.9, 0) is None
+    assert voter.add(Move.PAPER, 0.9, 1) is None
+    assert voter.add(Move.PAPER, 0.9, 2) == Move.PAPER
+
+
+def test_timeout_commits_the_leader():
+    voter = MoveVoter(window_size=5, timeout=1.0)
+
+    assert voter.add(Move.ROCK, 0.3, 0.0) is None
+    assert voter.add(None, 0.0, 0.5) is None
+    assert voter.add(Move.ROCK, 0.3, 1.0) == Move.ROCK
+
+
+def test_nothing_recognised_never_commits():
+    voter = MoveVoter(window_size=3, timeout=0.5)
+
+    assert voter.add(None, 0.0, 0.0) is None
+    assert voter.add(None, 0.0, 1.0) is None
+
+
+def test_reset_forgets_votes_and_restarts_the_timeout():
+    voter = MoveVoter(window_size=5, early_stop_margin=1.5, timeout=1.0)
+    voter.add(Move.ROCK, 1.0, 0.0)
+    voter.reset(5.0)
+
+    assert voter.add(Move.PAPER, 1.0, 5.5) is None
+    assert voter.add(Move.PAPER, 1.0, 5.6) == Move.PAPER
+
+
+def test_committed_stamp_is_the_first_vote_for_the_move():
+    voter = MoveVoter(window_size=5, early_stop_margin=1.5, timeout=10.0)
+
+    voter.add(Move.PAPER, 1.0, 0.0, stamp="paper")
+    voter.add(None, 0.0, 0.1, stamp="nothing")
+    voter.add(Move.ROCK, 1.0, 0.2, stamp="first rock")
+    voter.add(Move.ROCK, 1.0, 0.3, stamp="second rock")
+    assert voter.committed_stamp is None
+
+    assert voter.add(Move.ROCK, 1.0, 0.4, stamp="third rock") == Move.ROCK
+    assert voter.committed_stamp == "first rock"
+
+
+def test_leader_is_the_move_ahead_before_the_vote_is_decided():
+    voter = MoveVoter(window_size=5, early_stop_margin=3.0, timeout=10.0)
+    assert voter.leader is None
+
+    voter.add(Move.PAPER, 0.6, 0.0)
+    voter.add(Move.ROCK, 0.9, 0.1)
+
+    assert voter.leader == Move.ROCK
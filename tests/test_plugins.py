@@ -0,0 +1,40 @@
+import pytest
+
+from src.util.plugins import CLASSIFIERS, DETECTORS, FILTERS, STRATEGIES, PluginConfig, Registry
+
+
+def test_config_accepts_a_name_or_a_name_with_params():
+    assert PluginConfig.from_json(None, "vector") == PluginConfig("vector")
+    assert PluginConfig.from_json("markov", "research") == PluginConfig("markov")
+    assert PluginConfig.from_json({"params": {"decay": 0.9}}, "markov") == PluginConfig("markov", {"decay": 0.9})
+
+    config = PluginConfig("one_euro", {"beta": 0.1})
+    assert PluginConfig.from_json(config.to_json(), "none") == config
+
+
+def test_unknown_plugin_lists_the_available_ones():
+    with pytest.raises(ValueError, match="research"):
+        STRATEGIES.get("random")
+
+
+def test_config_params_override_the_registered_ones_and_call_params_override_both():
+    registry = Registry("thing", default="dict")
+    registry.register("dict", "builtins:dict", expected_cost_ms=0.0, a=1, b=1)
+
+    assert registry.create(PluginConfig("dict", {"b": 2, "c": 2}), c=3) == {"a": 1, "b": 2, "c": 3}
+
+
+@pytest.mark.parametrize("registry", (STRATEGIES, CLASSIFIERS, FILTERS, DETECTORS), ids=lambda r: r.kind)
+def test_every_registered_target_can_be_imported(registry):
+    assert registry.get(registry.default)
+    for plugin in registry:
+        assert callable(plugin.load())
+
+
+@pytest.mark.parametrize("name", [plugin.name for plugin in FILTERS])
+def test_filters_pass_the_first_frame_through(name):
+    landmarks = [(0.1 * i, 0.2, 0.3) for i in range(21)]
+
+    smoothed = FILTERS.create(PluginConfig(name)).smoothen("Right", landmarks, now=0.0)
+
+    assert smoothed == pytest.approx(landmarks)
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from src.core.domain import Move, RoundRecord, MOVE_LOSES, evaluate_round
+from src.core.match_history import MatchHistory, MOVE_INDEX
+from src.core.population_model import PopulationPrior, PopulationStore
+from src.core.strategies import NaiveStrategy
+
+
+def round_record(number, player, computer=Move.ROCK):
+    return RoundRecord(number, player, computer, evaluate_round(player, computer))
+
+
+def test_store_aggregates_openings_and_transitions(tmp_path):
+    store = PopulationStore(tmp_path / "population.sqlite", batch_size=2)
+    store.record_round(round_record(1, Move.ROCK), None)
+    store.record_round(round_record(2, Move.PAPER), Move.ROCK)
+    store.record_round(round_record(3, Move.PAPER), Move.ROCK)
+    store.record_round(round_record(1, Move.ROCK), None)
+    store.record_round(round_record(2, Move.SCISSORS), Move.ROCK)
+    store.close()
+
+    prior = PopulationStore(tmp_path / "population.sqlite").load_prior()
+
+    assert prior.opening.tolist() == [2, 0, 0]
+    assert prior.transitions[MOVE_INDEX[Move.ROCK]].tolist() == [0, 2, 1]
+    assert prior.transitions.sum() == 3
+
+
+def test_unseen_situation_has_no_distribution():
+    prior = PopulationPrior()
+
+    assert prior.player_move_distribution() is None
+
+
+def test_distribution_blends_the_population_and_the_session():
+    prior = PopulationPrior()
+    prior.transitions[MOVE_INDEX[Move.ROCK], MOVE_INDEX[Move.PAPER]] = 100
+    history = MatchHistory()
+    for number in range(1, 12):
+        history.append(round_record(number, Move.ROCK))
+
+    population_only = prior.player_move_distribution([round_record(1, Move.ROCK)], strength=10.0)
+    blended = prior.player_move_distribution(history, strength=10.0)
+
+    assert population_only.sum() == pytest.approx(1.0)
+    assert population_only.argmax() == MOVE_INDEX[Move.PAPER]
+    # ten rock -> rock transitions in this session outweigh the population
+    assert blended.argmax() == MOVE_INDEX[Move.ROCK]
+
+
+def test_first_move_counters_the_usual_opening():
+    prior = PopulationPrior()
+    prior.opening[MOVE_INDEX[Move.SCISSORS]] = 1000
+
+    strategy = NaiveStrategy(population_prior=prior, rng=0)
+    moves = [strategy.first_move() for _ in range(200)]
+
+    assert np.mean([move == MOVE_LOSES[Move.SCISSORS] for move in moves]) > 0.6
@@ -0,0 +1,70 @@
+import logging
+
+import numpy as np
+
+from src.core.game_state import GameState
+from src.core.power_manager import PowerManager, PowerState
+
+
+def manager(**kwargs):
+    return PowerManager(**{
+        "idle_timeout": 60.0, "game_over_timeout": 10.0, "probe_interval": 1.0,
+        "motion_threshold": 0.02, "warm_up_budget": 1.0, **kwargs,
+    })
+
+
+def test_suspends_after_the_timeout_of_the_state():
+    power = manager()
+    power.on_activity(0.0)
+
+    assert not power.should_suspend(GameState.IDLE, paused=False, now=59.0)
+    assert power.should_suspend(GameState.IDLE, paused=False, now=60.0)
+    assert power.should_suspend(GameState.GAME_OVER, paused=False, now=10.0)
+    assert power.should_suspend(GameState.COUNTDOWN, paused=True, now=10.0)
+
+
+def test_never_suspends_during_a_game():
+    power = manager()
+    power.on_activity(0.0)
+
+    for state in (GameState.COUNTDOWN, GameState.ROUND_ACTIVE, GameState.ROUND_RESULT):
+        assert not power.should_suspend(state, paused=False, now=1000.0)
+
+
+def test_activity_restarts_the_timeout():
+    power = manager()
+    power.on_activity(0.0)
+    power.on_activity(50.0)
+
+    assert not power.should_suspend(GameState.IDLE, paused=False, now=100.0)
+    assert power.should_suspend(GameState.IDLE, paused=False, now=110.0)
+
+
+def test_motion_compares_consecutive_probes():
+    power = manager()
+    dark = np.zeros((480, 640, 3), dtype=np.uint8)
+    lit = dark.copy()
+    lit[:, :320] = 255
+
+    assert not power.motion(dark)
+    assert not power.motion(dark.copy())
+    assert power.motion(lit)
+    # a little sensor noise is no motion
+    assert not power.motion(np.clip(lit.astype(np.int16) + 2, 0, 255).astype(np.uint8))
+
+
+def test_warm_up_is_timed_and_logged_over_budget(caplog):
+    power = manager()
+    power.on_activity(0.0)
+    power.suspend(60.0)
+    assert power.suspended
+    assert not power.should_suspend(GameState.IDLE, paused=False, now=1000.0)
+
+    power.waking(100.0)
+    with caplog.at_level(logging.WARNING, logger="src.core.power_manager"):
+        assert power.warmed_up(101.5) == 1.5
+
+    assert power.state == PowerState.ACTIVE
+    assert power.last_warm_up == 1.5
+    assert "over the" in caplog.text
+    assert not power.should_suspend(GameState.IDLE, paused=False, now=150.0)
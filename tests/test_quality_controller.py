@@ -0,0 +1,97 @@
+from src.core.quality_controller import QUALITY_LEVELS, QualityController
+
+BUDGET = 0.05
+SLOW, FAST = 0.08, 0.01
+
+
+def controller(headroom=1.0, **kwargs):
+    quality = QualityController(**{
+        "latency_budget": BUDGET, "window": 10, "settle_frames": 2, "upgrade_delay": 10.0, **kwargs,
+    })
+    quality._cpu_headroom = lambda now: headroom
+    return quality
+
+
+def feed(quality, latency, frames, now, frame_time=0.05):
+    """Records ``frames`` latencies, returns the level changes and the time after them."""
+    changes = []
+    for _ in range(frames):
+        change = quality.record(latency, now)
+        if change is not None:
+            changes.append(change)
+        now += frame_time
+    return changes, now
+
+
+def test_slow_window_steps_one_level_down():
+    quality = controller()
+
+    # the settle frames are not counted
+    changes, now = feed(quality, SLOW, 11, 0.0)
+    assert changes == []
+    changes, now = feed(quality, SLOW, 1, now)
+    assert changes == [QUALITY_LEVELS[1]]
+    assert quality.index == 1
+
+
+def test_lowest_level_is_kept():
+    quality = controller()
+
+    feed(quality, SLOW, 12 * len(QUALITY_LEVELS) * 2, 0.0)
+
+    assert quality.index == len(QUALITY_LEVELS) - 1
+
+
+def test_fast_frames_upgrade_only_after_the_delay():
+    quality = controller()
+    _, now = feed(quality, SLOW, 12, 0.0)
+    assert quality.index == 1
+
+    _, now = feed(quality, FAST, 12 * 5, now)
+    assert quality.index == 1
+    _, now = feed(quality, FAST, 12 * 20, now)
+    assert quality.index == 0
+
+
+def test_no_upgrade_without_cpu_headroom():
+    quality = controller(headroom=0.1)
+    _, now = feed(quality, SLOW, 12, 0.0)
+
+    feed(quality, FAST, 12 * 40, now)
+
+    assert quality.index == 1
+
+
+def test_upgrade_that_does_not_hold_doubles_the_delay():
+    quality = controller()
+    _, now = feed(quality, SLOW, 12, 0.0)
+    _, now = feed(quality, FAST, 12 * 20, now)
+    assert quality.index == 0
+
+    # the better level is too slow again right away
+    _, now = feed(quality, SLOW, 12, now)
+
+    assert quality.index == 1
+    assert quality.upgrade_delay == 20.0
+
+
+def test_headroom_is_the_idle_share_of_the_machine(monkeypatch):
+    quality = QualityController()
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    monkeypatch.setattr("os.getloadavg", lambda: (3.0, 0.0, 0.0), raising=False)
+    quality._start_window(0.0)
+
+    assert quality._cpu_headroom(1.0) == 0.25
+
+
+def test_headroom_without_a_load_average_is_the_share_this_process_left(monkeypatch):
+    def no_loadavg():
+        raise OSError("no load average")
+
+    quality = QualityController()
+    monkeypatch.setattr("os.getloadavg", no_loadavg, raising=False)
+    quality._start_window(0.0)
+
+    assert 0.0 <= quality._cpu_headroom(1.0) <= 1.0
+    # no time since the last mark, nothing is known to be used
+    assert quality._cpu_headroom(1.0) == 1.0
@@ -0,0 +1,77 @@
+from src.core.domain import SyncPhase
+from src.core.shake_sync import ShakeTracker
+
+TOP, BOTTOM = 0.3, 0.5
+FRAME_TIME = 0.03
+
+
+def hand(wrist_y):
+    return [(0.5, wrist_y, 0.0)] * 21
+
+
+def stroke(start, end, frames=8):
+    return [start + (end - start) * i / frames for i in range(1, frames + 1)]
+
+
+def pump(tracker, positions, t=0.0):
+    """Feeds wrist positions one frame each, returns the phases seen and the time after them."""
+    phases = []
+    for y in positions:
+        phases.append(tracker.update(hand(y), t).phase)
+        t += FRAME_TIME
+    return phases, t
+
+
+def test_waits_until_the_hand_pumps():
+    tracker = ShakeTracker(shake_cycles=3, min_amplitude=0.04, smoothing=1.0)
+
+    phases, _ = pump(tracker, [TOP] * 10)
+
+    assert set(phases) == {SyncPhase.WAITING}
+    assert tracker.status.cycles == 0
+
+
+def test_counts_a_cycle_per_stroke():
+    tracker = ShakeTracker(shake_cycles=3, min_amplitude=0.04, smoothing=1.0)
+
+    pump(tracker, [TOP] + stroke(TOP, BOTTOM) + stroke(BOTTOM, TOP))
+
+    status = tracker.status
+    assert status.phase == SyncPhase.SHAKING
+    assert status.cycles == 1
+    assert 0.0 < status.progress < 1.0
+
+
+def test_locks_at_the_bottom_of_the_shoot_not_on_the_last_pump():
+    tracker = ShakeTracker(shake_cycles=3, min_amplitude=0.04, smoothing=1.0)
+    pumps = [TOP]
+    for _ in range(3):
+        pumps += stroke(TOP, BOTTOM) + stroke(BOTTOM, TOP)
+
+    phases, t = pump(tracker, pumps)
+    # the third bottom peak is the last pump of the fist, not the shoot
+    assert SyncPhase.LOCKING not in phases
+    assert tracker.status.cycles == 3
+
+    phases, _ = pump(tracker, stroke(TOP, BOTTOM) + [BOTTOM], t)
+    assert phases[-1] == SyncPhase.LOCKING
+    assert phases.count(SyncPhase.LOCKING) == 1
+
+
+def test_ignores_jitter_below_the_amplitude():
+    tracker = ShakeTracker(shake_cycles=3, min_amplitude=0.04, smoothing=1.0)
+
+    pump(tracker, [TOP, TOP + 0.02, TOP, TOP + 0.02, TOP] * 4)
+
+    assert tracker.status.cycles == 0
+
+
+def test_starts_over_when_the_hand_stops_pumping():
+    tracker = ShakeTracker(shake_cycles=3, min_amplitude=0.04, idle_timeout=0.5, smoothing=1.0)
+    _, t = pump(tracker, [TOP] + stroke(TOP, BOTTOM) + stroke(BOTTOM, TOP))
+    assert tracker.status.cycles == 1
+
+    tracker.update(hand(TOP), t + 1.0)
+
+    assert tracker.status.phase == SyncPhase.WAITING
+    assert tracker.status.cycles == 0
@@ -0,0 +1,138 @@
+import pytest
+
+from src.core.domain import Move, Outcome, RoundRecord, MOVE_LOSES, evaluate_round
+from src.core.match_history import MatchHistory
+from src.core.strategies import IocaineStrategy, MarkovStrategy, NaiveStrategy, ResearchBasedStrategy
+from src.core.strategy_runner import StrategyRunner
+
+STRATEGIES = (NaiveStrategy, ResearchBasedStrategy, MarkovStrategy, IocaineStrategy)
+CYCLE = (Move.ROCK, Move.PAPER, Move.SCISSORS)
+
+
+def play(strategy, player_moves):
+    """Plays the player's moves against the strategy, returns the history."""
+    history = MatchHistory()
+    for number, player in enumerate(player_moves, start=1):
+        computer = strategy.select_move(history)
+        history.append(RoundRecord(number, player, computer, evaluate_round(player, computer)))
+    return history
+
+
+@pytest.mark.parametrize("strategy_type", STRATEGIES)
+def test_plays_a_move_from_the_first_round(strategy_type):
+    strategy = strategy_type(rng=0)
+
+    assert strategy.select_move(MatchHistory()) in Move
+    assert all(r.computer_move in Move for r in play(strategy, CYCLE * 5))
+
+
+@pytest.mark.parametrize("strategy_type", STRATEGIES)
+def test_fixed_seed_is_repeatable(strategy_type):
+    first = play(strategy_type(rng=7), CYCLE * 10)
+    second = play(strategy_type(rng=7), CYCLE * 10)
+
+    assert [r.computer_move for r in first] == [r.computer_move for r in second]
+
+
+def test_research_beats_a_repeated_move():
+    history = play(ResearchBasedStrategy(rng=0), [Move.ROCK] * 3)
+
+    assert ResearchBasedStrategy(rng=0).select_move(history) == MOVE_LOSES[Move.ROCK]
+
+
+@pytest.mark.parametrize("strategy_type", (MarkovStrategy, IocaineStrategy))
+def test_learns_a_cycling_player(strategy_type):
+    history = play(strategy_type(rng=0), CYCLE * 30)
+
+    late_outcomes = [r.outcome for r in history[-30:]]
+    assert late_outcomes.count(Outcome.COMPUTER) >= 25
+
+
+def test_markov_predicts_the_next_move_of_a_cycle():
+    strategy = MarkovStrategy(rng=0)
+    history = play(strategy, CYCLE * 10)
+    strategy.select_move(history)
+
+    assert strategy.predict_player_move() == CYCLE[len(history) % 3]
+
+
+def test_markov_keeps_at_most_max_contexts():
+    strategy = MarkovStrategy(max_contexts=8, rng=0)
+    play(strategy, CYCLE * 20 + (Move.ROCK,) * 10)
+
+    assert len(strategy._contexts) == 8
+
+
+def test_new_game_starts_from_scratch():
+    strategy = MarkovStrategy(rng=0)
+    strategy.select_move(play(strategy, [Move.ROCK] * 20))
+    strategy.select_move(MatchHistory())
+
+    assert strategy.predict_player_move() is None
+
+
+class CountingStrategy:
+    def __init__(self):
+        self.calls = []
+
+    def select_move(self, match_history):
+        self.calls.append(len(match_history))
+        return CYCLE[len(match_history) % 3]
+
+
+def test_runner_hands_back_the_prepared_move():
+    strategy = CountingStrategy()
+    runner = StrategyRunner(strategy)
+    history = play(MarkovStrategy(rng=0), CYCLE)
+    try:
+        runner.prepare(history)
+        move = runner.select_move(history)
+    finally:
+        runner.close()
+
+    assert move == CYCLE[0]
+    assert strategy.calls == [3]
+
+
+def test_runner_recomputes_a_move_prepared_for_another_history():
+    strategy = CountingStrategy()
+    runner = StrategyRunner(strategy)
+    history = play(MarkovStrategy(rng=0), CYCLE)
+    try:
+        runner.prepare(history[:2])
+        move = runner.select_move(history)
+    finally:
+        runner.close()
+
+    assert move == CYCLE[0]
+    assert strategy.calls == [2, 3]
+
+
+@pytest.mark.parametrize("background", (False, True))
+def test_runner_keeps_the_strategys_prediction(background):
+    runner = StrategyRunner(MarkovStrategy(rng=0), background=background)
+    history = play(MarkovStrategy(rng=0), CYCLE * 10)
+    try:
+        runner.prepare(history)
+        move = runner.select_move(history)
+    finally:
+        runner.close()
+
+    assert runner.predicted_player_move == CYCLE[len(history) % 3]
+    assert move == MOVE_LOSES[runner.predicted_player_move]
+
+
+def test_runner_has_no_prediction_for_strategies_without_one():
+    runner = StrategyRunner(ResearchBasedStrategy(rng=0), background=False)
+    runner.select_move(play(ResearchBasedStrategy(rng=0), CYCLE))
+
+    assert runner.predicted_player_move is None
+
+
+def test_iocaine_predicts_the_move_its_choice_beats():
+    strategy = IocaineStrategy(rng=0)
+    history = play(strategy, CYCLE * 20)
+    move = strategy.select_move(history)
+
+    assert strategy.predict_player_move() == CYCLE[len(history) % 3]
+    assert move == MOVE_LOSES[strategy.predict_player_move()]
@@ -0,0 +1,65 @@
+import numpy as np
+
+from src.core.domain import Move
+from src.core.strategies import ResearchBasedStrategy
+from src.sim.players import BeatLastBot, CyclerBot, ResearchBasedPlayer, StrategyPlayer, beating
+from src.sim.tournament import play_match, play_vectorized
+
+
+def test_cycler_steps_through_the_moves():
+    bot = CyclerBot()
+    bot.reset(4, np.random.default_rng(0))
+    first = bot.select()
+    bot.observe(first, np.zeros(4, dtype=np.intp))
+
+    assert bot.select().tolist() == ((first + 1) % 3).tolist()
+
+
+def test_beat_last_draws_every_round_against_a_cycler():
+    wins, losses = play_vectorized(CyclerBot(), BeatLastBot(), 100, 20, np.random.default_rng(0))
+
+    # only the first, random round can be decided
+    assert (wins + losses).max() <= 1
+
+
+def test_research_player_beats_a_repeated_move_in_every_game():
+    player = ResearchBasedPlayer()
+    player.reset(50, np.random.default_rng(0))
+    opponent = np.full(50, 2, dtype=np.intp)
+    for _ in range(3):
+        player.observe(player.select(), opponent)
+
+    assert (player.select() == beating(opponent)).all()
+
+
+def test_strategy_player_sees_the_opponent_as_the_player():
+    player = StrategyPlayer(ResearchBasedStrategy)
+    for _ in range(3):
+        player.observe(player.select(), 0)
+
+    assert [r.player_move for r in player._history] == [Move.ROCK] * 3
+    assert player.select() == 1
+
+
+def test_markov_beats_a_cycler_game_by_game():
+    result = play_match("markov", "cycler", 10, 100, np.random.SeedSequence(0), chunk_size=4)
+
+    assert result.wins.shape == (10,)
+    assert result.wins.mean() > 2 * result.losses.mean()
+    assert "markov" in str(result)
+
+
+def test_game_by_game_match_is_seeded():
+    first = play_match("iocaine", "wsls", 4, 30, np.random.SeedSequence(2), chunk_size=2)
+    second = play_match("iocaine", "wsls", 4, 30, np.random.SeedSequence(2), chunk_size=2)
+
+    np.testing.assert_array_equal(first.wins, second.wins)
+    np.testing.assert_array_equal(first.losses, second.losses)
+
+
+def test_vectorized_match_is_seeded():
+    first = play_match("research", "biased", 200, 50, np.random.SeedSequence(1))
+    second = play_match("research", "biased", 200, 50, np.random.SeedSequence(1))
+
+    np.testing.assert_array_equal(first.wins, second.wins)
+    np.testing.assert_array_equal(first.losses, second.losses)